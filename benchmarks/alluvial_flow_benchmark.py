@@ -0,0 +1,75 @@
+# Benchmark: adjacent-step flow totals for the alluvial chart
+# Author: 24f2000604@ds.study.iitm.ac.in
+#
+# Builds a synthetic journey table with categorical step columns and compares
+# one groupby per adjacent pair of steps (the old approach) with
+# chart/generate_chart.py's aggregate_flows, a single weighted bincount over
+# combined categorical-code keys. The totals are checked to agree.
+#
+# Usage:
+#   python benchmarks/alluvial_flow_benchmark.py --rows 10000000 --steps 8
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'chart'))
+from generate_chart import aggregate_flows  # noqa: E402
+
+
+def best_of(fn, repeat):
+    times, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def journeys(n_rows, n_steps, nodes, seed=0):
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(n_steps):
+        labels = [f'S{i}_{j}' for j in range(nodes)]
+        data[f'S{i}'] = pd.Categorical.from_codes(rng.integers(0, nodes, n_rows), labels)
+    data['Count'] = rng.integers(1, 100, n_rows)
+    return pd.DataFrame(data)
+
+
+def groupby_flows(df, steps):
+    return [df.groupby([a, b], observed=True)['Count'].sum() for a, b in zip(steps, steps[1:])]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Alluvial flow aggregation benchmark')
+    parser.add_argument('--rows', type=int, default=5_000_000)
+    parser.add_argument('--steps', type=int, default=8)
+    parser.add_argument('--nodes', type=int, default=12, help='nodes per step')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    df = journeys(args.rows, args.steps, args.nodes)
+    steps = [f'S{i}' for i in range(args.steps)]
+
+    print("=" * 60)
+    print(f"Alluvial flows: {args.rows:,} rows, {args.steps} steps, {args.nodes} nodes per step")
+    print("=" * 60)
+    t_groupby, expected = best_of(lambda: groupby_flows(df, steps), args.repeat)
+    t_bincount, flows = best_of(lambda: aggregate_flows(df, steps), args.repeat)
+
+    for i, totals in enumerate(expected):
+        matrix = flows.flows[i]
+        rows = [list(flows.labels[i]).index(a) for a, _ in totals.index]
+        cols = [list(flows.labels[i + 1]).index(b) for _, b in totals.index]
+        assert np.allclose(matrix[rows, cols], totals.to_numpy()), f"pair {i} differs"
+
+    print(f"groupby per pair   {t_groupby:>8.3f} s")
+    print(f"one-pass bincount  {t_bincount:>8.3f} s  ({t_groupby / t_bincount:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Benchmark: loading vs streaming a raw journey event log into alluvial flows
+# Author: 24f2000604@ds.study.iitm.ac.in
+#
+# Writes a CSV of individual events (one row per journey, string step values,
+# no Count column) and reduces it to adjacent-step flow totals twice, each in
+# a fresh process so peak memory is comparable:
+#   load    read the whole file, then aggregate_flows
+#   stream  FlowAccumulator over categorical chunks (generate_chart.py --chunksize)
+#
+# Usage:
+#   python benchmarks/alluvial_stream_benchmark.py --rows 5000000 --chunksize 500000
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'chart'))
+from generate_chart import aggregate_flows, iter_flow_chunks, stream_flows  # noqa: E402
+
+STEPS = ['Source', 'Landing', 'Product', 'Cart', 'Checkout', 'Outcome']
+
+
+def write_events(path, n_rows, chunksize=1_000_000, seed=0):
+    rng = np.random.default_rng(seed)
+    names = {step: np.array([f'{step}_{j}' for j in range(4 + 2 * i)]) for i, step in enumerate(STEPS)}
+    for start in range(0, n_rows, chunksize):
+        n = min(chunksize, n_rows - start)
+        chunk = pd.DataFrame({step: labels[rng.integers(0, len(labels), n)] for step, labels in names.items()})
+        chunk.to_csv(path, mode='a' if start else 'w', header=start == 0, index=False)
+
+
+def child(mode, path, chunksize):
+    start = time.perf_counter()
+    if mode == 'load':
+        flows = aggregate_flows(pd.read_csv(path), STEPS, None)
+    else:
+        flows, _ = stream_flows(iter_flow_chunks(path, STEPS, None, chunksize), STEPS, None)
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    total = float(flows.flows[0].sum())
+    print(json.dumps({'seconds': elapsed, 'peak_mb': peak_mb, 'total': total}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Alluvial event streaming benchmark')
+    parser.add_argument('--rows', type=int, default=5_000_000)
+    parser.add_argument('--chunksize', type=int, default=500_000)
+    parser.add_argument('--child', nargs=2, metavar=('MODE', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child[0], args.child[1], args.chunksize)
+        return
+
+    print("=" * 60)
+    print(f"Alluvial flows from {args.rows:,} raw events ({len(STEPS)} steps)")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as scratch:
+        path = os.path.join(scratch, 'events.csv')
+        write_events(path, args.rows)
+        print(f"event log: {os.path.getsize(path) / 2**20:.0f} MB CSV")
+        for mode in ('load', 'stream'):
+            out = subprocess.run([sys.executable, __file__, '--child', mode, path,
+                                  '--chunksize', str(args.chunksize)],
+                                 check=True, capture_output=True, text=True).stdout
+            result = json.loads(out)
+            print(f"{mode:<7} {result['seconds']:>7.2f} s  peak {result['peak_mb']:>7.0f} MB  "
+                  f"flows {result['total']:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
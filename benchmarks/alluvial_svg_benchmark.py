@@ -0,0 +1,100 @@
+# Benchmark: interactive SVG/HTML alluvial output vs the 512x512 PNG
+# Author: 24f2000604@ds.study.iitm.ac.in
+#
+# Computes the chart geometry once per data set, then times writing it as a
+# PNG (matplotlib draw + exact-size save), as SVG and as HTML, and reports the
+# file sizes. The last column shows how large the SVG would be with
+# unquantized (6-decimal) path coordinates.
+#
+# Usage:
+#   python benchmarks/alluvial_svg_benchmark.py --nodes 12 40 --steps 6
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+CHART_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'chart')
+sys.path.insert(0, CHART_DIR)
+from generate_chart import (AUTHOR, CHART_TITLE, aggregate_flows, chart_geometry,  # noqa: E402
+                            draw_chart, node_colors, path_data, save_exact, svg_document, write_vector)
+
+
+def write_png(path, geometry):
+    fig, ax = plt.subplots(figsize=(8, 8))
+    draw_chart(ax, geometry)
+    for x, step in zip(geometry.xs, geometry.flows.steps):
+        ax.text(x, 0.98, step, ha='center', va='bottom', fontsize=12, fontweight='bold')
+    ax.set_title(CHART_TITLE, fontsize=14, fontweight='bold', pad=10)
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.axis('off')
+    plt.tight_layout()
+    save_exact(fig, path)
+    plt.close(fig)
+
+
+def unquantized_size(geometry):
+    """SVG size if the path coordinates kept 6 decimals."""
+    quantized = sum(len(d) for layer in geometry.layers for d in path_data(layer.verts))
+    exact = 0
+    for layer in geometry.layers:
+        points = layer.verts if layer.verts.shape[1] == 4 else layer.verts[:, :8]
+        exact += sum(len(' '.join(f'{v:.6f}' for v in row)) + 4 for row in points.reshape(len(points), -1))
+    return len(svg_document(geometry, CHART_TITLE, AUTHOR).encode()) - quantized + exact
+
+
+def synthetic(n_nodes, n_steps, n_rows=200_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({f'S{i}': rng.integers(0, n_nodes, n_rows).astype(str) for i in range(n_steps)})
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Alluvial SVG/HTML output benchmark')
+    parser.add_argument('--nodes', type=int, nargs='+', default=[12, 40])
+    parser.add_argument('--steps', type=int, default=6)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    cases = [('sample lines', aggregate_flows(pd.read_csv(os.path.join(CHART_DIR, 'data.csv')),
+                                              ['Channel', 'Stage', 'Outcome']), 'lines')]
+    for n in args.nodes:
+        steps = [f'S{i}' for i in range(args.steps)]
+        cases.append((f'{n}x{args.steps} ribbons', aggregate_flows(synthetic(n, args.steps), steps, None), 'ribbons'))
+
+    print("=" * 78)
+    print("Alluvial output: PNG vs SVG vs HTML (geometry computed once)")
+    print("=" * 78)
+    print(f"{'case':<16} {'flows':>6} {'png ms':>8} {'svg ms':>8} {'html ms':>8} "
+          f"{'png KB':>7} {'svg KB':>7} {'html KB':>8} {'raw svg KB':>11}")
+    with tempfile.TemporaryDirectory() as scratch:
+        for name, flows, style in cases:
+            geometry = chart_geometry(flows, node_colors(flows), style)
+            n_flows = sum(len(layer.totals) for layer in geometry.layers)
+            paths = {ext: os.path.join(scratch, 'chart' + ext) for ext in ('.png', '.svg', '.html')}
+            t_png = best_of(lambda: write_png(paths['.png'], geometry), args.repeat)
+            t_svg = best_of(lambda: write_vector(paths['.svg'], geometry, CHART_TITLE, AUTHOR), args.repeat)
+            t_html = best_of(lambda: write_vector(paths['.html'], geometry, CHART_TITLE, AUTHOR), args.repeat)
+            sizes = [os.path.getsize(paths[ext]) / 1024 for ext in ('.png', '.svg', '.html')]
+            print(f"{name:<16} {n_flows:>6} {t_png * 1000:>8.1f} {t_svg * 1000:>8.1f} {t_html * 1000:>8.1f} "
+                  f"{sizes[0]:>7.1f} {sizes[1]:>7.1f} {sizes[2]:>8.1f} {unquantized_size(geometry) / 1024:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# Benchmark: alluvial chart flow drawing and exact-size PNG output
+# Author: 24f2000604@ds.study.iitm.ac.in
+#
+# 1. Draws N random flows as one PathPatch per flow (the old iterrows loop)
+#    and as one PathCollection built by chart/generate_chart.py, timing
+#    artist construction plus a full canvas draw.
+# 2. Saves the same figure as a 512x512 PNG with the old savefig + `magick
+#    -resize 512x512!` round trip and with the in-process 'stretch' and 'fit'
+#    modes. Without ImageMagick on PATH the round trip is emulated: the PNG is
+#    written, read back, resampled and written again with Pillow, plus the
+#    cost of spawning one child process, a lower bound for the real thing.
+#
+# Usage:
+#   python benchmarks/chart_render_benchmark.py --flows 24 1000 10000
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'chart'))
+from generate_chart import (FLOW_CODES, OUTPUT_SIZE, SAVE_DPI, flow_collection, flow_paths, flow_rgba,  # noqa: E402
+                            save_exact)
+
+PALETTE = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12']
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def random_flows(n, seed=0):
+    rng = np.random.default_rng(seed)
+    verts = flow_paths(rng.uniform(0.1, 0.9, n), rng.uniform(0.1, 0.9, n), 0.15, 0.45, 0.3)
+    colors = [PALETTE[i] for i in rng.integers(0, len(PALETTE), n)]
+    counts = rng.integers(1, 200, n)
+    return verts, colors, counts
+
+
+def new_figure():
+    fig = Figure(figsize=(8, 8))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.axis('off')
+    return fig, ax
+
+
+def draw_patches(verts, colors, counts):
+    fig, ax = new_figure()
+    for v, color, count in zip(verts, colors, counts):
+        ax.add_patch(PathPatch(Path(v, FLOW_CODES), facecolor='none', edgecolor=color,
+                               alpha=min(count / 100, 0.8), lw=count / 50))
+    fig.canvas.draw()
+
+
+def layer_collection(verts, colors, counts):
+    return flow_collection(verts, flow_rgba(colors, counts), counts / 50)
+
+
+def draw_collection(verts, colors, counts):
+    fig, ax = new_figure()
+    ax.add_collection(layer_collection(verts, colors, counts), autolim=False)
+    fig.canvas.draw()
+
+
+def legacy_save(fig, path):
+    fig.savefig(path, dpi=SAVE_DPI, bbox_inches='tight', facecolor='white', edgecolor='none')
+    if shutil.which('magick'):
+        subprocess.run(['magick', path, '-resize', f'{OUTPUT_SIZE}x{OUTPUT_SIZE}!', path], check=True)
+        return
+    subprocess.run([sys.executable, '-c', 'pass'], check=True)
+    with Image.open(path) as image:
+        image.load()
+    image.resize((OUTPUT_SIZE, OUTPUT_SIZE), Image.LANCZOS).save(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Alluvial chart rendering benchmark')
+    parser.add_argument('--flows', type=int, nargs='+', default=[24, 1_000, 10_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Flow drawing: PathPatch per flow vs one PathCollection")
+    print("=" * 60)
+    print(f"{'flows':>8} {'patches (s)':>12} {'collection (s)':>15} {'speedup':>8}")
+    for n in args.flows:
+        flows = random_flows(n)
+        t_patch = best_of(lambda: draw_patches(*flows), args.repeat)
+        t_coll = best_of(lambda: draw_collection(*flows), args.repeat)
+        print(f"{n:>8,} {t_patch:>12.3f} {t_coll:>15.3f} {t_patch / t_coll:>7.1f}x")
+
+    print()
+    print("=" * 60)
+    print(f"Exact {OUTPUT_SIZE}x{OUTPUT_SIZE} PNG output"
+          + ("" if shutil.which('magick') else " (magick not found: round trip emulated)"))
+    print("=" * 60)
+    fig, ax = new_figure()
+    ax.add_collection(layer_collection(*random_flows(24)), autolim=False)
+    ax.set_title('Customer Journey Flow\nAlluvial Diagram', fontsize=14, fontweight='bold')
+    with tempfile.TemporaryDirectory() as scratch:
+        path = os.path.join(scratch, 'chart.png')
+        for label, save in [('savefig + magick', lambda: legacy_save(fig, path)),
+                            ('stretch', lambda: save_exact(fig, path, mode='stretch')),
+                            ('fit', lambda: save_exact(fig, path, mode='fit'))]:
+            elapsed = best_of(save, args.repeat)
+            with Image.open(path) as image:
+                size = image.size
+            print(f"{label:<18} {elapsed * 1000:>8.1f} ms  {size[0]}x{size[1]}")
+
+
+if __name__ == "__main__":
+    main()
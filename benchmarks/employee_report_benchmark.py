@@ -0,0 +1,76 @@
+# Benchmark: serial vs process-pool batch employee reports
+# Author: 24f2000604@ds.study.iitm.ac.in
+#
+# Writes --units synthetic business-unit rosters to a scratch directory, runs
+# employee_analysis.generate_reports with 1 job and with --jobs jobs, checks
+# that both produce identical HTML and reports the speedup.
+#
+# Usage:
+#   python benchmarks/employee_report_benchmark.py --units 200 --jobs 8
+
+import argparse
+import filecmp
+import os
+import sys
+import tempfile
+import time
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from employee_analysis import generate_reports  # noqa: E402
+
+DEPARTMENTS = ['Marketing', 'Sales', 'IT', 'HR', 'Finance', 'Operations']
+REGIONS = ['Africa', 'Asia', 'Europe', 'Latin America', 'North America']
+
+
+def write_units(directory, units, rows, seed=0):
+    rng = np.random.default_rng(seed)
+    paths = []
+    for unit in range(units):
+        path = os.path.join(directory, f'unit_{unit:04d}.csv')
+        pd.DataFrame({
+            'employee_id': [f'EMP{i:06d}' for i in range(rows)],
+            'department': rng.choice(DEPARTMENTS, rows),
+            'region': rng.choice(REGIONS, rows),
+            'performance_score': rng.normal(78, 5, rows).round(2),
+            'years_experience': rng.integers(1, 20, rows),
+            'satisfaction_rating': rng.uniform(3, 5, rows).round(1),
+        }).to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Batch employee report benchmark')
+    parser.add_argument('--units', type=int, default=24)
+    parser.add_argument('--rows', type=int, default=2_000)
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"Batch Report Benchmark ({args.units} units, {os.cpu_count()} CPUs)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        paths = write_units(scratch, args.units, args.rows)
+        timings = {}
+        for jobs in sorted({1, args.jobs}):
+            start = time.perf_counter()
+            generate_reports(paths, os.path.join(scratch, f'jobs{jobs}'), jobs=jobs)
+            timings[jobs] = time.perf_counter() - start
+            print(f"{jobs:>3} job(s): {timings[jobs]:>7.2f} s ({timings[jobs] / args.units * 1000:.0f} ms/unit)")
+
+        if args.jobs != 1:
+            match = filecmp.dircmp(os.path.join(scratch, 'jobs1'), os.path.join(scratch, f'jobs{args.jobs}'))
+            identical = not (match.diff_files or match.left_only or match.right_only)
+            print(f"speedup: {timings[1] / timings[args.jobs]:.2f}x, identical output: {identical}")
+
+
+if __name__ == "__main__":
+    main()
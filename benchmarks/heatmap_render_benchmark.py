@@ -0,0 +1,61 @@
+# Benchmark: pyplot vs headless Agg heatmap rendering
+# Author: 24f2000604@ds.study.iitm.ac.in
+#
+# Renders heatmap.png (80 dpi) and heatmap_hd.png (150 dpi) for correlation
+# matrices of several sizes with both correlation_analysis.render_heatmap
+# modes, into a scratch directory, and reports the best wall time and the
+# per-stage breakdown of the last Agg run.
+#
+# Usage:
+#   python benchmarks/heatmap_render_benchmark.py --columns 5 20 50
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from correlation_analysis import (HEATMAP_OUTPUTS, RENDER_MODES, StageTimer, generate_dataset,  # noqa: E402
+                                  render_heatmap)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Heatmap render benchmark')
+    parser.add_argument('--columns', type=int, nargs='+', default=[5, 20, 50])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Heatmap Render Benchmark")
+    print("=" * 60)
+    print(f"{'columns':>8} {'pyplot (s)':>11} {'agg (s)':>9} {'speedup':>8}")
+
+    base = generate_dataset(500)
+    with tempfile.TemporaryDirectory() as scratch:
+        outputs = [(os.path.join(scratch, path), dpi) for path, dpi in HEATMAP_OUTPUTS]
+        for columns in args.columns:
+            # Tile the supply chain columns out to the requested width
+            df = base.iloc[:, [i % base.shape[1] for i in range(columns)]]
+            df.columns = [f'{name}_{i}' for i, name in enumerate(df.columns)]
+            matrix = df.corr()
+            best = {}
+            for mode in RENDER_MODES:
+                times = []
+                for _ in range(args.repeat):
+                    timer = StageTimer()
+                    start = time.perf_counter()
+                    render_heatmap(matrix, outputs, mode, timer)
+                    times.append(time.perf_counter() - start)
+                best[mode] = min(times)
+            print(f"{columns:>8} {best['pyplot']:>11.3f} {best['agg']:>9.3f} {best['pyplot'] / best['agg']:>7.2f}x")
+        print("\nLast Agg run by stage:")
+        print(timer.report())
+
+
+if __name__ == "__main__":
+    main()
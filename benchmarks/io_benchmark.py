@@ -0,0 +1,60 @@
+# Benchmark: CSV vs Parquet vs Arrow IPC for the supply chain dataset
+# Author: 24f2000604@ds.study.iitm.ac.in
+#
+# Writes the same synthetic transactions in every format supported by
+# data_io, then reports file size, full load time and the load time of a
+# two-column projection.
+#
+# Usage:
+#   python benchmarks/io_benchmark.py --rows 5000000
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from correlation_analysis import write_supply_chain  # noqa: E402
+from data_io import have_pyarrow, read_table  # noqa: E402
+
+PROJECTION = ['Supplier_Lead_Time', 'Delivery_Performance']
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Table I/O benchmark')
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--chunksize', type=int, default=500_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    extensions = ['.csv'] + (['.parquet', '.arrow'] if have_pyarrow() else [])
+
+    print("=" * 60)
+    print(f"Table I/O Benchmark ({args.rows:,} rows)")
+    print("=" * 60)
+    print(f"{'format':<9} {'size (MB)':>10} {'write (s)':>10} {'load (s)':>9} {'2 cols (s)':>11}")
+
+    with tempfile.TemporaryDirectory() as scratch:
+        for extension in extensions:
+            path = os.path.join(scratch, 'supply_chain' + extension)
+            start = time.perf_counter()
+            write_supply_chain(path, args.rows, args.chunksize)
+            t_write = time.perf_counter() - start
+            size = os.path.getsize(path) / 2**20
+            t_load = best_of(lambda: read_table(path), args.repeat)
+            t_proj = best_of(lambda: read_table(path, columns=PROJECTION), args.repeat)
+            print(f"{extension[1:]:<9} {size:>10.1f} {t_write:>10.2f} {t_load:>9.3f} {t_proj:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Benchmark: Rank Correlation Kernels vs pandas
+# Author: 24f2000604@ds.study.iitm.ac.in
+#
+# Compares correlation_analysis.spearman_correlation / kendall_correlation with
+# df.corr(method='spearman' | 'kendall') on synthetic supply chain data, both
+# complete and with a fraction of values blanked out (both then rank the
+# complete rows of every pair). kendall_correlation uses scipy's kendalltau when
+# scipy is installed; the 'kendall-np' rows time the NumPy merge-sort fallback.
+# pandas' Kendall path needs scipy; it is skipped when scipy is missing.
+#
+# Usage:
+#   python benchmarks/rank_correlation_benchmark.py --rows 20000 50000
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import correlation_analysis  # noqa: E402
+from correlation_analysis import generate_dataset, kendall_correlation, spearman_correlation  # noqa: E402
+
+
+def best_of(fn, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def kendall_numpy(df):
+    """kendall_correlation with the scipy fast path switched off."""
+    use_scipy = correlation_analysis._scipy_kendalltau
+    correlation_analysis._scipy_kendalltau = lambda: None
+    try:
+        return kendall_correlation(df)
+    finally:
+        correlation_analysis._scipy_kendalltau = use_scipy
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rank correlation benchmark')
+    parser.add_argument('--rows', type=int, nargs='+', default=[5_000, 20_000, 50_000])
+    parser.add_argument('--missing', type=float, default=0.02,
+                        help='fraction of values set to NaN in the second pass')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    try:
+        import scipy  # noqa: F401  (pandas' Kendall implementation)
+        have_scipy = True
+    except ImportError:
+        have_scipy = False
+
+    print("=" * 60)
+    print("Rank Correlation Benchmark")
+    print("=" * 60)
+    print(f"{'rows':>8} {'NaN':>5}  {'method':<10} {'pandas (s)':>11} {'ours (s)':>9} "
+          f"{'speedup':>8} {'max |diff|':>11}")
+
+    rng = np.random.default_rng(0)
+    for rows, missing in [(rows, missing) for rows in args.rows for missing in (0.0, args.missing)]:
+        df = generate_dataset(rows).astype(np.float64)
+        df = df.mask(rng.random(df.shape) < missing)
+        cases = [('spearman', 'spearman', spearman_correlation),
+                 ('kendall', 'kendall', kendall_correlation),
+                 ('kendall-np', 'kendall', kendall_numpy)]
+        for label, method, ours in cases:
+            if label == 'kendall' and not have_scipy:
+                continue
+            t_ours, r_ours = best_of(lambda: ours(df), args.repeat)
+            if method == 'kendall' and not have_scipy:
+                print(f"{rows:>8} {missing:>5.0%}  {label:<10} {'n/a':>11} {t_ours:>9.4f} {'':>8} {'':>11}")
+                continue
+            t_pd, r_pd = best_of(lambda: df.corr(method=method), args.repeat)
+            diff = np.nanmax(np.abs(r_ours.to_numpy() - r_pd.to_numpy()))
+            print(f"{rows:>8} {missing:>5.0%}  {label:<10} {t_pd:>11.4f} {t_ours:>9.4f} "
+                  f"{t_pd / t_ours:>7.1f}x {diff:>11.2e}")
+
+
+if __name__ == "__main__":
+    main()
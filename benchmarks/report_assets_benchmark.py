@@ -0,0 +1,63 @@
+# Benchmark: page weight of the employee report per asset mode and encoding
+# Author: 24f2000604@ds.study.iitm.ac.in
+#
+# Writes the built-in sample report once per configuration into a scratch
+# directory and reports the HTML size (what the browser must receive before
+# the first paint; lazy images load afterwards), the linked image bytes, the
+# total page weight and the chart encoding time. Time-to-first-paint itself
+# needs a browser (e.g. Lighthouse) pointed at the written pages.
+#
+# Usage:
+#   python benchmarks/report_assets_benchmark.py
+
+import os
+import sys
+import tempfile
+import time
+from io import StringIO
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+import pandas as pd  # noqa: E402
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from employee_analysis import (AssetOptions, csv_data, page_weight, render_charts,  # noqa: E402
+                               summarize_employees, write_report)
+
+CONFIGS = [
+    ('inline png (current)', AssetOptions()),
+    ('inline optimized-png', AssetOptions('inline', 'optimized-png')),
+    ('inline png + svg bars', AssetOptions('inline', 'png', True)),
+    ('external png', AssetOptions('external')),
+    ('external optimized-png', AssetOptions('external', 'optimized-png')),
+    ('external webp', AssetOptions('external', 'webp')),
+    ('external webp + svg bars', AssetOptions('external', 'webp', True)),
+]
+
+
+def main():
+    df = pd.read_csv(StringIO(csv_data))
+    summary = summarize_employees(df)
+    department_counts = summary.departments['count']
+
+    print("=" * 60)
+    print("Report Asset Benchmark (built-in 100-employee sample)")
+    print("=" * 60)
+    print(f"{'configuration':<26} {'HTML (KB)':>10} {'images (KB)':>12} {'total (KB)':>11} {'charts (s)':>11}")
+
+    with tempfile.TemporaryDirectory() as scratch:
+        for i, (name, assets) in enumerate(CONFIGS):
+            start = time.perf_counter()
+            charts = render_charts(department_counts, df, assets=assets)
+            elapsed = time.perf_counter() - start
+            os.makedirs(os.path.join(scratch, str(i)))
+            html_path = write_report(os.path.join(scratch, str(i), 'report.html'), summary, charts, assets=assets)
+            html_bytes, image_bytes = page_weight(html_path)
+            print(f"{name:<26} {html_bytes / 1024:>10.1f} {image_bytes / 1024:>12.1f} "
+                  f"{(html_bytes + image_bytes) / 1024:>11.1f} {elapsed:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Benchmark: nightly batch reports with the content-hash report cache
+# Author: 24f2000604@ds.study.iitm.ac.in
+#
+# Writes --units synthetic rosters, then times a cold batch run (empty cache),
+# a rerun with no changes, and a rerun after --churn of the units changed.
+# The churned run's pages are checked against an uncached run.
+#
+# Usage:
+#   python benchmarks/report_cache_benchmark.py --units 200 --churn 0.05
+
+import argparse
+import filecmp
+import math
+import os
+import sys
+import tempfile
+import time
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from employee_analysis import ReportCache, generate_reports  # noqa: E402
+from employee_report_benchmark import write_units  # noqa: E402
+
+
+def timed_run(paths, output_dir, cache_dir):
+    cache = ReportCache(cache_dir) if cache_dir else None
+    start = time.perf_counter()
+    generate_reports(paths, output_dir, cache=cache)
+    elapsed = time.perf_counter() - start
+    rendered = cache.misses if cache else len(paths)
+    return elapsed, rendered
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report cache benchmark')
+    parser.add_argument('--units', type=int, default=40)
+    parser.add_argument('--rows', type=int, default=2_000)
+    parser.add_argument('--churn', type=float, default=0.05)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"Report Cache Benchmark ({args.units} units, {args.churn:.0%} churn)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        data_dir = os.path.join(scratch, 'data')
+        cache_dir = os.path.join(scratch, 'cache')
+        os.makedirs(data_dir)
+        paths = write_units(data_dir, args.units, args.rows)
+
+        cold, _ = timed_run(paths, os.path.join(scratch, 'cold'), cache_dir)
+        print(f"{'cold run':<22} {cold:>8.2f} s")
+        warm, rendered = timed_run(paths, os.path.join(scratch, 'warm'), cache_dir)
+        print(f"{'unchanged rerun':<22} {warm:>8.2f} s  ({rendered} rendered, {warm / cold:.1%} of cold)")
+
+        # Rewrite the churned units with different data
+        changed = math.ceil(args.units * args.churn)
+        os.makedirs(os.path.join(scratch, 'changed'))
+        churned = write_units(os.path.join(scratch, 'changed'), changed, args.rows, seed=1)
+        for source, target in zip(churned, paths):
+            os.replace(source, target)
+        churn, rendered = timed_run(paths, os.path.join(scratch, 'churn'), cache_dir)
+        print(f"{'rerun after churn':<22} {churn:>8.2f} s  ({rendered} rendered, {churn / cold:.1%} of cold)")
+
+        timed_run(paths, os.path.join(scratch, 'uncached'), None)
+        match = filecmp.dircmp(os.path.join(scratch, 'churn'), os.path.join(scratch, 'uncached'))
+        print(f"identical to an uncached run: {not (match.diff_files or match.left_only or match.right_only)}")
+
+
+if __name__ == "__main__":
+    main()
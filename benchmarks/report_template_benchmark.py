@@ -0,0 +1,68 @@
+# Benchmark: per-report cost of the compiled employee report template
+# Author: 24f2000604@ds.study.iitm.ac.in
+#
+# Renders the built-in sample report N times (charts rendered once up front,
+# linked as external assets) and reports the cost per report of rendering to
+# a string, streaming into an io.StringIO and streaming into N files.
+#
+# Usage:
+#   python benchmarks/report_template_benchmark.py --reports 5000
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from io import StringIO
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from employee_analysis import (csv_data, compile_template, render_report,  # noqa: E402
+                               stream_report, summarize_employees)
+
+DEPARTMENT_MARKUP = ('<img src="assets/departments-0123456789ab.png" alt="Department Distribution Histogram" '
+                     'width="1784" height="883" loading="lazy" decoding="async">')
+PERFORMANCE_MARKUP = ('<img src="assets/performance-0123456789ab.png" alt="Performance by Department" '
+                      'width="1783" height="883" loading="lazy" decoding="async">')
+
+
+def per_report_us(fn, reports):
+    start = time.perf_counter()
+    for i in range(reports):
+        fn(i)
+    return (time.perf_counter() - start) / reports * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report template benchmark')
+    parser.add_argument('--reports', type=int, default=2_000)
+    args = parser.parse_args()
+
+    summary = summarize_employees(pd.read_csv(StringIO(csv_data)))
+    highlights = list(summary.departments.index)
+    args_for = [(summary, highlights[i % len(highlights)], DEPARTMENT_MARKUP, PERFORMANCE_MARKUP)
+                for i in range(args.reports)]
+
+    print("=" * 60)
+    print(f"Report Template Benchmark ({args.reports:,} reports)")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    compile_template.cache_clear()
+    compile_template()
+    print(f"{'compile template (once)':<28} {(time.perf_counter() - start) * 1e6:>9.1f} us")
+    to_str = per_report_us(lambda i: render_report(*args_for[i]), args.reports)
+    print(f"{'render_report -> str':<28} {to_str:>9.1f} us/report")
+    to_buffer = per_report_us(lambda i: stream_report(StringIO(), *args_for[i]), args.reports)
+    print(f"{'stream_report -> StringIO':<28} {to_buffer:>9.1f} us/report")
+
+    with tempfile.TemporaryDirectory() as scratch:
+        def to_file(i):
+            with open(os.path.join(scratch, f'report_{i}.html'), 'w') as f:
+                stream_report(f, *args_for[i])
+        print(f"{'stream_report -> file':<28} {per_report_us(to_file, args.reports):>9.1f} us/report")
+
+
+if __name__ == "__main__":
+    main()
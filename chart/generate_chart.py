@@ -3,159 +3,878 @@
 # Email: 24f2000604@ds.study.iitm.ac.in
 #
 # This creates an Alluvial/Sankey-style diagram similar to RAWGraphs output
+#
+# Usage:
+#   python generate_chart.py                  # chart.png, exactly 512x512
+#   python generate_chart.py --resize fit     # 512x512 without resampling
+#   python generate_chart.py --data journeys.parquet --steps Source Visit Cart Checkout Outcome \
+#       --style ribbons                       # any number of steps, nodes sized by volume
+#   zcat events.csv.gz | python generate_chart.py --data - --steps Source Landing Cart Outcome \
+#       --size none                           # stream raw events from stdin
 
 import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.sankey import Sankey
+from matplotlib.collections import PathCollection, PolyCollection
+from matplotlib.colors import to_hex, to_rgba_array
+from matplotlib.path import Path
+from matplotlib.transforms import Bbox
 import pandas as pd
 import numpy as np
+import argparse
+import hashlib
+import html
+import os
+import shutil
+import subprocess
+import sys
+from dataclasses import dataclass
+from functools import cached_property
+from io import BytesIO
+from PIL import Image
+
+# Shared CSV / Parquet / Arrow reader lives at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from data_io import iter_table_chunks, read_table
 
 # Author: 24f2000604@ds.study.iitm.ac.in
 
-print("=" * 60)
-print("Customer Journey Alluvial Diagram")
-print("Author: 24f2000604@ds.study.iitm.ac.in")
-print("=" * 60)
+AUTHOR = '24f2000604@ds.study.iitm.ac.in'
+CHART_TITLE = 'Customer Journey Flow\nAlluvial Diagram'
+
+DEFAULT_STEPS = ['Channel', 'Stage', 'Outcome']
+DEFAULT_SIZE = 'Count'
+DEFAULT_CHUNKSIZE = 1_000_000
+STYLES = ('lines', 'ribbons')
 
-# Load data
-df = pd.read_csv('data.csv')
-print(f"\nData loaded: {len(df)} rows")
+# Color palettes
+NODE_COLORS = {
+    # Channels
+    'Social': '#3498db', 'Email': '#e74c3c', 'Organic': '#2ecc71', 'Paid': '#f39c12',
+    # Stages
+    'Awareness': '#9b59b6', 'Interest': '#3498db', 'Decision': '#1abc9c',
+    # Outcomes
+    'Converted': '#27ae60', 'Abandoned': '#c0392b', 'Pending': '#f39c12',
+}
+# Cycled for nodes of other data sets, one pass per step column
+NODE_PALETTE = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6', '#1abc9c',
+                '#e67e22', '#34495e', '#16a085', '#c0392b', '#8e44ad', '#27ae60']
 
-# Create figure
-fig, ax = plt.subplots(figsize=(8, 8))
+OUTPUT_SIZE = 512
+SAVE_DPI = 64
+# 'stretch': tight bbox rendered in memory and resampled to the exact size (the
+#            look of the old `magick -resize 512x512!` step, in process)
+# 'fit':     tight bbox squared up and saved at the DPI that lands on the exact
+#            size directly, so nothing is resampled
+# 'magick':  the old save + ImageMagick subprocess round trip
+RESIZE_MODES = ('stretch', 'fit', 'magick')
 
-# Define positions for each column
-col_positions = {'Channel': 0, 'Stage': 1, 'Outcome': 2}
+# =============================================================================
+# Flow Aggregation
+# =============================================================================
+# Step columns are factorized to integer codes (nodes keep their order of first
+# appearance). For the adjacent pair (i, i + 1) the flow key is
+#   offset_i + code_i * n_{i+1} + code_{i+1}
+# so the keys of all pairs share one index space and a single weighted
+# bincount yields every pair's totals at once.
 
-# Get unique values for each column
-channels = df['Channel'].unique()
-stages = df['Stage'].unique()
-outcomes = df['Outcome'].unique()
 
-# Color palettes
-channel_colors = {'Social': '#3498db', 'Email': '#e74c3c', 'Organic': '#2ecc71', 'Paid': '#f39c12'}
-outcome_colors = {'Converted': '#27ae60', 'Abandoned': '#c0392b', 'Pending': '#f39c12'}
-
-# Calculate node positions
-def get_node_positions(items, x_pos):
-    n = len(items)
-    y_positions = np.linspace(0.9, 0.1, n)
-    return {item: (x_pos, y) for item, y in zip(items, y_positions)}
-
-channel_pos = get_node_positions(channels, 0.1)
-stage_pos = get_node_positions(stages, 0.5)
-outcome_pos = get_node_positions(outcomes, 0.9)
-
-# Aggregate flows
-# Channel -> Stage flows
-channel_stage = df.groupby(['Channel', 'Stage'])['Count'].sum().reset_index()
-# Stage -> Outcome flows  
-stage_outcome = df.groupby(['Stage', 'Outcome'])['Count'].sum().reset_index()
-
-# Draw flows (simplified alluvial representation)
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
-from matplotlib.path import Path
-import matplotlib.patches as patches
-
-# Draw channel to stage flows
-for _, row in channel_stage.iterrows():
-    channel, stage, count = row['Channel'], row['Stage'], row['Count']
-    start = channel_pos[channel]
-    end = stage_pos[stage]
-    
-    # Draw curved connection
-    alpha = min(count / 100, 0.8)
-    width = count / 50
-    
-    verts = [
-        (start[0] + 0.05, start[1]),
-        (0.3, start[1]),
-        (0.3, end[1]),
-        (end[0] - 0.05, end[1]),
-    ]
-    codes = [Path.MOVETO, Path.CURVE4, Path.CURVE4, Path.CURVE4]
-    path = Path(verts, codes)
-    patch = patches.PathPatch(path, facecolor='none', edgecolor=channel_colors[channel], 
-                               lw=width, alpha=alpha)
-    ax.add_patch(patch)
-
-# Draw stage to outcome flows
-for _, row in stage_outcome.iterrows():
-    stage, outcome, count = row['Stage'], row['Outcome'], row['Count']
-    start = stage_pos[stage]
-    end = outcome_pos[outcome]
-    
-    alpha = min(count / 100, 0.8)
-    width = count / 50
-    
-    verts = [
-        (start[0] + 0.05, start[1]),
-        (0.7, start[1]),
-        (0.7, end[1]),
-        (end[0] - 0.05, end[1]),
-    ]
-    codes = [Path.MOVETO, Path.CURVE4, Path.CURVE4, Path.CURVE4]
-    path = Path(verts, codes)
-    patch = patches.PathPatch(path, facecolor='none', edgecolor=outcome_colors[outcome], 
-                               lw=width, alpha=alpha)
-    ax.add_patch(patch)
-
-# Draw nodes
-node_height = 0.08
-node_width = 0.08
-
-# Channel nodes
-for channel, (x, y) in channel_pos.items():
-    rect = FancyBboxPatch((x - node_width/2, y - node_height/2), node_width, node_height,
-                          boxstyle="round,pad=0.01", facecolor=channel_colors[channel], 
-                          edgecolor='white', linewidth=2)
-    ax.add_patch(rect)
-    ax.text(x, y, channel, ha='center', va='center', fontsize=9, fontweight='bold', color='white')
-
-# Stage nodes
-stage_colors = {'Awareness': '#9b59b6', 'Interest': '#3498db', 'Decision': '#1abc9c'}
-for stage, (x, y) in stage_pos.items():
-    rect = FancyBboxPatch((x - node_width/2, y - node_height/2), node_width, node_height,
-                          boxstyle="round,pad=0.01", facecolor=stage_colors.get(stage, '#95a5a6'), 
-                          edgecolor='white', linewidth=2)
-    ax.add_patch(rect)
-    ax.text(x, y, stage, ha='center', va='center', fontsize=9, fontweight='bold', color='white')
-
-# Outcome nodes
-for outcome, (x, y) in outcome_pos.items():
-    rect = FancyBboxPatch((x - node_width/2, y - node_height/2), node_width, node_height,
-                          boxstyle="round,pad=0.01", facecolor=outcome_colors[outcome], 
-                          edgecolor='white', linewidth=2)
-    ax.add_patch(rect)
-    ax.text(x, y, outcome, ha='center', va='center', fontsize=8, fontweight='bold', color='white')
-
-# Column headers
-ax.text(0.1, 0.98, 'Channel', ha='center', va='bottom', fontsize=12, fontweight='bold')
-ax.text(0.5, 0.98, 'Stage', ha='center', va='bottom', fontsize=12, fontweight='bold')
-ax.text(0.9, 0.98, 'Outcome', ha='center', va='bottom', fontsize=12, fontweight='bold')
-
-# Title
-ax.set_title('Customer Journey Flow\nAlluvial Diagram', fontsize=14, fontweight='bold', pad=10)
-
-# Author
-ax.text(0.5, 0.02, '24f2000604@ds.study.iitm.ac.in', ha='center', fontsize=8, style='italic', color='gray',
-        transform=ax.transAxes)
-
-ax.set_xlim(0, 1)
-ax.set_ylim(0, 1)
-ax.axis('off')
-
-plt.tight_layout()
-
-# Save as 512x512
-plt.savefig('chart.png', dpi=64, bbox_inches='tight', facecolor='white', edgecolor='none')
-print("\nChart saved: chart.png")
-
-plt.close()
-
-# Resize to exact 512x512
-import subprocess
-subprocess.run(['magick', 'chart.png', '-resize', '512x512!', 'chart.png'], check=True)
-print("Resized to 512x512 pixels")
+@dataclass
+class AlluvialFlows:
+    """Flow totals between the nodes of consecutive steps."""
+    steps: list
+    labels: list   # per step, node labels in order
+    flows: list    # per adjacent pair, (n_i, n_{i+1}) array of totals
+
+    @cached_property
+    def volumes(self):
+        """Per step, node totals: the larger of inflow and outflow."""
+        volumes = []
+        for i in range(len(self.steps)):
+            outflow = self.flows[i].sum(axis=1) if i < len(self.flows) else 0
+            inflow = self.flows[i - 1].sum(axis=0) if i > 0 else 0
+            volumes.append(np.maximum(outflow, inflow).astype(float))
+        return volumes
+
+    def reordered(self, orders):
+        """The same flows with the nodes of step i in the order orders[i]."""
+        return AlluvialFlows(self.steps, [labels[order] for labels, order in zip(self.labels, orders)],
+                             [matrix[np.ix_(orders[i], orders[i + 1])] for i, matrix in enumerate(self.flows)])
+
+    def pairs(self, i):
+        """(source, target, total) of the non-empty flows between steps i and i + 1."""
+        source, target = np.nonzero(self.flows[i] > 0)
+        return source, target, self.flows[i][source, target]
+
+
+def flow_keys(codes, sizes):
+    """Combined keys of every adjacent pair, concatenated pair after pair."""
+    n_rows = len(codes[0])
+    keys = np.empty(n_rows * (len(codes) - 1), dtype=np.int64)
+    offset = 0
+    for i in range(len(codes) - 1):
+        out = keys[i * n_rows:(i + 1) * n_rows]
+        np.multiply(codes[i], sizes[i + 1], out=out, dtype=np.int64)
+        out += codes[i + 1]
+        out += offset
+        offset += sizes[i] * sizes[i + 1]
+    return keys, offset
+
+
+def split_totals(totals, sizes):
+    """Inverse of the flow_keys layout: one (n_i, n_{i+1}) matrix per pair."""
+    flows, offset = [], 0
+    for a, b in zip(sizes, sizes[1:]):
+        flows.append(totals[offset:offset + a * b].reshape(a, b))
+        offset += a * b
+    return flows
+
+
+def step_codes(series):
+    """(codes, labels) of a step column; categoricals reuse their codes,
+    other columns are factorized in order of first appearance."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), np.asarray(series.cat.categories, dtype=object)
+    codes, uniques = pd.factorize(series, sort=False)
+    return codes, np.asarray(uniques, dtype=object)
+
+
+def drop_empty_nodes(flows):
+    """AlluvialFlows without the nodes that no flow touches (unused categories)."""
+    keep = [volume > 0 for volume in flows.volumes]
+    if all(k.all() for k in keep):
+        return flows
+    matrices = [matrix[keep[i]][:, keep[i + 1]] for i, matrix in enumerate(flows.flows)]
+    return AlluvialFlows(flows.steps, [labels[k] for labels, k in zip(flows.labels, keep)], matrices)
+
+
+def count_flows(codes, sizes, weights=None):
+    """Per adjacent pair, the (n_i, n_{i+1}) totals of `weights` (1 per row
+    when None) in one bincount. Rows with a missing (-1) code are skipped."""
+    if any(len(c) and c.min() < 0 for c in codes):
+        valid = np.logical_and.reduce([c >= 0 for c in codes])
+        codes = [c[valid] for c in codes]
+        weights = None if weights is None else weights[valid]
+    if weights is not None:
+        weights = np.tile(weights, len(codes) - 1)
+    keys, n_keys = flow_keys(codes, sizes)
+    return split_totals(np.bincount(keys, weights, minlength=n_keys), sizes)
+
+
+def aggregate_flows(df, steps, size=DEFAULT_SIZE):
+    """AlluvialFlows for the ordered `steps` columns of `df`.
+
+    Each row adds `size` (or 1 when size is None) to the flow between its
+    values of every pair of consecutive steps. Rows with a missing step value
+    are skipped.
+    """
+    if len(steps) < 2:
+        raise ValueError("an alluvial diagram needs at least two steps")
+    codes, labels = zip(*(step_codes(df[step]) for step in steps))
+    weights = None if size is None else df[size].to_numpy(dtype=float)
+    flows = count_flows(codes, [len(u) for u in labels], weights)
+    return drop_empty_nodes(AlluvialFlows(list(steps), list(labels), flows))
+
+
+class FlowAccumulator:
+    """AlluvialFlows built chunk by chunk, for event logs that never fit in
+    memory at once.
+
+    Node labels get global codes in order of first appearance across chunks.
+    Each chunk is reduced with the same one-pass bincount and added into the
+    running flow matrices, so memory depends on the chunk size and the
+    number of nodes, not on the number of events.
+    """
+
+    def __init__(self, steps, size=DEFAULT_SIZE):
+        if len(steps) < 2:
+            raise ValueError("an alluvial diagram needs at least two steps")
+        self.steps = list(steps)
+        self.size = size
+        self.rows = 0
+        self._index = [{} for _ in self.steps]
+        self._totals = [np.zeros((0, 0)) for _ in self.steps[1:]]
+
+    def _global_codes(self, i, series):
+        codes, labels = step_codes(series)
+        index = self._index[i]
+        if any(label not in index for label in labels):
+            # Register new nodes in order of first appearance, as a full load would
+            for code in pd.unique(codes):
+                if code >= 0:
+                    index.setdefault(labels[code], len(index))
+        remap = np.fromiter((index.get(label, -1) for label in labels), dtype=np.int64, count=len(labels))
+        # The trailing -1 keeps missing values (code -1) missing
+        return np.append(remap, -1)[codes]
+
+    def update(self, chunk):
+        codes = [self._global_codes(i, chunk[step]) for i, step in enumerate(self.steps)]
+        weights = None if self.size is None else chunk[self.size].to_numpy(dtype=float)
+        for i, matrix in enumerate(count_flows(codes, [len(index) for index in self._index], weights)):
+            totals = self._totals[i]
+            if totals.shape != matrix.shape:
+                grown = np.zeros(matrix.shape)
+                grown[:totals.shape[0], :totals.shape[1]] = totals
+                self._totals[i] = totals = grown
+            totals += matrix
+        self.rows += len(chunk)
+        return self
+
+    def result(self):
+        labels = [np.array(list(index), dtype=object) for index in self._index]
+        return drop_empty_nodes(AlluvialFlows(self.steps, labels, [t.copy() for t in self._totals]))
+
+
+def iter_flow_chunks(path, steps, size=DEFAULT_SIZE, chunksize=DEFAULT_CHUNKSIZE):
+    """Chunks of the step (and size) columns of `path`, or of CSV on stdin
+    when path is '-'; steps are read as categoricals."""
+    columns = steps + ([size] if size else [])
+    dtype = {step: 'category' for step in steps}
+    if path == '-':
+        return pd.read_csv(sys.stdin, usecols=columns, chunksize=chunksize, dtype=dtype)
+    return iter_table_chunks(path, chunksize, columns, dtype=dtype)
+
+
+def stream_flows(chunks, steps, size=DEFAULT_SIZE):
+    """Fold an iterable of DataFrame chunks into (AlluvialFlows, rows read)."""
+    accumulator = FlowAccumulator(steps, size)
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return accumulator.result(), accumulator.rows
+
+
+def node_colors(flows):
+    """Per step, a color for every node: the named palette first, then a
+    cycle through NODE_PALETTE."""
+    colors = []
+    for labels in flows.labels:
+        colors.append([NODE_COLORS.get(label, NODE_PALETTE[i % len(NODE_PALETTE)])
+                       for i, label in enumerate(labels)])
+    return colors
+
+
+# =============================================================================
+# Flow Rendering
+# =============================================================================
+# Every flow of a layer is a cubic Bezier from one node column to the next.
+# All control points are computed in one NumPy pass and the layer is added as
+# a single PathCollection with per-path color, linewidth and alpha, so drawing
+# cost no longer grows with one artist per flow.
+
+FLOW_CODES = np.array([1, 4, 4, 4], dtype=np.uint8)   # MOVETO, CURVE4 x 3
+# Ribbon outline: top edge forward, down the target node, bottom edge back
+RIBBON_CODES = np.array([1, 4, 4, 4, 2, 4, 4, 4, 79], dtype=np.uint8)
+
+
+def flow_paths(y_start, y_end, x_start, x_end, x_control):
+    """Bezier vertices, shape (n, 4, 2), for flows from (x_start, y_start[i])
+    to (x_end, y_end[i]) bending at x_control."""
+    y_start, y_end = np.asarray(y_start, dtype=float), np.asarray(y_end, dtype=float)
+    verts = np.empty((len(y_start), 4, 2))
+    verts[:, :, 0] = (x_start, x_control, x_control, x_end)
+    verts[:, :2, 1] = y_start[:, None]
+    verts[:, 2:, 1] = y_end[:, None]
+    return verts
+
+
+def flow_rgba(colors, counts):
+    """Flow colors with opacity growing with the count, capped at 0.8."""
+    rgba = to_rgba_array(colors)
+    rgba[:, 3] = np.minimum(np.asarray(counts, dtype=float) / 100, 0.8)
+    return rgba
+
+
+def flow_collection(verts, rgba, linewidths=None):
+    """One PathCollection for a layer of flows: stroked Bezier curves when
+    `linewidths` is given (see flow_rgba for the count-based colors), else
+    filled ribbon outlines."""
+    if linewidths is None:
+        paths = [Path(v, RIBBON_CODES, readonly=True) for v in verts]
+        return PathCollection(paths, facecolors=rgba, edgecolors='none')
+    paths = [Path(v, FLOW_CODES, readonly=True) for v in verts]
+    return PathCollection(paths, facecolors='none', edgecolors=rgba, linewidths=linewidths,
+                          capstyle='butt', joinstyle='miter')
+
+
+def ribbon_paths(source_top, source_bottom, target_top, target_bottom, x_start, x_end):
+    """Closed ribbon vertices, shape (n, 9, 2), between a band of the source
+    node and a band of the target node."""
+    x_mid = (x_start + x_end) / 2
+    verts = np.empty((len(source_top), 9, 2))
+    verts[:, :, 0] = (x_start, x_mid, x_mid, x_end, x_end, x_mid, x_mid, x_start, x_start)
+    verts[:, [0, 1, 8], 1] = np.asarray(source_top)[:, None]
+    verts[:, [2, 3], 1] = np.asarray(target_top)[:, None]
+    verts[:, [4, 5], 1] = np.asarray(target_bottom)[:, None]
+    verts[:, [6, 7], 1] = np.asarray(source_bottom)[:, None]
+    return verts
+
+
+# =============================================================================
+# Layouts
+# =============================================================================
+
+def column_positions(n_steps):
+    """x of every step column."""
+    return np.linspace(0.1, 0.9, n_steps)
+
+
+def volume_layout(flows, top=0.93, bottom=0.06, padding=0.03):
+    """Per step, (bottom, top) arrays of node extents for nodes stacked with
+    heights proportional to volume, as in RAWGraphs. Returns (extents, scale),
+    where scale converts a total into a height."""
+    height = top - bottom
+    most_nodes = max(len(v) for v in flows.volumes)
+    # Keep at least 70% of the column for the nodes themselves
+    padding = min(padding, 0.3 * height / max(most_nodes - 1, 1))
+    scale = min((height - padding * (len(v) - 1)) / max(v.sum(), 1e-12) for v in flows.volumes)
+
+    extents = []
+    for volume in flows.volumes:
+        heights = volume * scale
+        span = heights.sum() + padding * (len(volume) - 1)
+        tops = top - (height - span) / 2 - np.concatenate([[0], np.cumsum(heights[:-1] + padding)])
+        extents.append((tops - heights, tops))
+    return extents, scale
+
+
+# =============================================================================
+# Node Ordering
+# =============================================================================
+# Nodes in first-appearance order tangle quickly. The crossings layout sorts
+# each column by the flow-weighted mean position (barycenter) of its
+# neighbors: forward sweeps use the sources, backward sweeps the targets, and
+# the order with the fewest weighted crossings over all sweeps is kept.
+# Orders are cached by a hash of the flow table.
+
+LAYOUTS = ('appearance', 'crossings')
+DEFAULT_SWEEPS = 8
+
+
+def pair_crossings(matrix):
+    """Weighted crossings between two ordered columns: the sum of
+    F[a, c] * F[b, d] over a < b, c > d."""
+    right = np.cumsum(matrix[:, ::-1], axis=1)[:, ::-1] - matrix
+    above = np.cumsum(right, axis=0) - right
+    return float((above * matrix).sum())
+
+
+def count_crossings(flows, orders=None):
+    """Total weighted crossings of `flows`, optionally under node `orders`."""
+    total = 0.0
+    for i, matrix in enumerate(flows.flows):
+        if orders is not None:
+            matrix = matrix[np.ix_(orders[i], orders[i + 1])]
+        total += pair_crossings(matrix)
+    return total
+
+
+def barycenter_orders(flows, sweeps=DEFAULT_SWEEPS):
+    """Per step, a permutation of the nodes that reduces weighted crossings."""
+    orders = [np.arange(len(labels)) for labels in flows.labels]
+    best, fewest = [order.copy() for order in orders], count_crossings(flows)
+    n_steps = len(flows.steps)
+    for sweep in range(sweeps):
+        forward = sweep % 2 == 0
+        for i in (range(1, n_steps) if forward else range(n_steps - 2, -1, -1)):
+            if forward:
+                weights = flows.flows[i - 1][np.ix_(orders[i - 1], orders[i])].T
+            else:
+                weights = flows.flows[i][np.ix_(orders[i], orders[i + 1])]
+            mass = weights.sum(axis=1)
+            centers = weights @ np.arange(weights.shape[1], dtype=float)
+            # Nodes without neighbors on that side keep their place
+            centers = np.where(mass > 0, centers / np.where(mass > 0, mass, 1), np.arange(len(mass)))
+            orders[i] = orders[i][np.argsort(centers, kind='stable')]
+        crossings = count_crossings(flows, orders)
+        if crossings < fewest:
+            best, fewest = [order.copy() for order in orders], crossings
+        elif not forward:
+            break   # a full forward + backward round without improvement
+    return best
+
+
+def flow_hash(flows):
+    """sha256 of the steps, node labels and flow totals."""
+    digest = hashlib.sha256()
+    for step, labels in zip(flows.steps, flows.labels):
+        digest.update(repr((step, list(labels))).encode())
+    for matrix in flows.flows:
+        digest.update(np.ascontiguousarray(matrix, dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+class LayoutCache:
+    """Node orders keyed by flow hash, kept in memory and, with a
+    `directory`, as one .npz file per layout across runs."""
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        self.hits = self.misses = 0
+        self._memory = {}
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.npz')
+
+    def get(self, key):
+        orders = self._memory.get(key)
+        if orders is None and self.directory and os.path.exists(self._path(key)):
+            with np.load(self._path(key)) as data:
+                orders = [data[f'arr_{i}'] for i in range(len(data.files))]
+            self._memory[key] = orders
+        if orders is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return orders
+
+    def put(self, key, orders):
+        self._memory[key] = orders
+        if self.directory:
+            tmp = self._path(key) + '.tmp.npz'
+            np.savez(tmp, *orders)
+            os.replace(tmp, self._path(key))
+
+
+def node_orders(flows, sweeps=DEFAULT_SWEEPS, cache=None):
+    """barycenter_orders, looked up in / stored to `cache` when given."""
+    if cache is None:
+        return barycenter_orders(flows, sweeps)
+    key = f'{flow_hash(flows)}-{sweeps}'
+    orders = cache.get(key)
+    if orders is None:
+        orders = barycenter_orders(flows, sweeps)
+        cache.put(key, orders)
+    return orders
+
+
+# =============================================================================
+# Geometry
+# =============================================================================
+# Node boxes and flow shapes are computed once, in axes coordinates (0-1),
+# then either drawn with matplotlib or written out as SVG.
+
+LINE_NODE_SIZE = 0.08
+LINE_NODE_PAD = 0.01
+RIBBON_NODE_WIDTH = 0.03
+RIBBON_ALPHA = 0.45
+MIN_LABEL_HEIGHT = 0.012
+
+
+@dataclass
+class FlowLayer:
+    """The flows between steps i and i + 1, ready to draw."""
+    source: np.ndarray
+    target: np.ndarray
+    totals: np.ndarray
+    verts: np.ndarray             # (n, 4, 2) stroked curves or (n, 9, 2) closed ribbons
+    rgba: np.ndarray
+    linewidths: np.ndarray = None   # points; stroked curves only
+
+
+@dataclass
+class ChartGeometry:
+    """Everything an alluvial chart draws, in axes coordinates."""
+    style: str
+    flows: AlluvialFlows
+    xs: np.ndarray       # x of every step column
+    boxes: list          # per step, (n, 4) node boxes: x0, y0, x1, y1
+    colors: list         # per step, node colors
+    layers: list         # FlowLayer per adjacent pair
+
+
+def line_geometry(flows, colors):
+    """The original look: evenly spaced boxes joined by one line per flow,
+    with width and opacity following the flow's count."""
+    n_steps = len(flows.steps)
+    xs = column_positions(n_steps)
+    positions = [np.linspace(0.9, 0.1, len(labels)) for labels in flows.labels]
+
+    layers = []
+    for i in range(n_steps - 1):
+        # In sorted label order, which is the order the per-pair groupby
+        # used to draw them in
+        source, target, totals = flows.pairs(i)
+        order = np.lexsort((flows.labels[i + 1].argsort().argsort()[target],
+                            flows.labels[i].argsort().argsort()[source]))
+        source, target, totals = source[order], target[order], totals[order]
+        # Leaving the first column flows take the source color; into the last
+        # column they take the outcome's
+        by_target = i == n_steps - 2 and i > 0
+        layer_colors = [colors[i + 1][t] for t in target] if by_target else [colors[i][s] for s in source]
+        verts = flow_paths(positions[i][source], positions[i + 1][target],
+                           xs[i] + 0.05, xs[i + 1] - 0.05, (xs[i] + xs[i + 1]) / 2)
+        layers.append(FlowLayer(source, target, totals, verts, flow_rgba(layer_colors, totals), totals / 50))
+
+    half = LINE_NODE_SIZE / 2
+    boxes = [np.column_stack([np.full_like(y, x - half), y - half, np.full_like(y, x + half), y + half])
+             for x, y in zip(xs, positions)]
+    return ChartGeometry('lines', flows, xs, boxes, colors, layers)
+
+
+def ribbon_geometry(flows, colors, node_width=RIBBON_NODE_WIDTH):
+    """RAWGraphs-style alluvial: node bars sized by volume joined by ribbons
+    as wide as their flow, colored by the source node."""
+    n_steps = len(flows.steps)
+    xs = column_positions(n_steps)
+    node_width = min(node_width, 0.3 * (xs[1] - xs[0]))
+    extents, scale = volume_layout(flows)
+
+    layers = []
+    for i in range(n_steps - 1):
+        matrix = flows.flows[i]
+        # Bands stack top-down inside each node: by target within a source,
+        # by source within a target
+        source_tops = extents[i][1][:, None] - scale * (np.cumsum(matrix, axis=1) - matrix)
+        target_tops = extents[i + 1][1][None, :] - scale * (np.cumsum(matrix, axis=0) - matrix)
+        source, target, totals = flows.pairs(i)
+        widths = scale * totals
+        s_top, t_top = source_tops[source, target], target_tops[source, target]
+        verts = ribbon_paths(s_top, s_top - widths, t_top, t_top - widths,
+                             xs[i] + node_width / 2, xs[i + 1] - node_width / 2)
+        rgba = to_rgba_array([colors[i][s] for s in source], alpha=RIBBON_ALPHA)
+        layers.append(FlowLayer(source, target, totals, verts, rgba))
+
+    boxes = [np.column_stack([np.full_like(bottoms, x - node_width / 2), bottoms,
+                              np.full_like(bottoms, x + node_width / 2), tops])
+             for x, (bottoms, tops) in zip(xs, extents)]
+    return ChartGeometry('ribbons', flows, xs, boxes, colors, layers)
+
+
+def chart_geometry(flows, colors, style='lines'):
+    """ChartGeometry for the 'lines' or 'ribbons' style."""
+    return ribbon_geometry(flows, colors) if style == 'ribbons' else line_geometry(flows, colors)
+
+
+def node_labels(geometry):
+    """(step, node, x, y, ha, fontsize) of every node label to draw."""
+    labels = []
+    last = len(geometry.xs) - 1
+    for i, boxes in enumerate(geometry.boxes):
+        for j, (x0, y0, x1, y1) in enumerate(boxes):
+            y = (y0 + y1) / 2
+            if geometry.style == 'lines':
+                labels.append((i, j, (x0 + x1) / 2, y, 'center', 8 if i == last else 9))
+            elif y1 - y0 >= MIN_LABEL_HEIGHT:
+                if i == last:
+                    labels.append((i, j, x0 - 0.01, y, 'right', 8))
+                else:
+                    labels.append((i, j, x1 + 0.01, y, 'left', 8))
+    return labels
+
+
+# =============================================================================
+# Drawing
+# =============================================================================
+
+def draw_chart(ax, geometry):
+    """Draw a ChartGeometry with one collection per flow layer."""
+    from matplotlib.patches import FancyBboxPatch
+
+    lines = geometry.style == 'lines'
+    for layer in geometry.layers:
+        ax.add_collection(flow_collection(layer.verts, layer.rgba, layer.linewidths), autolim=False)
+
+    # Draw nodes
+    for boxes, colors in zip(geometry.boxes, geometry.colors):
+        if lines:
+            for (x0, y0, x1, y1), color in zip(boxes, colors):
+                rect = FancyBboxPatch((x0, y0), x1 - x0, y1 - y0, boxstyle="round,pad=0.01", facecolor=color,
+                                      edgecolor='white', linewidth=2)
+                ax.add_patch(rect)
+        else:
+            corners = boxes[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(-1, 4, 2)
+            ax.add_collection(PolyCollection(corners, facecolors=colors, edgecolors='white', linewidths=0.5),
+                              autolim=False)
+
+    for i, j, x, y, ha, fontsize in node_labels(geometry):
+        if lines:
+            ax.text(x, y, geometry.flows.labels[i][j], ha=ha, va='center', fontsize=fontsize,
+                    fontweight='bold', color='white')
+        else:
+            ax.text(x, y, geometry.flows.labels[i][j], ha=ha, va='center', fontsize=fontsize)
+
+
+# =============================================================================
+# SVG / HTML Output
+# =============================================================================
+# The same geometry written as a self-contained vector file for dashboards.
+# Coordinates are quantized to integer viewBox units, so every flow is a
+# short path string. Each flow carries a tooltip and the ids of its two
+# nodes; the HTML page adds a few lines of script so clicking a node keeps
+# only the flows through it.
+
+SVG_UNITS = 1000   # viewBox units per axes unit
+# The PNG axes span about 90% of the 8-inch figure: font sizes and line
+# widths in points are converted with this factor to keep their proportions
+SVG_UNITS_PER_POINT = SVG_UNITS / (8 * 72 * 0.9)
+SVG_VIEWBOX = (-10, -130, 1020, 1150)
+VECTOR_FORMATS = {'.svg': 'svg', '.html': 'html', '.htm': 'html'}
+
+CURVE_D = 'M%d %dC%d %d %d %d %d %d'
+RIBBON_D = 'M%d %dC%d %d %d %d %d %dL%d %dC%d %d %d %d %d %dZ'
+
+HTML_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body{{font-family:sans-serif;max-width:820px;margin:0 auto}}
+svg{{width:100%;height:auto}}
+[data-t]{{transition:opacity .2s}}
+[data-t]:hover{{opacity:.9}}
+.dim{{opacity:.06}}
+[data-n]{{cursor:pointer}}
+</style>
+</head>
+<body>
+{svg}
+<p>Hover a flow for its count; click a node to show only its flows, click elsewhere to reset.</p>
+<script>
+const chart = document.querySelector('svg');
+chart.addEventListener('click', event => {{
+  const node = event.target.closest('[data-n]');
+  const id = node && node.dataset.n;
+  for (const flow of chart.querySelectorAll('[data-t]')) {{
+    flow.classList.toggle('dim', !!id && flow.dataset.s !== id && flow.dataset.t !== id);
+  }}
+}});
+</script>
+</body>
+</html>
+"""
+
+
+def path_data(verts, units=SVG_UNITS):
+    """Compact SVG path strings for (n, 4, 2) curves or (n, 9, 2) ribbons,
+    with y flipped and coordinates rounded to integer viewBox units."""
+    stroked = verts.shape[1] == 4
+    points = verts if stroked else verts[:, :8]
+    points = np.rint(points * (units, -units) + (0, units)).astype(np.int64)
+    template = CURVE_D if stroked else RIBBON_D
+    return [template % tuple(row) for row in points.reshape(len(points), -1).tolist()]
+
+
+def _svg_point(x, y):
+    return round(x * SVG_UNITS), round((1 - y) * SVG_UNITS)
+
+
+def _svg_text(x, y, text, size, anchor='middle', extra=''):
+    return (f'<text x="{x}" y="{y}" font-size="{size * SVG_UNITS_PER_POINT:.3g}" '
+            f'text-anchor="{anchor}"{extra}>{html.escape(str(text))}</text>')
+
+
+def svg_document(geometry, title, author=None):
+    """The chart as one SVG element; flows are grouped per layer."""
+    flows = geometry.flows
+    lines = geometry.style == 'lines'
+    pt = SVG_UNITS_PER_POINT
+    anchors = {'left': 'start', 'center': 'middle', 'right': 'end'}
+    x0, y0, width, height = SVG_VIEWBOX
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{x0} {y0} {width} {height}" '
+           f'width="{OUTPUT_SIZE}" height="{round(OUTPUT_SIZE * height / width)}" '
+           f'font-family="DejaVu Sans,Arial,sans-serif">',
+           f'<rect x="{x0}" y="{y0}" width="{width}" height="{height}" fill="white"/>']
+
+    # Title and column headers
+    for k, line in enumerate(title.split('\n')):
+        out.append(_svg_text(500, y0 + 40 + 32 * k, line, 14, extra=' font-weight="bold"'))
+    for x, step in zip(geometry.xs, flows.steps):
+        out.append(_svg_text(*_svg_point(x, 0.98), step, 12, extra=' font-weight="bold"'))
+
+    # Flows
+    for i, layer in enumerate(geometry.layers):
+        if lines:
+            out.append('<g fill="none">')
+        else:
+            out.append(f'<g fill-opacity="{RIBBON_ALPHA:g}">')
+        for k, d in enumerate(path_data(layer.verts)):
+            s, t = layer.source[k], layer.target[k]
+            color = to_hex(layer.rgba[k], keep_alpha=False)
+            if lines:
+                paint = (f'stroke="{color}" stroke-opacity="{layer.rgba[k, 3]:.2g}" '
+                         f'stroke-width="{layer.linewidths[k] * pt:.3g}"')
+            else:
+                paint = f'fill="{color}"'
+            tip = f'{flows.labels[i][s]} \u2192 {flows.labels[i + 1][t]}: {layer.totals[k]:,.0f}'
+            out.append(f'<path d="{d}" {paint} data-s="{i}-{s}" data-t="{i + 1}-{t}">'
+                       f'<title>{html.escape(tip)}</title></path>')
+        out.append('</g>')
+
+    # Nodes, with their step, label and volume
+    pad = LINE_NODE_PAD * SVG_UNITS if lines else 0
+    for i, (boxes, colors) in enumerate(zip(geometry.boxes, geometry.colors)):
+        for j, ((bx0, by0, bx1, by1), color) in enumerate(zip(boxes, colors)):
+            left, top = _svg_point(bx0, by1)
+            right, bottom = _svg_point(bx1, by0)
+            shape = (f'rx="{pad:g}" stroke="white" stroke-width="{2 * pt:.3g}"' if lines
+                     else f'stroke="white" stroke-width="{0.5 * pt:.3g}"')
+            tip = f'{flows.steps[i]}: {flows.labels[i][j]} ({flows.volumes[i][j]:,.0f})'
+            out.append(f'<rect x="{left - pad:g}" y="{top - pad:g}" width="{right - left + 2 * pad:g}" '
+                       f'height="{bottom - top + 2 * pad:g}" fill="{color}" {shape} data-n="{i}-{j}">'
+                       f'<title>{html.escape(tip)}</title></rect>')
+    for i, j, x, y, ha, fontsize in node_labels(geometry):
+        extra = ' font-weight="bold" fill="white"' if lines else ''
+        out.append(_svg_text(*_svg_point(x, y), flows.labels[i][j], fontsize, anchors[ha],
+                             extra + ' dominant-baseline="central" pointer-events="none"'))
+
+    if author:
+        out.append(_svg_text(*_svg_point(0.5, 0.02), author, 8, extra=' font-style="italic" fill="gray"'))
+    out.append('</svg>')
+    return '\n'.join(out)
+
+
+def write_vector(path, geometry, title, author=None):
+    """Write the chart as .svg, or as a self-contained .html page."""
+    svg = svg_document(geometry, title, author)
+    fmt = VECTOR_FORMATS[os.path.splitext(path)[1].lower()]
+    with open(path, 'w', encoding='utf-8') as f:
+        if fmt == 'svg':
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n' + svg + '\n')
+        else:
+            f.write(HTML_PAGE.format(title=html.escape(title.replace('\n', ' ')), svg=svg))
+
+
+# =============================================================================
+# Exact-Size Output
+# =============================================================================
+
+def save_exact(fig, path, size=OUTPUT_SIZE, mode='stretch', dpi=SAVE_DPI):
+    """Save `fig` as a size x size PNG, written once."""
+    if mode == 'magick':
+        # Checked first, so that a failed run leaves no wrong-size file behind
+        if shutil.which('magick') is None:
+            raise RuntimeError("--resize magick needs ImageMagick's `magick` on PATH")
+        fig.savefig(path, dpi=dpi, bbox_inches='tight', facecolor='white', edgecolor='none')
+        subprocess.run(['magick', path, '-resize', f'{size}x{size}!', path], check=True)
+        return
+
+    # The region savefig(bbox_inches='tight') would crop to, measured at the
+    # output DPI so text extents match
+    fig.set_dpi(dpi)
+    fig.canvas.draw()
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+
+    if mode == 'fit':
+        side = max(bbox.width, bbox.height)
+        bbox = Bbox.from_bounds(bbox.x0 - (side - bbox.width) / 2, bbox.y0 - (side - bbox.height) / 2,
+                                side, side)
+        # Nudge up so int(side * dpi) cannot round down to size - 1
+        fig.savefig(path, dpi=size / side * (1 + 1e-9), bbox_inches=bbox,
+                    facecolor='white', edgecolor='none')
+        return
+
+    buffer = BytesIO()
+    fig.savefig(buffer, format='rgba', dpi=dpi, bbox_inches=bbox, facecolor='white', edgecolor='none')
+    width, height = int(bbox.width * dpi), int(bbox.height * dpi)
+    image = Image.frombuffer('RGBA', (width, height), buffer.getbuffer(), 'raw', 'RGBA', 0, 1)
+    image.resize((size, size), Image.LANCZOS).save(path)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Customer journey alluvial diagram')
+    parser.add_argument('--data', metavar='PATH', default='data.csv',
+                        help="journey table (.csv/.parquet/.arrow), or '-' for CSV on stdin (default: %(default)s)")
+    parser.add_argument('--chunksize', type=int, metavar='ROWS',
+                        help='stream the table in chunks of this many rows instead of loading it '
+                             f'(stdin is always streamed, default {DEFAULT_CHUNKSIZE:,} rows)')
+    parser.add_argument('--steps', nargs='+', metavar='COLUMN', default=DEFAULT_STEPS,
+                        help='ordered step columns (default: %(default)s)')
+    parser.add_argument('--size', metavar='COLUMN', default=DEFAULT_SIZE,
+                        help="column holding each row's count; 'none' counts rows (default: %(default)s)")
+    parser.add_argument('--style', choices=STYLES, default='lines',
+                        help="'ribbons' sizes nodes and flows by volume (default: %(default)s)")
+    parser.add_argument('--layout', choices=LAYOUTS, default='appearance',
+                        help="node order in each column; 'crossings' minimizes weighted flow crossings "
+                             "(default: %(default)s)")
+    parser.add_argument('--sweeps', type=int, default=DEFAULT_SWEEPS,
+                        help='barycenter sweeps for --layout crossings (default: %(default)s)')
+    parser.add_argument('--layout-cache', metavar='DIR',
+                        help='reuse crossing layouts stored here, keyed by the flow table hash')
+    parser.add_argument('--output', metavar='PATH', default='chart.png',
+                        help='PNG to write, or .svg / .html for interactive vector output (default: %(default)s)')
+    parser.add_argument('--resize', choices=RESIZE_MODES, default='stretch',
+                        help=f'how to reach exactly {OUTPUT_SIZE}x{OUTPUT_SIZE} pixels (default: %(default)s)')
+    args = parser.parse_args(argv)
+    if len(args.steps) < 2:
+        parser.error("--steps needs at least two columns")
+    vector = os.path.splitext(args.output)[1].lower() in VECTOR_FORMATS
+    if args.resize == 'magick' and not vector and shutil.which('magick') is None:
+        parser.error("--resize magick needs ImageMagick's `magick` on PATH")
+    if args.size.lower() == 'none':
+        args.size = None
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 60)
+    print("Customer Journey Alluvial Diagram")
+    print("Author: 24f2000604@ds.study.iitm.ac.in")
+    print("=" * 60)
+
+    if args.data == '-' or args.chunksize:
+        # Stream events into the flow table; the full log is never in memory
+        chunks = iter_flow_chunks(args.data, args.steps, args.size, args.chunksize or DEFAULT_CHUNKSIZE)
+        flows, n_rows = stream_flows(chunks, args.steps, args.size)
+        print(f"\nData streamed: {n_rows} rows")
+    else:
+        # Load data
+        df = read_table(args.data, columns=args.steps + ([args.size] if args.size else []))
+        print(f"\nData loaded: {len(df)} rows")
+
+        # Aggregate all adjacent-step flows in one pass
+        flows = aggregate_flows(df, args.steps, args.size)
+    colors = node_colors(flows)
+
+    if args.layout == 'crossings':
+        # Reorder nodes to untangle the flows; colors stay with their nodes
+        before = count_crossings(flows)
+        orders = node_orders(flows, args.sweeps, LayoutCache(args.layout_cache))
+        flows = flows.reordered(orders)
+        colors = [[node[j] for j in order] for node, order in zip(colors, orders)]
+        print(f"Weighted crossings: {before:,.0f} -> {count_crossings(flows):,.0f}")
+
+    geometry = chart_geometry(flows, colors, args.style)
+
+    if os.path.splitext(args.output)[1].lower() in VECTOR_FORMATS:
+        # Interactive vector output from the same geometry, no rasterizing
+        write_vector(args.output, geometry, CHART_TITLE, AUTHOR)
+        print(f"\nChart saved: {args.output} ({os.path.getsize(args.output) / 1024:.1f} KB)")
+        print(f"\nAuthor: {AUTHOR}")
+        return
+
+    # Create figure
+    fig, ax = plt.subplots(figsize=(8, 8))
+
+    draw_chart(ax, geometry)
+
+    # Column headers
+    for x, step in zip(column_positions(len(args.steps)), args.steps):
+        ax.text(x, 0.98, step, ha='center', va='bottom', fontsize=12, fontweight='bold')
+
+    # Title
+    ax.set_title(CHART_TITLE, fontsize=14, fontweight='bold', pad=10)
+
+    # Author
+    ax.text(0.5, 0.02, AUTHOR, ha='center', fontsize=8, style='italic', color='gray',
+            transform=ax.transAxes)
+
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.axis('off')
+
+    plt.tight_layout()
+
+    # Save as exactly 512x512, written once
+    save_exact(fig, args.output, OUTPUT_SIZE, args.resize)
+    print(f"\nChart saved: {args.output} ({OUTPUT_SIZE}x{OUTPUT_SIZE} pixels)")
+
+    plt.close()
+
+    print(f"\nAuthor: 24f2000604@ds.study.iitm.ac.in")
+
 
-print(f"\nAuthor: 24f2000604@ds.study.iitm.ac.in")
+if __name__ == "__main__":
+    main()
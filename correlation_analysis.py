@@ -11,246 +11,1154 @@
 # 2. Creates correlation matrix
 # 3. Generates heatmap with Red-White-Green color palette
 # 4. Exports correlation.csv and heatmap.png
-# 5. Creates README.md
+#
+# README.md is maintained by hand; the script does not write it.
+#
+# Large inputs can be streamed in fixed-size chunks instead of loaded whole:
+#   python correlation_analysis.py --input supply_chain_data.csv --chunksize 100000
+# and split across worker processes whose partial moments are merged:
+#   python correlation_analysis.py --input supply_chain_data.csv --workers 8
+# New transactions are folded into the saved moments without a full rerun:
+#   python correlation_analysis.py --append new_rows.csv
+# Tables with thousands of columns are tiled into a memory-mapped .npy:
+#   python correlation_analysis.py --input wide.csv --blocked --memory-budget 512
+# Rank correlations for skewed or clipped metrics:
+#   python correlation_analysis.py --method spearman|kendall
+# p-values and bootstrap confidence intervals go to correlation_significance.csv:
+#   python correlation_analysis.py --bootstrap 5000 --confidence 0.99
+# Production-scale synthetic data for load tests (CSV or Parquet):
+#   python correlation_analysis.py --generate 100000000 --output supply_chain_100m.parquet
+# Inputs may be CSV, Parquet or Arrow IPC; --format picks the output format:
+#   python correlation_analysis.py --input supply_chain_100m.parquet --chunksize 1000000 --format parquet
+# Headless render servers can skip pyplot and lay the heatmap out only once:
+#   python correlation_analysis.py --render agg --timings
+
+import argparse
+import io
+import math
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-import os
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.figure import Figure
+
+from data_io import TableWriter, detect_format, iter_table_chunks, read_table, write_table
 
 # Author: 24f2000604@ds.study.iitm.ac.in
 
-print("=" * 60)
-print("Supply Chain Analytics: Correlation Matrix Visualization")
-print("Author: 24f2000604@ds.study.iitm.ac.in")
-print("=" * 60)
+DEFAULT_CHUNKSIZE = 100_000
+OUTPUT_EXTENSIONS = {'csv': '.csv', 'parquet': '.parquet', 'arrow': '.arrow'}
+STATE_PATH = 'correlation_state.npz'  # persisted moments, kept next to correlation.csv
+MATRIX_PATH = 'correlation_matrix.npy'  # memory-mapped output of --blocked
+DEFAULT_MEMORY_BUDGET_MB = 512
+MAX_HEATMAP_COLUMNS = 100
+CORRELATION_METHODS = ('pearson', 'spearman', 'kendall')
+SIGNIFICANCE_PATH = 'correlation_significance.csv'
+DEFAULT_BOOTSTRAP = 1000
+BOOTSTRAP_MAX_ROWS = 100_000  # above this the default skips the intervals
+BOOTSTRAP_BATCH_BYTES = 64 * 2**20
+HEATMAP_OUTPUTS = [('heatmap.png', 80), ('heatmap_hd.png', 150)]
+RENDER_MODES = ('pyplot', 'agg')
+
 
 # =============================================================================
-# Step 1: Generate Supply Chain Dataset (50 transactions)
+# Streaming Correlation Engine
 # =============================================================================
-# Email: 24f2000604@ds.study.iitm.ac.in
+# Pearson correlation from running counts, means and co-moment sums, so that
+# inputs larger than RAM can be processed one chunk at a time. Every statistic
+# is kept per column *pair* (pairwise-complete observations), which is what
+# df.corr() does when values are missing.
+
+@dataclass
+class MomentState:
+    """Pairwise counts, means, squared deviations and co-moments for k columns.
+
+    Entry [i, j] of each k x k array describes column i restricted to the rows
+    where both column i and column j are present.
+    """
+    columns: list
+    n: np.ndarray
+    mean: np.ndarray
+    m2: np.ndarray
+    comoment: np.ndarray
+
+    @classmethod
+    def empty(cls, columns):
+        k = len(columns)
+        return cls(list(columns), *(np.zeros((k, k)) for _ in range(4)))
+
+    @classmethod
+    def from_block(cls, columns, values):
+        """Moments of one 2-D block of rows (NaN marks a missing value)."""
+        values = np.asarray(values, dtype=np.float64)
+        present = ~np.isnan(values)
+        mask = present.astype(np.float64)
+
+        # Shift by the block's column means before forming sums of products;
+        # this keeps the one-pass formulas below numerically stable.
+        counts = mask.sum(axis=0)
+        shift = np.where(present, values, 0.0).sum(axis=0) / np.maximum(counts, 1)
+        x = np.where(present, values - shift, 0.0)
+
+        n = mask.T @ mask
+        sums = x.T @ mask                  # sums[i, j]: sum of x_i where i, j present
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inv_n = np.where(n > 0, 1.0 / n, 0.0)
+        mean = sums * inv_n
+        m2 = (x * x).T @ mask - sums * mean
+        comoment = x.T @ x - sums * sums.T * inv_n
+        return cls(list(columns), n, mean + shift[:, None], m2, comoment)
+
+    def merge(self, other):
+        """Combine two states (Chan et al. parallel update), returning a new one."""
+        n = self.n + other.n
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weight = np.where(n > 0, self.n * other.n / n, 0.0)
+            frac = np.where(n > 0, other.n / n, 0.0)
+        delta = other.mean - self.mean
+        return MomentState(
+            self.columns,
+            n,
+            self.mean + delta * frac,
+            self.m2 + other.m2 + delta * delta * weight,
+            self.comoment + other.comoment + delta * delta.T * weight,
+        )
+
+    def update(self, values):
+        """Fold a new block of rows into this state."""
+        return self.merge(MomentState.from_block(self.columns, values))
+
+    def save(self, path=STATE_PATH):
+        np.savez(path, columns=np.array(self.columns, dtype=str), n=self.n,
+                 mean=self.mean, m2=self.m2, comoment=self.comoment)
 
-np.random.seed(42)
-n_samples = 50
+    @classmethod
+    def load(cls, path=STATE_PATH):
+        with np.load(path, allow_pickle=False) as state:
+            return cls(state['columns'].tolist(), state['n'], state['mean'],
+                       state['m2'], state['comoment'])
 
-# Generate correlated supply chain metrics
-# Base variables
-supplier_lead_time = np.random.normal(14, 5, n_samples).clip(3, 30)  # Days
-inventory_levels = np.random.normal(500, 150, n_samples).clip(100, 1000)  # Units
+    def correlation(self):
+        """Pearson correlation matrix as a DataFrame (NaN where undefined)."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = self.comoment / np.sqrt(self.m2 * self.m2.T)
+        corr[self.n < 2] = np.nan
+        corr = np.clip(corr, -1.0, 1.0)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
 
-# Order frequency inversely related to inventory levels (more stock = fewer orders)
-order_frequency = 20 - (inventory_levels / 100) + np.random.normal(0, 3, n_samples)
-order_frequency = order_frequency.clip(2, 25)
 
-# Delivery performance inversely related to lead time (longer lead = lower performance)
-delivery_performance = 95 - (supplier_lead_time * 1.5) + np.random.normal(0, 5, n_samples)
-delivery_performance = delivery_performance.clip(60, 100)
+def iter_numeric_chunks(path, chunksize=DEFAULT_CHUNKSIZE):
+    """Yield (columns, float64 block) for the numeric columns of a CSV, Parquet
+    or Arrow IPC file."""
+    columns = None
+    for chunk in iter_table_chunks(path, chunksize):
+        if columns is None:
+            columns = list(chunk.select_dtypes('number').columns)
+        yield columns, chunk[columns].to_numpy(dtype=np.float64, na_value=np.nan)
 
-# Cost per unit related to lead time and delivery performance
-cost_per_unit = 25 + (supplier_lead_time * 0.5) - (delivery_performance * 0.1) + np.random.normal(0, 3, n_samples)
-cost_per_unit = cost_per_unit.clip(15, 50)
 
-# Create DataFrame
-df = pd.DataFrame({
-    'Supplier_Lead_Time': np.round(supplier_lead_time, 1),
-    'Inventory_Levels': np.round(inventory_levels, 0).astype(int),
-    'Order_Frequency': np.round(order_frequency, 1),
-    'Delivery_Performance': np.round(delivery_performance, 1),
-    'Cost_Per_Unit': np.round(cost_per_unit, 2)
-})
+def streaming_moments(path, chunksize=DEFAULT_CHUNKSIZE):
+    """MomentState of a data file, reading at most `chunksize` rows at a time."""
+    state = None
+    for columns, block in iter_numeric_chunks(path, chunksize):
+        if state is None:
+            state = MomentState.empty(columns)
+        state = state.update(block)
+    if state is None:
+        raise ValueError(f"{path} contains no rows")
+    return state
 
-print(f"\nDataset generated: {len(df)} procurement transactions")
-print(f"\nFirst 10 rows:")
-print(df.head(10))
 
-print(f"\nDataset Statistics:")
-print(df.describe())
+def streaming_correlation(path, chunksize=DEFAULT_CHUNKSIZE):
+    """Pearson matrix of a data file, reading at most `chunksize` rows at a time."""
+    return streaming_moments(path, chunksize).correlation()
 
-# Save raw data
-df.to_csv('supply_chain_data.csv', index=False)
-print(f"\nRaw data saved: supply_chain_data.csv")
 
 # =============================================================================
-# Step 2: Calculate Correlation Matrix
+# Parallel Correlation Engine
 # =============================================================================
-# Contact: 24f2000604@ds.study.iitm.ac.in
+# The CSV is cut into line-aligned byte ranges ("shards"). Each worker process
+# parses only its own range and returns a MomentState, which is a few k x k
+# arrays regardless of how many rows the shard held. States are then combined
+# in a pairwise tree, so no single merge sees a lopsided n_a >> n_b update.
+
+class _ByteRange(io.RawIOBase):
+    """Read-only view of bytes [start, end) of a file."""
+
+    def __init__(self, path, start, end):
+        self._file = open(path, 'rb')
+        self._file.seek(start)
+        self._remaining = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        view = memoryview(buffer)[:self._remaining]
+        n = self._file.readinto(view) if len(view) else 0
+        self._remaining -= n
+        return n
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+def shard_offsets(path, n_shards):
+    """Split the data rows of a CSV into n_shards line-aligned byte ranges.
+
+    Assumes one record per line (no quoted newlines), as written by to_csv().
+    """
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        f.readline()
+        starts = [f.tell()]
+        for i in range(1, n_shards):
+            f.seek(max(starts[-1], starts[0] + (size - starts[0]) * i // n_shards))
+            if f.tell() > starts[0]:
+                f.seek(f.tell() - 1)
+            f.readline()
+            starts.append(f.tell())
+    bounds = starts + [size]
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
 
-correlation_matrix = df.corr()
 
-print(f"\n{'=' * 60}")
-print("CORRELATION MATRIX")
-print(f"{'=' * 60}")
-print(correlation_matrix.round(4))
+def _shard_moments(task):
+    path, start, end, names, usecols, chunksize = task
+    state = MomentState.empty([names[i] for i in usecols])
+    with io.BufferedReader(_ByteRange(path, start, end)) as shard:
+        for chunk in pd.read_csv(shard, header=None, names=names, usecols=usecols,
+                                 chunksize=chunksize):
+            block = chunk[state.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+            state = state.update(block)
+    return state
+
+
+def tree_merge(states):
+    """Merge MomentStates pairwise, level by level, into a single state."""
+    states = list(states)
+    while len(states) > 1:
+        merged = [a.merge(b) for a, b in zip(states[::2], states[1::2])]
+        if len(states) % 2:
+            merged.append(states[-1])
+        states = merged
+    return states[0]
+
+
+def parallel_moments(path, workers=None, chunksize=DEFAULT_CHUNKSIZE):
+    """MomentState of a CSV file computed by a pool of worker processes."""
+    if detect_format(path) != 'csv':
+        raise ValueError(f"--workers shards CSV files; stream {path} with --chunksize instead")
+    workers = workers or os.cpu_count() or 1
+    sample = pd.read_csv(path, nrows=1000)
+    names = list(sample.columns)
+    numeric = set(sample.select_dtypes('number').columns)
+    usecols = [i for i, name in enumerate(names) if name in numeric]
+
+    # A few shards per worker keeps the pool busy when shards parse unevenly
+    shards = shard_offsets(path, workers * 4)
+    if not shards:
+        raise ValueError(f"{path} contains no rows")
+    tasks = [(path, a, b, names, usecols, chunksize) for a, b in shards]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        states = list(pool.map(_shard_moments, tasks))
+    return tree_merge(states)
+
+
+def parallel_correlation(path, workers=None, chunksize=DEFAULT_CHUNKSIZE):
+    """Pearson matrix of a CSV file computed by a pool of worker processes."""
+    return parallel_moments(path, workers, chunksize).correlation()
 
-# Save correlation matrix to CSV
-correlation_matrix.to_csv('correlation.csv')
-print(f"\nCorrelation matrix saved: correlation.csv")
 
 # =============================================================================
-# Step 3: Create Heatmap with Red-White-Green Color Palette
+# Incremental Updates
 # =============================================================================
-# Author email: 24f2000604@ds.study.iitm.ac.in
+# Every run saves its MomentState to STATE_PATH. A later --append run loads it
+# and folds in only the new rows, so an update costs O(batch), not O(history).
 
-# Create figure with specific size (will save at ~500x500 pixels)
-fig, ax = plt.subplots(figsize=(8, 7))
+def append_rows(path, state_path=STATE_PATH, workers=None, chunksize=DEFAULT_CHUNKSIZE):
+    """Fold the rows of a CSV file into the persisted state and save it back."""
+    if not os.path.exists(state_path):
+        raise FileNotFoundError(
+            f"{state_path} not found; run a full analysis before using --append")
+    state = MomentState.load(state_path)
+    if workers:
+        batch = parallel_moments(path, workers, chunksize)
+    else:
+        batch = streaming_moments(path, chunksize)
+    if batch.columns != state.columns:
+        raise ValueError(
+            f"{path} has columns {batch.columns}, expected {state.columns}")
+    state = state.merge(batch)
+    state.save(state_path)
+    return state
 
-# Create custom Red-White-Green colormap (matching Excel conditional formatting)
-from matplotlib.colors import LinearSegmentedColormap
-colors = ['#F8696B', '#FFFFFF', '#63BE7B']  # Red - White - Green (Excel palette)
-n_bins = 256
-cmap = LinearSegmentedColormap.from_list('RdWhGn', colors, N=n_bins)
-
-# Create heatmap
-sns.heatmap(
-    correlation_matrix,
-    annot=True,
-    fmt='.3f',
-    cmap=cmap,
-    center=0,
-    vmin=-1,
-    vmax=1,
-    square=True,
-    linewidths=0.5,
-    linecolor='gray',
-    cbar_kws={'label': 'Correlation Coefficient', 'shrink': 0.8},
-    annot_kws={'size': 11, 'weight': 'bold'}
-)
-
-# Styling
-plt.title('Supply Chain Metrics Correlation Matrix\n(Red=Negative, White=Zero, Green=Positive)', 
-          fontsize=14, fontweight='bold', pad=20)
-plt.xticks(rotation=45, ha='right', fontsize=10)
-plt.yticks(rotation=0, fontsize=10)
-
-# Add author email as watermark
-plt.figtext(0.5, 0.02, 'Author: 24f2000604@ds.study.iitm.ac.in', 
-            ha='center', fontsize=9, style='italic', color='gray')
-
-plt.tight_layout()
-
-# Save heatmap as PNG (high DPI for quality)
-plt.savefig('heatmap.png', dpi=80, bbox_inches='tight', 
-            facecolor='white', edgecolor='none')
-print(f"Heatmap saved: heatmap.png")
-
-# Also save a higher resolution version
-plt.savefig('heatmap_hd.png', dpi=150, bbox_inches='tight',
-            facecolor='white', edgecolor='none')
-print(f"HD Heatmap saved: heatmap_hd.png")
-
-plt.close()
 
 # =============================================================================
-# Step 4: Create README.md
+# Rank Correlations (Spearman / Kendall)
 # =============================================================================
-# Email: 24f2000604@ds.study.iitm.ac.in
+# Skewed, clipped metrics such as Delivery_Performance are better described by
+# rank correlations. Spearman ranks every column and reuses the Pearson kernel
+# above; with missing values each pair is re-ranked over its complete rows, as
+# pandas does. Kendall's tau-b uses SciPy's compiled kendalltau when SciPy is
+# installed. Otherwise it sorts the pairs by (x, y) and counts the discordant
+# pairs as the inversions removed by a bottom-up merge sort of y, one stable
+# argsort per level: O(n log^2 n). Both need whole columns, so they run in
+# memory.
 
-readme_content = """# Supply Chain Analytics: Correlation Matrix Visualization
+def _average_ranks(values):
+    """Ranks 1..n of a 1-D array, ties sharing their average rank."""
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    ends = np.cumsum(counts)
+    return ((ends - counts + 1 + ends) / 2)[inverse]
 
-**Author:** 24f2000604@ds.study.iitm.ac.in
 
-**Email:** 24f2000604@ds.study.iitm.ac.in
+def spearman_correlation(df):
+    """Spearman correlation matrix of the numeric columns of a DataFrame.
 
-**Contact:** 24f2000604@ds.study.iitm.ac.in
+    Without missing values every column is ranked once. Pairs with missing
+    values are ranked over their complete rows only, matching pandas.
+    """
+    numeric = df.select_dtypes('number')
+    values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+    present = ~np.isnan(values)
+    ranks = numeric.rank()
+    state = MomentState.empty(ranks.columns).update(
+        ranks.to_numpy(dtype=np.float64, na_value=np.nan))
+    result = state.correlation()
+    if present.all():
+        return result
 
-## Business Context
+    complete = present.all(axis=0)
+    k = values.shape[1]
+    for i in range(k):
+        for j in range(i + 1, k):
+            if complete[i] and complete[j]:
+                continue
+            both = present[:, i] & present[:, j]
+            if both.sum() < 2:
+                r = np.nan
+            else:
+                r = np.corrcoef(_average_ranks(values[both, i]), _average_ranks(values[both, j]))[0, 1]
+            result.iat[i, j] = result.iat[j, i] = r
+    return result
 
-OptimalFlow Logistics - Supplier Performance Analysis for a major automotive manufacturer.
 
-Analysis of 50 procurement transactions to understand relationships between key supply chain metrics.
+def _count_inversions(values):
+    """Number of pairs i < j with values[i] > values[j], by bottom-up merge sort.
 
-## Dataset Variables
+    Each of the log n merge levels is one stable argsort, so the bound is
+    O(n log^2 n) rather than the O(n log n) of a hand-written merge.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    n = values.size
+    span = int(values.max()) + 1 if n else 1
+    index = np.arange(n)
+    inversions = 0
+    width = 1
+    while width < n:
+        # Merge neighbouring sorted runs of `width`; a stable sort on
+        # (run pair, value) places equal values from the left run first.
+        start = index // (2 * width) * (2 * width)
+        order = np.argsort(start * span + values, kind='stable')
+        position = np.empty(n, dtype=np.int64)
+        position[order] = index
+        right = index - start >= width
+        # A right-run element moves forward past exactly the left-run
+        # elements larger than it
+        inversions += int(np.sum(index[right] - position[right]))
+        values = values[order]
+        width *= 2
+    return inversions
 
-| Variable | Description | Unit |
-|----------|-------------|------|
-| Supplier_Lead_Time | Days from order to delivery | Days |
-| Inventory_Levels | Current stock quantities | Units |
-| Order_Frequency | Orders placed per month | Count |
-| Delivery_Performance | On-time delivery rate | % |
-| Cost_Per_Unit | Unit cost | $ |
 
-## Files in This Repository
+def _tied_pairs(counts):
+    counts = counts.astype(np.float64)
+    return float(np.sum(counts * (counts - 1) / 2))
 
-- `README.md` - This file (contains email: 24f2000604@ds.study.iitm.ac.in)
-- `correlation.csv` - Correlation matrix values
-- `heatmap.png` - Heatmap visualization (Red-White-Green palette)
-- `supply_chain_data.csv` - Raw dataset (50 transactions)
-- `correlation_analysis.py` - Python script to generate analysis
 
-## Correlation Matrix
+def _scipy_kendalltau():
+    try:
+        from scipy.stats import kendalltau
+    except ImportError:
+        return None
+    return kendalltau
 
-The heatmap uses Excel-style conditional formatting:
-- 🔴 **Red** = Negative correlation
-- ⚪ **White** = No correlation (zero)
-- 🟢 **Green** = Positive correlation
 
-## How to Run
+def kendall_tau(x, y):
+    """Kendall's tau-b of two integer-coded (dense rank) arrays."""
+    n = len(x)
+    if n < 2:
+        return np.nan
+    kendalltau = _scipy_kendalltau()
+    if kendalltau is not None:
+        return float(kendalltau(x, y).statistic)
+    # One stable argsort of a combined (x, y) key is cheaper than np.lexsort
+    order = np.argsort(x * (int(y.max()) + 1) + y, kind='stable')
+    x, y = x[order], y[order]
 
-```bash
-uvx --with pandas --with matplotlib --with seaborn python correlation_analysis.py
-```
+    n0 = n * (n - 1) / 2
+    ties_x = _tied_pairs(np.bincount(x))
+    ties_y = _tied_pairs(np.bincount(y))
+    run_starts = np.flatnonzero(np.r_[True, (np.diff(x) != 0) | (np.diff(y) != 0)])
+    ties_xy = _tied_pairs(np.diff(np.r_[run_starts, n]))
+    discordant = _count_inversions(y)
 
-## Key Findings
+    denominator = np.sqrt((n0 - ties_x) * (n0 - ties_y))
+    if denominator == 0:
+        return np.nan
+    return (n0 - ties_x - ties_y + ties_xy - 2 * discordant) / denominator
 
-Based on the correlation analysis:
 
-1. **Supplier_Lead_Time vs Delivery_Performance**: Strong negative correlation
-   - Longer lead times correlate with lower on-time delivery rates
+def kendall_correlation(df):
+    """Kendall tau-b matrix of the numeric columns, using pairwise-complete rows."""
+    numeric = df.select_dtypes('number')
+    columns = list(numeric.columns)
+    # Dense integer codes per column, computed once; -1 marks a missing value
+    codes = []
+    for column in columns:
+        values = numeric[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(values)
+        code = np.full(len(values), -1, dtype=np.int64)
+        code[present] = np.unique(values[present], return_inverse=True)[1]
+        codes.append(code)
 
-2. **Inventory_Levels vs Order_Frequency**: Negative correlation
-   - Higher inventory levels correlate with fewer orders (as expected)
+    k = len(columns)
+    result = np.eye(k)
+    for i in range(k):
+        for j in range(i + 1, k):
+            both = (codes[i] >= 0) & (codes[j] >= 0)
+            result[i, j] = result[j, i] = kendall_tau(codes[i][both], codes[j][both])
+    return pd.DataFrame(result, index=columns, columns=columns)
 
-3. **Cost_Per_Unit vs Supplier_Lead_Time**: Positive correlation
-   - Longer lead times may indicate premium/distant suppliers
 
-## Author
+def correlation_by_method(df, method='pearson'):
+    """Correlation matrix of the numeric columns of df for any CORRELATION_METHODS."""
+    if method == 'spearman':
+        return spearman_correlation(df)
+    if method == 'kendall':
+        return kendall_correlation(df)
+    return df.corr(numeric_only=True)
 
-**Email:** 24f2000604@ds.study.iitm.ac.in
 
----
+# =============================================================================
+# Significance: p-values and Bootstrap Confidence Intervals
+# =============================================================================
+# With 50 transactions a "Strong" label means little without its uncertainty.
+# p-values are analytic (t-test for Pearson/Spearman, normal approximation for
+# Kendall) and only need r and the pairwise row counts, so they are available
+# in every mode. Bootstrap intervals resample whole rows: each batch draws a
+# (B, n) index array, gathers a (B, n, k) sample and gets all B correlation
+# matrices from a single einsum. Batches run on a process pool.
+
+def _betainc(a, b, x, iterations=200):
+    """Regularized incomplete beta I_x(a, b), elementwise (Lentz continued fraction)."""
+    a, b, x = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (a, b, x)))
+    # The fraction converges quickly for x < (a + 1) / (a + b + 2); use symmetry otherwise
+    flip = x > (a + 1) / (a + b + 2)
+    a, b, x = np.where(flip, b, a), np.where(flip, a, b), np.where(flip, 1 - x, x)
+
+    lgamma = np.vectorize(math.lgamma, otypes=[np.float64])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        front = np.exp(a * np.log(x) + b * np.log1p(-x)
+                       + lgamma(a + b) - lgamma(a) - lgamma(b)) / a
+
+        tiny = 1e-300
+        c = np.ones_like(x)
+        d = 1 - (a + b) * x / (a + 1)
+        d = 1 / np.where(np.abs(d) < tiny, tiny, d)
+        fraction = d.copy()
+        for m in range(1, iterations + 1):
+            for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                              -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+                d = 1 + numerator * d
+                d = 1 / np.where(np.abs(d) < tiny, tiny, d)
+                c = 1 + numerator / c
+                c = np.where(np.abs(c) < tiny, tiny, c)
+                fraction *= c * d
+    result = np.clip(front * fraction, 0.0, 1.0)
+    return np.where(flip, 1 - result, result)
+
+
+def correlation_p_values(correlation, n, method='pearson'):
+    """Two-sided p-values for H0: no association, given r and pair counts n."""
+    r = np.asarray(correlation, dtype=np.float64)
+    n = np.asarray(n, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if method == 'kendall':
+            z = 3 * r * np.sqrt(n * (n - 1)) / np.sqrt(2 * (2 * n + 5))
+            erfc = np.vectorize(math.erfc, otypes=[np.float64])
+            p = erfc(np.abs(np.nan_to_num(z)) / np.sqrt(2))
+        else:
+            dof = n - 2
+            t_squared = r * r * dof / (1 - r * r)
+            p = _betainc(dof / 2, 0.5, dof / (dof + t_squared))
+    p = np.where((n < 3) | np.isnan(r), np.nan, p)
+    return np.where(np.abs(r) >= 1, 0.0, p)
+
+
+_bootstrap_values = None  # the rows, set once per worker by _init_bootstrap
+
+
+def _init_bootstrap(values):
+    global _bootstrap_values
+    _bootstrap_values = values
+
+
+def _bootstrap_batch(values, n_resamples, seed):
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, len(values), size=(n_resamples, len(values)))
+    sample = values[rows]                                   # (B, n, k)
+    sample -= sample.mean(axis=1, keepdims=True)
+    cov = np.einsum('bni,bnj->bij', sample, sample, optimize=True)
+    std = np.sqrt(np.einsum('bii->bi', cov))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return cov / (std[:, :, None] * std[:, None, :])
+
+
+def _bootstrap_task(batches):
+    """Run a worker's share of (size, seed) batches on the rows it was given once."""
+    return np.concatenate([_bootstrap_batch(_bootstrap_values, size, seed) for size, seed in batches])
+
+
+def bootstrap_intervals(values, n_resamples=DEFAULT_BOOTSTRAP, confidence=0.95,
+                        seed=42, workers=None):
+    """Percentile bootstrap (low, high) Pearson matrices for a 2-D array of rows.
+
+    Rows with a missing value are dropped first. Resamples are split into
+    batches of at most BOOTSTRAP_BATCH_BYTES of gathered data, each with its
+    own SeedSequence child, so results do not depend on the worker count.
+    Each worker receives the rows once, through the pool initializer, and
+    one contiguous share of the batches.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values).any(axis=1)]
+    batch = int(max(1, min(n_resamples, BOOTSTRAP_BATCH_BYTES // max(values.size * 8, 1))))
+    sizes = [min(batch, n_resamples - start) for start in range(0, n_resamples, batch)]
+    batches = list(zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))))
 
-*Generated with Python, Pandas, Matplotlib & Seaborn*
+    workers = min(workers or os.cpu_count() or 1, len(batches))
+    if workers > 1:
+        bounds = np.linspace(0, len(batches), workers + 1).astype(int)
+        tasks = [batches[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_bootstrap,
+                                 initargs=(values,)) as pool:
+            resamples = np.concatenate(list(pool.map(_bootstrap_task, tasks)))
+    else:
+        resamples = np.concatenate([_bootstrap_batch(values, size, child) for size, child in batches])
 
-*Contact: 24f2000604@ds.study.iitm.ac.in*
-"""
+    tail = (1 - confidence) / 2 * 100
+    with np.errstate(invalid='ignore'):
+        low, high = np.nanpercentile(resamples, [tail, 100 - tail], axis=0)
+    return low, high
+
+
+def significance_table(correlation_matrix, n, method='pearson', intervals=None):
+    """One row per variable pair: r, N, P_Value and optional CI_Low / CI_High."""
+    labels = np.asarray(correlation_matrix.columns)
+    values = correlation_matrix.to_numpy(dtype=np.float64)
+    i, j = np.triu_indices(len(labels), 1)
+    table = pd.DataFrame({
+        'Variable_1': labels[i],
+        'Variable_2': labels[j],
+        'Correlation': values[i, j],
+        'N': np.asarray(n)[i, j].astype(np.int64),
+        'P_Value': correlation_p_values(values, n, method)[i, j],
+    })
+    if intervals is not None:
+        table['CI_Low'] = intervals[0][i, j]
+        table['CI_High'] = intervals[1][i, j]
+    return table
 
-with open('README.md', 'w') as f:
-    f.write(readme_content)
-print(f"README.md saved")
 
 # =============================================================================
-# Step 5: Summary
+# Correlation Pair Ranking
 # =============================================================================
-# Contact: 24f2000604@ds.study.iitm.ac.in
+# Works on the raw matrix values: one negated |r| buffer with the lower
+# triangle masked out, one argpartition for the top K and vectorized labels,
+# instead of an iloc lookup per (i, j) pair.
+
+def _top_upper_pairs(values, k, row_offset=0):
+    """Row/column indices and r of the k strongest pairs above the diagonal.
+
+    `values` may be a horizontal band of a larger matrix starting at row
+    `row_offset`, so huge matrices can be ranked one band at a time.
+    """
+    rows, n = values.shape
+
+    # Ascending order of -|r| is strongest first; argpartition places NaN
+    # last, and +inf on and below the diagonal keeps each pair once.
+    key = np.abs(values)
+    np.negative(key, out=key)
+    for row in range(rows):
+        key[row, :row_offset + row + 1] = np.inf
+    key = key.ravel()
+
+    k = min(k, key.size)
+    top = np.argpartition(key, k - 1)[:k] if k else np.empty(0, dtype=np.intp)
+    top = top[np.isfinite(key[top])]
+    i, j = np.divmod(top, n)
+    return i + row_offset, j, values.ravel()[top]
+
+
+def rank_correlation_pairs(correlation_matrix, k=None, labels=None, block_rows=None):
+    """Top-k variable pairs by |r|, strongest first.
+
+    Returns a DataFrame with Variable_1, Variable_2, Correlation, Strength
+    and Direction columns; k=None ranks every pair. NaN pairs are skipped.
+    `correlation_matrix` may also be a plain (or memory-mapped) array with
+    `labels`; `block_rows` then bounds how many rows are read at once.
+    """
+    if labels is None:
+        labels = correlation_matrix.columns
+    labels = np.asarray(labels)
+    n = len(labels)
+    if isinstance(correlation_matrix, pd.DataFrame):
+        correlation_matrix = correlation_matrix.to_numpy(dtype=np.float64)
+    block_rows = block_rows or max(n, 1)
+    k = n * (n - 1) // 2 if k is None else k
+
+    bands = [
+        _top_upper_pairs(np.asarray(correlation_matrix[start:start + block_rows],
+                                    dtype=np.float64), k, start)
+        for start in range(0, n, block_rows)
+    ]
+    i, j, corr = (np.concatenate(parts) for parts in zip(*bands))
+    order = np.argsort(-np.abs(corr), kind='stable')[:k]
+    i, j, corr = i[order], j[order], corr[order]
+
+    strength = np.select([np.abs(corr) > 0.5, np.abs(corr) > 0.3],
+                         ['Strong', 'Moderate'], default='Weak')
+    direction = np.where(corr > 0, '🟢 Positive', '🔴 Negative')
+    return pd.DataFrame({
+        'Variable_1': labels[i],
+        'Variable_2': labels[j],
+        'Correlation': corr,
+        'Strength': strength,
+        'Direction': direction,
+    })
+
+
+# =============================================================================
+# Blocked Out-of-Core Correlation
+# =============================================================================
+# For tables with thousands of columns the k x k matrix itself no longer fits
+# comfortably in memory. The columns are standardized once into a scratch
+# memmap Z (so that corr = Z.T @ Z), then the matrix is produced tile by tile
+# with BLAS matmuls and written straight into an .npy memmap. Missing values
+# are imputed with the column mean (z = 0), unlike df.corr()'s pairwise
+# deletion, so this mode is intended for complete data.
+
+def _block_sizes(n_rows, n_cols, memory_budget):
+    """Column tile width and row chunk length that fit in memory_budget bytes."""
+    itemsize = 8
+    width = int(min(n_cols, max(1, np.sqrt(memory_budget / (3 * itemsize)))))
+    rows = int(min(n_rows, max(1, memory_budget * 2 // 3 // (2 * width * itemsize))))
+    return width, rows
+
+
+def column_moments(path, chunksize):
+    """Per-column (columns, rows, count, mean, m2) of the numeric columns of a CSV."""
+    columns = count = mean = m2 = None
+    rows = 0
+    for columns, block in iter_numeric_chunks(path, chunksize):
+        rows += len(block)
+        present = ~np.isnan(block)
+        n_b = present.sum(axis=0)
+        mean_b = np.where(present, block, 0.0).sum(axis=0) / np.maximum(n_b, 1)
+        m2_b = (np.where(present, block - mean_b, 0.0) ** 2).sum(axis=0)
+        if count is None:
+            count, mean, m2 = n_b, mean_b, m2_b
+            continue
+        total = count + n_b
+        delta = mean_b - mean
+        safe = np.maximum(total, 1)
+        mean = mean + delta * n_b / safe
+        m2 = m2 + m2_b + delta ** 2 * count * n_b / safe
+        count = total
+    if columns is None:
+        raise ValueError(f"{path} contains no rows")
+    return columns, rows, count, mean, m2
+
+
+def blocked_correlation(path, out_path=MATRIX_PATH, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB,
+                        dtype=np.float64):
+    """Pearson matrix of a wide CSV, computed in tiles into an .npy memmap.
+
+    Returns the (read-only) memmap and the column labels.
+    """
+    budget = memory_budget_mb * 2**20
+    dtype = np.dtype(dtype)
+    n_cols = len(read_table(path, nrows=1000).select_dtypes('number').columns)
+    # pandas needs a few copies of each chunk while parsing
+    chunksize = max(1, budget // (4 * 8 * max(n_cols, 1)))
+
+    columns, n_rows, count, mean, m2 = column_moments(path, chunksize)
+    scale = np.where(m2 > 0, 1.0 / np.sqrt(np.where(m2 > 0, m2, 1.0)), 0.0)
+
+    scratch = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(out_path)))
+    try:
+        z = np.lib.format.open_memmap(os.path.join(scratch, 'z.npy'), mode='w+',
+                                      dtype=dtype, shape=(n_rows, len(columns)),
+                                      fortran_order=True)
+        start = 0
+        for _, block in iter_numeric_chunks(path, chunksize):
+            stop = start + len(block)
+            z[start:stop] = np.nan_to_num((block - mean) * scale)
+            start = stop
+        z.flush()
+
+        out = np.lib.format.open_memmap(out_path, mode='w+', dtype=dtype,
+                                        shape=(len(columns), len(columns)))
+        width, rows = _block_sizes(n_rows, len(columns), budget)
+        for c0 in range(0, len(columns), width):
+            for c1 in range(c0, len(columns), width):
+                tile = np.zeros((min(width, len(columns) - c0),
+                                 min(width, len(columns) - c1)))
+                for r0 in range(0, n_rows, rows):
+                    left = np.asarray(z[r0:r0 + rows, c0:c0 + width], dtype=np.float64)
+                    right = np.asarray(z[r0:r0 + rows, c1:c1 + width], dtype=np.float64)
+                    tile += left.T @ right
+                np.clip(tile, -1.0, 1.0, out=tile)
+                out[c0:c0 + width, c1:c1 + width] = tile
+                out[c1:c1 + width, c0:c0 + width] = tile.T
+        del z
+
+        # Constant columns have no defined correlation
+        constant = np.flatnonzero(m2 <= 0)
+        out[constant, :] = np.nan
+        out[:, constant] = np.nan
+        diagonal = np.flatnonzero(m2 > 0)
+        out[diagonal, diagonal] = 1.0
+        out.flush()
+        del out
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    return np.load(out_path, mmap_mode='r'), columns
+
+
+def write_matrix_csv(matrix, labels, path, block_rows):
+    """Write a (memory-mapped) matrix to CSV one band of rows at a time."""
+    with open(path, 'w', newline='') as f:
+        for start in range(0, len(labels), block_rows):
+            band = pd.DataFrame(np.asarray(matrix[start:start + block_rows]),
+                                index=labels[start:start + block_rows], columns=labels)
+            band.to_csv(f, header=start == 0)
+
+
+# =============================================================================
+# Heatmap Rendering
+# =============================================================================
+# 'pyplot' is the original path: global pyplot state, tight_layout, and a
+# bbox_inches='tight' save per resolution (each of which re-runs the layout
+# pass to measure the bbox). 'agg' draws on a bare Figure/FigureCanvasAgg with
+# no pyplot state or GUI backend, lays the figure out once, measures the tight
+# bbox once and reuses that layout for every resolution.
+
+class StageTimer:
+    """Accumulated wall-clock time per named stage (see --timings)."""
+
+    def __init__(self):
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def report(self):
+        total = sum(self.stages.values())
+        lines = [f"  {name:<28} {seconds * 1000:>9.1f} ms" for name, seconds in self.stages.items()]
+        return '\n'.join(lines + [f"  {'total':<28} {total * 1000:>9.1f} ms"])
+
+
+def _draw_heatmap(fig, ax, correlation_matrix):
+    # Create custom Red-White-Green colormap (matching Excel conditional formatting)
+    colors = ['#F8696B', '#FFFFFF', '#63BE7B']  # Red - White - Green (Excel palette)
+    cmap = LinearSegmentedColormap.from_list('RdWhGn', colors, N=256)
+
+    sns.heatmap(
+        correlation_matrix,
+        annot=len(correlation_matrix) <= 20,
+        fmt='.3f',
+        cmap=cmap,
+        center=0,
+        vmin=-1,
+        vmax=1,
+        square=True,
+        linewidths=0.5,
+        linecolor='gray',
+        cbar_kws={'label': 'Correlation Coefficient', 'shrink': 0.8},
+        annot_kws={'size': 11, 'weight': 'bold'},
+        ax=ax,
+    )
+
+    # Styling
+    ax.set_title('Supply Chain Metrics Correlation Matrix\n(Red=Negative, White=Zero, Green=Positive)',
+                 fontsize=14, fontweight='bold', pad=20)
+    for label in ax.get_xticklabels():
+        label.set(rotation=45, ha='right', fontsize=10)
+    for label in ax.get_yticklabels():
+        label.set(rotation=0, fontsize=10)
+
+    # Add author email as watermark
+    fig.text(0.5, 0.02, 'Author: 24f2000604@ds.study.iitm.ac.in',
+             ha='center', fontsize=9, style='italic', color='gray')
+
+
+def render_heatmap(correlation_matrix, outputs=HEATMAP_OUTPUTS, mode='pyplot', timer=None):
+    """Save the correlation heatmap once per (path, dpi) in `outputs`."""
+    timer = timer or StageTimer()
+    if mode == 'agg':
+        with timer.stage('figure (Agg, no pyplot)'):
+            # Create figure with specific size (will save at ~500x500 pixels)
+            fig = Figure(figsize=(8, 7))
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot()
+        with timer.stage('heatmap artists'):
+            _draw_heatmap(fig, ax, correlation_matrix)
+        with timer.stage('layout (once)'):
+            fig.tight_layout()
+            renderer = fig.canvas.get_renderer()
+            fig.draw(renderer)
+            # Same padding as savefig(bbox_inches='tight'), in inches
+            bbox = fig.get_tightbbox(renderer).padded(0.1)
+        for path, dpi in outputs:
+            with timer.stage(f'save {os.path.basename(path)} @{dpi}dpi'):
+                fig.savefig(path, dpi=dpi, bbox_inches=bbox, facecolor='white', edgecolor='none')
+        return timer
+
+    with timer.stage('figure (pyplot)'):
+        # Create figure with specific size (will save at ~500x500 pixels)
+        fig, ax = plt.subplots(figsize=(8, 7))
+    with timer.stage('heatmap artists'):
+        _draw_heatmap(fig, ax, correlation_matrix)
+    with timer.stage('tight_layout'):
+        plt.tight_layout()
+    for path, dpi in outputs:
+        with timer.stage(f'save {os.path.basename(path)} @{dpi}dpi'):
+            plt.savefig(path, dpi=dpi, bbox_inches='tight', facecolor='white', edgecolor='none')
+    plt.close(fig)
+    return timer
+
+
+# =============================================================================
+# Synthetic Dataset
+# =============================================================================
+
+def _supply_chain_frame(normal, n_rows):
+    """The five supply chain metrics for n_rows transactions.
+
+    `normal(loc, scale, size)` supplies the noise, so the same dependency
+    structure serves both the legacy sample and Generator-based streams.
+    """
+    # Generate correlated supply chain metrics
+    # Base variables
+    supplier_lead_time = normal(14, 5, n_rows).clip(3, 30)  # Days
+    inventory_levels = normal(500, 150, n_rows).clip(100, 1000)  # Units
+
+    # Order frequency inversely related to inventory levels (more stock = fewer orders)
+    order_frequency = 20 - (inventory_levels / 100) + normal(0, 3, n_rows)
+    order_frequency = order_frequency.clip(2, 25)
+
+    # Delivery performance inversely related to lead time (longer lead = lower performance)
+    delivery_performance = 95 - (supplier_lead_time * 1.5) + normal(0, 5, n_rows)
+    delivery_performance = delivery_performance.clip(60, 100)
+
+    # Cost per unit related to lead time and delivery performance
+    cost_per_unit = 25 + (supplier_lead_time * 0.5) - (delivery_performance * 0.1) + normal(0, 3, n_rows)
+    cost_per_unit = cost_per_unit.clip(15, 50)
+
+    return pd.DataFrame({
+        'Supplier_Lead_Time': np.round(supplier_lead_time, 1),
+        'Inventory_Levels': np.round(inventory_levels, 0).astype(int),
+        'Order_Frequency': np.round(order_frequency, 1),
+        'Delivery_Performance': np.round(delivery_performance, 1),
+        'Cost_Per_Unit': np.round(cost_per_unit, 2)
+    })
+
+
+def generate_dataset(n_samples=50, seed=42):
+    """The OptimalFlow procurement sample used by the original analysis.
+
+    A private legacy RandomState reproduces the published 50-row sample
+    exactly without reseeding NumPy's global RNG.
+    """
+    return _supply_chain_frame(np.random.RandomState(seed).normal, n_samples)
+
+
+def iter_supply_chain_chunks(n_rows, chunksize=DEFAULT_CHUNKSIZE, seed=42):
+    """Yield synthetic transactions as DataFrames of at most `chunksize` rows.
+
+    Each chunk draws from its own numpy.random.Generator, spawned from one
+    SeedSequence, so output is reproducible for a given (seed, chunksize)
+    and any chunk can be regenerated on its own.
+    """
+    n_chunks = -(-n_rows // chunksize)
+    for index, child in enumerate(np.random.SeedSequence(seed).spawn(n_chunks)):
+        rows = min(chunksize, n_rows - index * chunksize)
+        yield _supply_chain_frame(np.random.default_rng(child).normal, rows)
+
+
+def write_supply_chain(path, n_rows, chunksize=DEFAULT_CHUNKSIZE, seed=42):
+    """Generate n_rows transactions straight to a CSV, Parquet or Arrow file.
+
+    Every chunk is written as soon as it is generated, so memory stays at one
+    chunk regardless of n_rows. Returns the path written (see data_io).
+    """
+    with TableWriter(path) as writer:
+        for chunk in iter_supply_chain_chunks(n_rows, chunksize, seed):
+            writer.write(chunk)
+    return writer.path
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Supply chain correlation matrix and heatmap')
+    parser.add_argument('--method', choices=CORRELATION_METHODS, default='pearson',
+                        help='correlation coefficient (default: %(default)s)')
+    parser.add_argument('--generate', type=int, metavar='ROWS',
+                        help='write ROWS synthetic transactions to --output and exit')
+    parser.add_argument('--output', metavar='PATH', default='supply_chain_data.csv',
+                        help='.csv, .parquet or .arrow target of --generate (default: %(default)s)')
+    parser.add_argument('--format', choices=list(OUTPUT_EXTENSIONS), default='csv',
+                        help='file format of supply_chain_data and correlation outputs '
+                             '(default: %(default)s)')
+    parser.add_argument('--input', metavar='PATH',
+                        help='analyse an existing CSV instead of generating the 50-row sample')
+    parser.add_argument('--chunksize', type=int, metavar='ROWS',
+                        help='stream --input in chunks of ROWS rows (memory ~ ROWS x columns)')
+    parser.add_argument('--workers', type=int, metavar='N',
+                        help='shard --input across N worker processes')
+    parser.add_argument('--top', type=int, metavar='K',
+                        help='list only the K strongest pairs under KEY CORRELATIONS')
+    parser.add_argument('--blocked', action='store_true',
+                        help=f'compute the matrix in tiles into {MATRIX_PATH} (very wide tables)')
+    parser.add_argument('--memory-budget', type=int, default=DEFAULT_MEMORY_BUDGET_MB,
+                        metavar='MB', help='working memory cap for --blocked (default: %(default)s)')
+    parser.add_argument('--dtype', choices=['float32', 'float64'], default='float64',
+                        help='element type of the --blocked matrix (default: %(default)s)')
+    parser.add_argument('--bootstrap', type=int, metavar='N',
+                        help='bootstrap resamples for Pearson confidence intervals, 0 to skip '
+                             f'(default: {DEFAULT_BOOTSTRAP} up to {BOOTSTRAP_MAX_ROWS:,} rows, '
+                             'otherwise skipped)')
+    parser.add_argument('--confidence', type=float, default=0.95,
+                        help='confidence level of the bootstrap intervals (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=42,
+                        help='seed for --generate and the bootstrap resamples (default: %(default)s)')
+    parser.add_argument('--jobs', type=int, metavar='N',
+                        help='processes for the bootstrap (default: all cores)')
+    parser.add_argument('--render', choices=RENDER_MODES, default='pyplot',
+                        help="heatmap renderer; 'agg' is the headless fast path (default: %(default)s)")
+    parser.add_argument('--timings', action='store_true',
+                        help='print per-stage heatmap render times')
+    parser.add_argument('--append', metavar='PATH',
+                        help=f'fold new rows into the saved {STATE_PATH} instead of recomputing')
+    args = parser.parse_args(argv)
+    if args.generate is not None and args.generate < 1:
+        parser.error('--generate needs at least 1 row')
+    if args.blocked and args.append:
+        parser.error('--blocked does not keep a moment state; it cannot be used with --append')
+    if args.method != 'pearson' and (args.chunksize or args.workers or args.blocked or args.append):
+        parser.error(f'--method {args.method} ranks whole columns and needs the data in memory; '
+                     'it cannot be combined with --chunksize, --workers, --blocked or --append')
+    source = args.append or args.input
+    if args.workers and not args.blocked and source and detect_format(source) != 'csv':
+        parser.error(f'--workers shards CSV files; stream {source} with --chunksize instead')
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 60)
+    print("Supply Chain Analytics: Correlation Matrix Visualization")
+    print("Author: 24f2000604@ds.study.iitm.ac.in")
+    print("=" * 60)
+
+    if args.generate is not None:
+        # Load-test data: generated and written chunk by chunk, then exit
+        chunksize = args.chunksize or DEFAULT_CHUNKSIZE
+        path = write_supply_chain(args.output, args.generate, chunksize, args.seed)
+        print(f"\nSynthetic data saved: {path} ({args.generate:,} transactions)")
+        return
+
+    # =============================================================================
+    # Step 1: Generate or Load Supply Chain Dataset
+    # =============================================================================
+    # Email: 24f2000604@ds.study.iitm.ac.in
+
+    chunksize = args.chunksize or DEFAULT_CHUNKSIZE
+    if args.append:
+        df = None
+        print(f"\nAppending {args.append} to {STATE_PATH}")
+    elif args.input is None:
+        df = generate_dataset()
+        print(f"\nDataset generated: {len(df)} procurement transactions")
+    elif args.chunksize is None and args.workers is None and not args.blocked:
+        df = read_table(args.input)
+        print(f"\nDataset loaded: {len(df)} rows from {args.input}")
+    else:
+        # Streaming mode: the dataset is never held in memory as a whole
+        df = None
+        if args.blocked:
+            print(f"\nStreaming {args.input} in tiles within {args.memory_budget} MB")
+        elif args.workers:
+            print(f"\nStreaming {args.input} across {args.workers} worker processes")
+        else:
+            print(f"\nStreaming {args.input} in chunks of {chunksize:,} rows")
+
+    if df is not None:
+        print(f"\nFirst 10 rows:")
+        print(df.head(10))
+
+        print(f"\nDataset Statistics:")
+        print(df.describe())
+
+    saved = []  # (path, description) of every file this run writes
+    if args.input is None and not args.append:
+        # Save raw data
+        data_path = write_table(df, 'supply_chain_data' + OUTPUT_EXTENSIONS[args.format])
+        print(f"\nRaw data saved: {data_path}")
+        saved.append((data_path, 'raw dataset'))
+
+    # =============================================================================
+    # Step 2: Calculate Correlation Matrix
+    # =============================================================================
+    # Contact: 24f2000604@ds.study.iitm.ac.in
+
+    matrix = None
+    if args.blocked:
+        matrix, labels = blocked_correlation(args.input or data_path,
+                                             memory_budget_mb=args.memory_budget,
+                                             dtype=args.dtype)
+        # Bands of rows for CSV export and ranking, with room for a few copies
+        block_rows = max(1, args.memory_budget * 2**20 // (4 * 8 * len(labels)))
+    elif args.append:
+        state = append_rows(args.append, workers=args.workers, chunksize=chunksize)
+    elif df is None and args.workers:
+        state = parallel_moments(args.input, args.workers, chunksize)
+    elif df is None:
+        state = streaming_moments(args.input, chunksize)
+    else:
+        numeric = df.select_dtypes('number')
+        state = MomentState.empty(numeric.columns).update(
+            numeric.to_numpy(dtype=np.float64, na_value=np.nan))
+
+    if matrix is not None:
+        # Only a strided preview of a wide matrix is ever loaded for display
+        step = -(-len(labels) // MAX_HEATMAP_COLUMNS)
+        correlation_matrix = pd.DataFrame(np.asarray(matrix[::step, ::step], dtype=np.float64),
+                                          index=labels[::step], columns=labels[::step])
+    elif df is None:
+        correlation_matrix = state.correlation()
+    else:
+        correlation_matrix = correlation_by_method(df, args.method)
+
+    print(f"\n{'=' * 60}")
+    print("CORRELATION MATRIX" if args.method == 'pearson'
+          else f"CORRELATION MATRIX ({args.method.title()})")
+    print(f"{'=' * 60}")
+    print(correlation_matrix.round(4))
+
+    # Save correlation matrix to CSV
+    if matrix is not None:
+        write_matrix_csv(matrix, labels, 'correlation.csv', block_rows)
+        print(f"\nCorrelation matrix saved: correlation.csv and {MATRIX_PATH}")
+        saved += [('correlation.csv', 'correlation matrix values'), (MATRIX_PATH, 'memory-mapped matrix')]
+    else:
+        matrix_path = write_table(correlation_matrix, 'correlation' + OUTPUT_EXTENSIONS[args.format],
+                                  index=True)
+        print(f"\nCorrelation matrix saved: {matrix_path}")
+        saved.append((matrix_path, 'correlation matrix values'))
+
+    if matrix is None and args.method == 'pearson':
+        if not args.append:
+            state.save()
+        print(f"Correlation state saved: {STATE_PATH} ({int(state.n.max()):,} observations)")
+        saved.append((STATE_PATH, 'correlation moments for --append'))
+
+    # p-values for every pair; bootstrap intervals when the rows are in memory
+    significance = None
+    if matrix is None:
+        intervals = None
+        n_resamples = args.bootstrap
+        if n_resamples is None:
+            # Every resample gathers all rows, so large inputs opt in explicitly
+            n_resamples = DEFAULT_BOOTSTRAP if df is not None and len(df) <= BOOTSTRAP_MAX_ROWS else 0
+            if df is not None and n_resamples == 0 and args.method == 'pearson':
+                print(f"Bootstrap skipped for {len(df):,} rows (more than {BOOTSTRAP_MAX_ROWS:,}); "
+                      f"pass --bootstrap N to compute intervals")
+        if df is not None and args.method == 'pearson' and n_resamples > 0:
+            intervals = bootstrap_intervals(
+                df[correlation_matrix.columns].to_numpy(dtype=np.float64, na_value=np.nan),
+                n_resamples, args.confidence, args.seed, args.jobs)
+        significance = significance_table(correlation_matrix, state.n, args.method, intervals)
+        significance.to_csv(SIGNIFICANCE_PATH, index=False)
+        detail = (f"p-values and {args.confidence:.0%} bootstrap CIs ({n_resamples:,} resamples)"
+                  if intervals is not None else "p-values")
+        print(f"Significance saved: {SIGNIFICANCE_PATH} ({detail})")
+        saved.append((SIGNIFICANCE_PATH, detail))
+        significance = significance.set_index(['Variable_1', 'Variable_2'])
+
+    # =============================================================================
+    # Step 3: Create Heatmap with Red-White-Green Color Palette
+    # =============================================================================
+    # Author email: 24f2000604@ds.study.iitm.ac.in
+
+    timer = render_heatmap(correlation_matrix, HEATMAP_OUTPUTS, args.render)
+    print(f"Heatmap saved: heatmap.png")
+    print(f"HD Heatmap saved: heatmap_hd.png")
+    saved += [(path, f'Excel-style Red-White-Green heatmap, {dpi} dpi') for path, dpi in HEATMAP_OUTPUTS]
+    if args.timings:
+        print(f"\nHeatmap render timings ({args.render}):")
+        print(timer.report())
+
+    # =============================================================================
+    # Step 4: Summary
+    # =============================================================================
+    # Contact: 24f2000604@ds.study.iitm.ac.in
+
+    print(f"\n{'=' * 60}")
+    print("ANALYSIS COMPLETE")
+    print(f"{'=' * 60}")
+    print(f"\nFiles generated:")
+    for path, description in saved:
+        print(f"  ✅ {path} ({description})")
+
+    print(f"\n{'=' * 60}")
+    print("KEY CORRELATIONS")
+    print(f"{'=' * 60}")
+
+    # Print significant correlations
+    if matrix is not None:
+        corr_pairs = rank_correlation_pairs(matrix, args.top or 20, labels, block_rows)
+    else:
+        corr_pairs = rank_correlation_pairs(correlation_matrix, args.top)
+    for col1, col2, corr, strength, direction in corr_pairs.itertuples(index=False):
+        note = ''
+        if significance is not None:
+            pair = significance.loc[(col1, col2)]
+            note = f", p={pair['P_Value']:.2g}"
+            if 'CI_Low' in pair:
+                note += f", {args.confidence:.0%} CI [{pair['CI_Low']:.2f}, {pair['CI_High']:.2f}]"
+        print(f"{col1} ↔ {col2}: {corr:.4f} ({strength} {direction}{note})")
+
+    print(f"\nAuthor: 24f2000604@ds.study.iitm.ac.in")
+
 
-print(f"\n{'=' * 60}")
-print("ANALYSIS COMPLETE")
-print(f"{'=' * 60}")
-print(f"\nFiles generated:")
-print(f"  ✅ README.md (contains email: 24f2000604@ds.study.iitm.ac.in)")
-print(f"  ✅ correlation.csv (correlation matrix values)")
-print(f"  ✅ heatmap.png (Excel-style Red-White-Green heatmap)")
-print(f"  ✅ supply_chain_data.csv (raw dataset)")
-
-print(f"\n{'=' * 60}")
-print("KEY CORRELATIONS")
-print(f"{'=' * 60}")
-
-# Print significant correlations
-corr_pairs = []
-for i in range(len(correlation_matrix.columns)):
-    for j in range(i+1, len(correlation_matrix.columns)):
-        col1 = correlation_matrix.columns[i]
-        col2 = correlation_matrix.columns[j]
-        corr = correlation_matrix.iloc[i, j]
-        corr_pairs.append((col1, col2, corr))
-
-corr_pairs.sort(key=lambda x: abs(x[2]), reverse=True)
-
-for col1, col2, corr in corr_pairs:
-    direction = "🟢 Positive" if corr > 0 else "🔴 Negative"
-    strength = "Strong" if abs(corr) > 0.5 else "Moderate" if abs(corr) > 0.3 else "Weak"
-    print(f"{col1} ↔ {col2}: {corr:.4f} ({strength} {direction})")
-
-print(f"\nAuthor: 24f2000604@ds.study.iitm.ac.in")
+if __name__ == "__main__":
+    main()
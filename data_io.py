@@ -0,0 +1,244 @@
+# Shared Table I/O: CSV, Parquet and Arrow IPC
+# Author: 24f2000604@ds.study.iitm.ac.in
+# Email: 24f2000604@ds.study.iitm.ac.in
+#
+# One place for the scripts in this repository to read and write tables.
+# The format follows the file extension:
+#   .csv                      -> CSV (always available)
+#   .parquet / .pq            -> Parquet     (needs pyarrow)
+#   .arrow / .feather / .ipc  -> Arrow IPC   (needs pyarrow)
+#
+# Columnar formats parse far faster than CSV, support column projection
+# (only the requested columns are decoded) and keep compact dtypes such as
+# int32 and categoricals. When pyarrow is not installed, writes fall back to
+# CSV next to the requested path.
+
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# Author: 24f2000604@ds.study.iitm.ac.in
+
+FORMATS = {
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.ipc': 'arrow',
+}
+
+
+def detect_format(path):
+    """'csv', 'parquet' or 'arrow' from the file extension (CSV if unknown)."""
+    return FORMATS.get(os.path.splitext(str(path))[1].lower(), 'csv')
+
+
+def have_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _csv_fallback(path):
+    fallback = os.path.splitext(str(path))[0] + '.csv'
+    warnings.warn(f"pyarrow is not installed; writing {fallback} instead of {path}")
+    return fallback
+
+
+# =============================================================================
+# Compact dtypes
+# =============================================================================
+
+def compact_dtypes(df, categorize=True):
+    """Downcast int64 columns to int32 where the values fit, and optionally
+    turn low-cardinality string columns into categoricals."""
+    df = df.copy()
+    int32 = np.iinfo(np.int32)
+    for column in df.columns:
+        series = df[column]
+        if pd.api.types.is_integer_dtype(series.dtype) and series.dtype.itemsize > 4:
+            if series.empty or (series.min() >= int32.min and series.max() <= int32.max):
+                df[column] = series.astype(np.int32)
+        elif categorize and (pd.api.types.is_object_dtype(series.dtype)
+                             or pd.api.types.is_string_dtype(series.dtype)):
+            if series.nunique(dropna=True) <= max(1, len(series) // 2):
+                df[column] = series.astype('category')
+    return df
+
+
+# =============================================================================
+# Reading
+# =============================================================================
+
+def read_table(path, columns=None, nrows=None, index_col=None):
+    """Read a CSV, Parquet or Arrow IPC file into a DataFrame.
+
+    `columns` projects the read onto those columns only; for the columnar
+    formats the other columns are never decoded. `nrows` reads the first rows
+    only. `index_col` names (or, for CSV, numbers) the column to use as index.
+    """
+    fmt = detect_format(path)
+    if fmt == 'csv':
+        return pd.read_csv(path, usecols=columns, nrows=nrows, index_col=index_col)
+
+    if nrows is not None:
+        df = next(iter_table_chunks(path, nrows, columns), None)
+        if df is None:
+            df = read_table(path, columns).iloc[:0]
+    elif fmt == 'parquet':
+        df = pd.read_parquet(path, columns=columns)
+    else:
+        df = pd.read_feather(path, columns=columns)
+    if index_col is not None:
+        df = df.set_index(df.columns[index_col] if isinstance(index_col, int) else index_col)
+    return df
+
+
+def iter_table_chunks(path, chunksize, columns=None, dtype=None):
+    """Yield DataFrames of at most `chunksize` rows from any supported format.
+
+    `dtype` maps column names to the dtypes of the yielded chunks, e.g.
+    'category' for low-cardinality strings.
+    """
+    fmt = detect_format(path)
+    if fmt == 'csv':
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunksize, dtype=dtype)
+        return
+    if dtype is not None:
+        for chunk in iter_table_chunks(path, chunksize, columns):
+            yield chunk.astype(dtype)
+        return
+
+    import pyarrow as pa
+
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+
+        batches = pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns)
+        for batch in batches:
+            yield batch.to_pandas()
+        return
+
+    import pyarrow.ipc as ipc
+
+    with pa.memory_map(str(path)) as source:
+        reader = ipc.open_file(source)
+        pending, rows = [], 0
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            if columns is not None:
+                batch = batch.select(columns)
+            # Re-slice the file's record batches to exactly `chunksize` rows
+            while batch.num_rows:
+                take = min(chunksize - rows, batch.num_rows)
+                pending.append(batch.slice(0, take))
+                rows += take
+                batch = batch.slice(take)
+                if rows == chunksize:
+                    yield pa.Table.from_batches(pending).to_pandas()
+                    pending, rows = [], 0
+        if pending:
+            yield pa.Table.from_batches(pending).to_pandas()
+
+
+# =============================================================================
+# Writing
+# =============================================================================
+
+def write_table(df, path, index=False, compact=True):
+    """Write a DataFrame in the format given by the extension of `path`.
+
+    Returns the path actually written, which ends in .csv when pyarrow is
+    missing for a columnar target.
+    """
+    fmt = detect_format(path)
+    if fmt != 'csv' and not have_pyarrow():
+        path, fmt = _csv_fallback(path), 'csv'
+    if compact and fmt != 'csv':
+        df = compact_dtypes(df)
+
+    if fmt == 'csv':
+        df.to_csv(path, index=index)
+    elif fmt == 'parquet':
+        df.to_parquet(path, index=index)
+    else:
+        # Arrow IPC files have no pandas index; keep it as a regular column
+        (df.reset_index() if index else df.reset_index(drop=True)).to_feather(path)
+    return path
+
+
+class TableWriter:
+    """Append DataFrame chunks to one CSV, Parquet or Arrow IPC file.
+
+    The dtypes of the first chunk fix the file schema (after compact_dtypes,
+    without categoricals so that every chunk shares it); later chunks are cast
+    to that schema. Use as a context manager. Nothing is created until the
+    first chunk arrives, so callers must write at least one.
+    """
+
+    def __init__(self, path, compact=True):
+        self.fmt = detect_format(path)
+        if self.fmt != 'csv' and not have_pyarrow():
+            path, self.fmt = _csv_fallback(path), 'csv'
+        self.path = path
+        self.compact = compact and self.fmt != 'csv'
+        self.rows = 0
+        self._dtypes = None
+        self._writer = None
+        self._file = None
+
+    def write(self, chunk):
+        if self._dtypes is None:
+            if self.compact:
+                chunk = compact_dtypes(chunk, categorize=False)
+            self._dtypes = chunk.dtypes.to_dict()
+        else:
+            chunk = self._cast(chunk)
+
+        if self.fmt == 'csv':
+            if self._file is None:
+                self._file = open(self.path, 'w', newline='')
+            chunk.to_csv(self._file, header=self.rows == 0, index=False)
+        else:
+            import pyarrow as pa
+
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self._writer is None:
+                if self.fmt == 'parquet':
+                    import pyarrow.parquet as pq
+                    self._writer = pq.ParquetWriter(self.path, table.schema)
+                else:
+                    import pyarrow.ipc as ipc
+                    self._file = pa.OSFile(self.path, 'wb')
+                    self._writer = ipc.new_file(self._file, table.schema)
+            self._writer.write_table(table)
+        self.rows += len(chunk)
+
+    def _cast(self, chunk):
+        for column, dtype in self._dtypes.items():
+            if chunk[column].dtype == dtype:
+                continue
+            if pd.api.types.is_integer_dtype(dtype):
+                info = np.iinfo(dtype)
+                values = chunk[column]
+                if len(values) and (values.min() < info.min or values.max() > info.max):
+                    raise ValueError(f"{column} no longer fits {dtype} in a later chunk")
+            chunk = chunk.astype({column: dtype})
+        return chunk
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -8,20 +8,306 @@
 #
 # This script:
 # 1. Loads employee data
-# 2. Calculates frequency count for "Marketing" department
+# 2. Calculates frequency count for the "Marketing" department (--highlight)
 # 3. Prints the frequency count to console
 # 4. Creates a histogram showing department distribution
 # 5. Saves everything as an HTML file
+#
+# Usage:
+#   python employee_analysis.py                                  # built-in sample
+#   python employee_analysis.py --input exports/hr_*.parquet --chunksize 500000
+#   python employee_analysis.py --batch --input units/*.csv --output-dir reports --jobs 8
+#   python employee_analysis.py --batch --input units/*.csv --cache-dir .report_cache
+#   python employee_analysis.py --assets external --image-format webp --svg-bar-chart
+
+import argparse
+import glob
+import hashlib
+import os
+import pickle
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 import pandas as pd
-import matplotlib.pyplot as plt
+import numpy as np
 import seaborn as sns
 from io import StringIO
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
 import base64
+from dataclasses import astuple, dataclass
+from functools import cached_property, lru_cache
 from io import BytesIO
+from string import Formatter
+
+from data_io import iter_table_chunks
 
 # Author: 24f2000604@ds.study.iitm.ac.in
 
+DEFAULT_CHUNKSIZE = 100_000
+DEFAULT_SAMPLE_ROWS = 100_000
+REPORT_COLUMNS = ['department', 'region', 'performance_score', 'years_experience']
+CATEGORY_DTYPES = {'department': 'category', 'region': 'category'}
+# Tenure bands for the frequency index: (label, first year of the band)
+TENURE_BANDS = [('0-2 yrs', 0), ('3-5 yrs', 3), ('6-10 yrs', 6), ('11-15 yrs', 11), ('16+ yrs', 16)]
+DEFAULT_HIGHLIGHT = 'Marketing'
+# Chart encodings; 'svg' is only used for the inline bar chart
+IMAGE_FORMATS = ('png', 'optimized-png', 'webp')
+IMAGE_TYPES = {'png': ('image/png', '.png'), 'optimized-png': ('image/png', '.png'),
+               'webp': ('image/webp', '.webp')}
+ASSET_MODES = ('inline', 'external')
+ASSETS_DIR = 'assets'
+# Bump when a change to the code alters report output for the same input
+CACHE_VERSION = 1
+DEFAULT_CACHE_MB = 512
+DEFAULT_CACHE_ENTRIES = 10_000
+
+# =============================================================================
+# Report Summary
+# =============================================================================
+# Every number in the report comes from one grouped pass per key (department,
+# region). The groups carry plain counts and sums, so summaries of separate
+# slices of the data can be added together before the means are taken.
+
+@dataclass
+class EmployeeSummary:
+    departments: pd.DataFrame   # count, percentage, avg_performance; largest first
+    regions: pd.DataFrame       # count, avg_experience
+    total: int
+    avg_performance: float
+    top_department: str         # highest average performance
+    top_performance: float
+    most_experienced_region: str
+    max_avg_experience: float
+    frequencies: 'FrequencyIndex'
+
+    @cached_property
+    def department_lists(self):
+        """(names, counts, percentages, average performances) as plain lists."""
+        departments = self.departments
+        return (departments.index.tolist(), departments['count'].tolist(),
+                departments['percentage'].tolist(), departments['avg_performance'].tolist())
+
+    def department_count(self, department):
+        """Employees in `department` (0 if it never occurs), from the group
+        sums so that it agrees with the department table."""
+        return int(self.departments['count'].get(department, 0))
+
+    def department_share(self, department):
+        """department_count() as a percentage of all employees."""
+        return float(self.departments['percentage'].get(department, 0.0))
+
+
+def group_sums(df):
+    """Per-department and per-region counts and sums, one groupby each.
+
+    `count` is the headcount; the means divide by the non-null counts of
+    their column, so missing scores are skipped as .groupby().mean() does.
+    """
+    departments = df.groupby('department', sort=False, observed=True).agg(
+        count=('performance_score', 'size'),
+        performance_count=('performance_score', 'count'),
+        performance_sum=('performance_score', 'sum'),
+    )
+    regions = df.groupby('region', sort=False, observed=True).agg(
+        count=('years_experience', 'size'),
+        experience_count=('years_experience', 'count'),
+        experience_sum=('years_experience', 'sum'),
+    )
+    return departments, regions
+
+
+def finalize_summary(departments, regions, frequencies):
+    """Turn the counts and sums from group_sums (and the frequency index of
+    the same rows) into an EmployeeSummary."""
+    total = int(departments['count'].sum())
+    avg_performance = float(departments['performance_sum'].sum() / departments['performance_count'].sum())
+    # Stable sort keeps first-appearance order for ties, like value_counts()
+    departments = departments.sort_values('count', ascending=False, kind='stable')
+    departments = pd.DataFrame({
+        'count': departments['count'],
+        'percentage': departments['count'] / total * 100,
+        'avg_performance': departments['performance_sum'] / departments['performance_count'],
+    })
+    regions = pd.DataFrame({
+        'count': regions['count'],
+        'avg_experience': regions['experience_sum'] / regions['experience_count'],
+    })
+    top_department = departments['avg_performance'].idxmax()
+    most_experienced_region = regions['avg_experience'].idxmax()
+    return EmployeeSummary(
+        departments=departments,
+        regions=regions,
+        total=total,
+        avg_performance=avg_performance,
+        top_department=top_department,
+        top_performance=departments.at[top_department, 'avg_performance'],
+        most_experienced_region=most_experienced_region,
+        max_avg_experience=regions.at[most_experienced_region, 'avg_experience'],
+        frequencies=frequencies,
+    )
+
+
+def summarize_employees(df):
+    return finalize_summary(*group_sums(df), FrequencyIndex.from_frame(df))
+
+
+def merge_sums(left, right):
+    """Add two group_sums() tables; groups keep their first-appearance order."""
+    return pd.concat([left, right]).groupby(level=0, sort=False).sum()
+
+
+# =============================================================================
+# Frequency Index
+# =============================================================================
+# Employee counts over department x region x tenure band, built with a single
+# bincount over the combined categorical codes. Every marginal (e.g. department
+# alone, or region x tenure band) is summed once on first use, after which any
+# count or percentage query is a dictionary lookup plus one array index.
+
+def _tenure_codes(years):
+    edges = np.array([start for _, start in TENURE_BANDS], dtype=float)
+    codes = np.searchsorted(edges, np.asarray(years, dtype=float), side='right') - 1
+    codes[np.isnan(np.asarray(years, dtype=float))] = -1
+    return codes
+
+
+class FrequencyIndex:
+    """Counts of employees by department, region and tenure band.
+
+    Only rows with all three known are indexed, so with missing regions or
+    experience the index total is below the row count; headline counts come
+    from EmployeeSummary.department_count() instead.
+    """
+
+    AXES = ('department', 'region', 'tenure')
+
+    def __init__(self, departments, regions, counts):
+        self.labels = (list(departments), list(regions), [label for label, _ in TENURE_BANDS])
+        self.counts = counts            # int64 array, one axis per entry of AXES
+        self._positions = [{label: i for i, label in enumerate(labels)} for labels in self.labels]
+        self._marginals = {}
+
+    @classmethod
+    def from_frame(cls, df):
+        departments = pd.Categorical(df['department'])
+        regions = pd.Categorical(df['region'])
+        codes = (departments.codes, regions.codes, _tenure_codes(df['years_experience']))
+        shape = (len(departments.categories), len(regions.categories), len(TENURE_BANDS))
+        known = (codes[0] >= 0) & (codes[1] >= 0) & (codes[2] >= 0)
+        flat = np.ravel_multi_index(tuple(code[known] for code in codes), shape)
+        counts = np.bincount(flat, minlength=int(np.prod(shape))).reshape(shape)
+        return cls(departments.categories, regions.categories, counts)
+
+    def merge(self, other):
+        """Index over the rows of both indexes (labels are matched by name)."""
+        departments = self.labels[0] + [d for d in other.labels[0] if d not in self._positions[0]]
+        regions = self.labels[1] + [r for r in other.labels[1] if r not in self._positions[1]]
+        merged = FrequencyIndex(departments, regions,
+                                np.zeros((len(departments), len(regions), len(TENURE_BANDS)), np.int64))
+        for index in (self, other):
+            rows = [merged._positions[0][d] for d in index.labels[0]]
+            cols = [merged._positions[1][r] for r in index.labels[1]]
+            merged.counts[np.ix_(rows, cols)] += index.counts
+        return merged
+
+    @property
+    def total(self):
+        return int(self._marginal(()).sum())
+
+    def _marginal(self, axes):
+        # Counts summed over every axis not in `axes`, kept in AXES order
+        if axes not in self._marginals:
+            drop = tuple(i for i, name in enumerate(self.AXES) if name not in axes)
+            self._marginals[axes] = self.counts.sum(axis=drop)
+        return self._marginals[axes]
+
+    def count(self, department=None, region=None, tenure=None):
+        """Employees matching every given label (None matches all); 0 for
+        labels that never occur."""
+        query = dict(zip(self.AXES, (department, region, tenure)))
+        axes = tuple(name for name in self.AXES if query[name] is not None)
+        position = []
+        for name in axes:
+            i = self._positions[self.AXES.index(name)].get(query[name])
+            if i is None:
+                return 0
+            position.append(i)
+        return int(self._marginal(axes)[tuple(position)])
+
+    def percentage(self, department=None, region=None, tenure=None):
+        """count() as a percentage of all indexed employees."""
+        total = self.total
+        return self.count(department, region, tenure) / total * 100 if total else 0.0
+
+    def table(self, rows='department', columns='region'):
+        """Cross-tabulation of two axes as a DataFrame."""
+        axes = tuple(name for name in self.AXES if name in (rows, columns))
+        values = self._marginal(axes)
+        if axes != (rows, columns):
+            values = values.T
+        return pd.DataFrame(values, index=self.labels[self.AXES.index(rows)],
+                            columns=self.labels[self.AXES.index(columns)])
+
+
+# =============================================================================
+# Streaming Input
+# =============================================================================
+# HR exports can run to millions of rows over several files. They are read in
+# chunks with categorical department/region columns and only the group sums
+# and a fixed-size uniform sample of rows (for the box plot) are kept, so
+# memory does not grow with the input.
+
+def expand_inputs(patterns):
+    """Files named by `patterns`, with glob patterns expanded in sorted order."""
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        matches = [path for path in matches if os.path.isfile(path)]
+        if not matches:
+            raise FileNotFoundError(f"no input files match {pattern}")
+        paths.extend(matches)
+    return paths
+
+
+def iter_employee_chunks(paths, chunksize=DEFAULT_CHUNKSIZE):
+    for path in paths:
+        yield from iter_table_chunks(path, chunksize, REPORT_COLUMNS, CATEGORY_DTYPES)
+
+
+def _keep_sample(sample, chunk, size, rng):
+    # Keep the `size` rows with the smallest random keys seen so far: a
+    # uniform sample without replacement of everything read
+    chunk = chunk.assign(_key=rng.random(len(chunk)))
+    if sample is not None:
+        chunk = pd.concat([sample, chunk], ignore_index=True)
+    return chunk.nsmallest(size, '_key') if len(chunk) > size else chunk
+
+
+def stream_employee_summary(paths, chunksize=DEFAULT_CHUNKSIZE, sample_size=DEFAULT_SAMPLE_ROWS, seed=0):
+    """EmployeeSummary of all rows in `paths`, and a uniform sample of the rows."""
+    rng = np.random.default_rng(seed)
+    departments = regions = frequencies = sample = None
+    for chunk in iter_employee_chunks(paths, chunksize):
+        chunk_departments, chunk_regions = group_sums(chunk)
+        chunk_frequencies = FrequencyIndex.from_frame(chunk)
+        if departments is None:
+            departments, regions = chunk_departments, chunk_regions
+            frequencies = chunk_frequencies
+        else:
+            departments = merge_sums(departments, chunk_departments)
+            regions = merge_sums(regions, chunk_regions)
+            frequencies = frequencies.merge(chunk_frequencies)
+        sample = _keep_sample(sample, chunk, sample_size, rng)
+    if departments is None:
+        raise ValueError(f"no employee rows in {', '.join(paths)}")
+    sample = sample.drop(columns='_key').reset_index(drop=True).astype(CATEGORY_DTYPES)
+    return finalize_summary(departments, regions, frequencies), sample
+
+
 # Sample dataset (100 employees)
 csv_data = """employee_id,department,region,performance_score,years_experience,satisfaction_rating
 EMP001,Operations,Africa,76.94,13,4.5
@@ -128,91 +414,169 @@ EMP100,Marketing,Asia,80.45,10,4.0"""
 # Email: 24f2000604@ds.study.iitm.ac.in
 
 # =============================================================================
-# Step 1: Load the employee data
+# Charts
 # =============================================================================
-print("=" * 60)
-print("Employee Performance Analysis")
-print("Author: 24f2000604@ds.study.iitm.ac.in")
-print("=" * 60)
+# Figures are drawn with the object-oriented Figure/Agg API rather than global
+# pyplot state, so the same functions can run in worker processes. Each one
+# returns a single chart encoded as `image_format` (see IMAGE_FORMATS, or
+# 'svg').
 
-df = pd.read_csv(StringIO(csv_data))
-print(f"\nDataset loaded successfully!")
-print(f"Total employees: {len(df)}")
-print(f"\nFirst 5 rows:")
-print(df.head())
+def _encode_chart(fig, image_format='png'):
+    buffer = BytesIO()
+    if image_format == 'svg':
+        # Fixed id salt and no date stamp: the same chart gives the same bytes
+        with matplotlib.rc_context({'svg.hashsalt': 'employee-report'}):
+            fig.savefig(buffer, format='svg', bbox_inches='tight', metadata={'Date': None})
+        return buffer.getvalue()
+    fig.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
+    if image_format == 'png':
+        return buffer.getvalue()
 
-# =============================================================================
-# Step 2: Calculate frequency count for "Marketing" department
-# =============================================================================
-# Contact: 24f2000604@ds.study.iitm.ac.in
+    image = Image.open(buffer)
+    encoded = BytesIO()
+    if image_format == 'optimized-png':
+        # Lossless: same pixels, smaller zlib stream
+        image.save(encoded, format='PNG', optimize=True)
+    else:
+        image.save(encoded, format='WEBP', lossless=True, method=6)
+    return encoded.getvalue()
+
+
+def department_chart(department_counts, highlight=DEFAULT_HIGHLIGHT, image_format='png'):
+    """Bar chart of employees per department with `highlight` outlined."""
+    with sns.axes_style("whitegrid"):
+        fig = Figure(figsize=(12, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+
+        # Create bar chart (histogram of categorical data)
+        colors = sns.color_palette("husl", len(department_counts))
+        sns.barplot(x=department_counts.index, y=department_counts.values, palette=colors, ax=ax)
+
+        # Add value labels on bars
+        for i, v in enumerate(department_counts.values):
+            ax.text(i, v + 0.5, str(v), ha='center', va='bottom', fontweight='bold', fontsize=12)
+
+        # Highlight the selected department's bar
+        if highlight in department_counts.index:
+            highlight_idx = department_counts.index.get_loc(highlight)
+            bars = ax.patches
+            bars[highlight_idx].set_edgecolor('red')
+            bars[highlight_idx].set_linewidth(3)
+
+        ax.set_title(f'Employee Distribution by Department\n({highlight} highlighted)', fontsize=16, fontweight='bold')
+        ax.set_xlabel('Department', fontsize=12)
+        ax.set_ylabel('Number of Employees', fontsize=12)
+        for label in ax.get_xticklabels():
+            label.set(rotation=45, ha='right')
+        fig.tight_layout()
+        return _encode_chart(fig, image_format)
+
+
+def performance_chart(df, image_format='png'):
+    """Box plot of performance scores per department."""
+    with sns.axes_style("whitegrid"):
+        fig = Figure(figsize=(12, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        sns.boxplot(x='department', y='performance_score', data=df, palette="husl", ax=ax)
+        ax.set_title('Performance Score Distribution by Department', fontsize=16, fontweight='bold')
+        ax.set_xlabel('Department', fontsize=12)
+        ax.set_ylabel('Performance Score', fontsize=12)
+        for label in ax.get_xticklabels():
+            label.set(rotation=45, ha='right')
+        fig.tight_layout()
+        return _encode_chart(fig, image_format)
 
-department_counts = df['department'].value_counts()
-marketing_count = department_counts.get('Marketing', 0)
 
-print(f"\n{'=' * 60}")
-print("DEPARTMENT FREQUENCY ANALYSIS")
-print(f"{'=' * 60}")
-print(f"\nFrequency count for 'Marketing' department: {marketing_count}")
-print(f"\nAll department counts:")
-print(department_counts)
+def render_charts(department_counts, df, highlight=DEFAULT_HIGHLIGHT, assets=None, executor=None):
+    """Encoded (department chart, performance chart); with an executor the two
+    figures are rendered as separate tasks."""
+    department_format, performance_format = (assets or AssetOptions()).chart_formats()
+    if executor is None:
+        return (department_chart(department_counts, highlight, department_format),
+                performance_chart(df, performance_format))
+    futures = [executor.submit(department_chart, department_counts, highlight, department_format),
+               executor.submit(performance_chart, df, performance_format)]
+    return tuple(future.result() for future in futures)
+
 
 # =============================================================================
-# Step 3: Create histogram showing department distribution
+# Chart Assets
 # =============================================================================
-# Author email: 24f2000604@ds.study.iitm.ac.in
-
-# Set style
-sns.set_style("whitegrid")
-plt.figure(figsize=(12, 6))
-
-# Create bar chart (histogram of categorical data)
-colors = sns.color_palette("husl", len(department_counts))
-ax = sns.barplot(x=department_counts.index, y=department_counts.values, palette=colors)
-
-# Add value labels on bars
-for i, v in enumerate(department_counts.values):
-    ax.text(i, v + 0.5, str(v), ha='center', va='bottom', fontweight='bold', fontsize=12)
-
-# Highlight Marketing bar
-marketing_idx = list(department_counts.index).index('Marketing')
-bars = ax.patches
-bars[marketing_idx].set_edgecolor('red')
-bars[marketing_idx].set_linewidth(3)
-
-plt.title('Employee Distribution by Department\n(Marketing highlighted)', fontsize=16, fontweight='bold')
-plt.xlabel('Department', fontsize=12)
-plt.ylabel('Number of Employees', fontsize=12)
-plt.xticks(rotation=45, ha='right')
-plt.tight_layout()
-
-# Save plot to base64 for HTML embedding
-buffer = BytesIO()
-plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-buffer.seek(0)
-plot_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-plt.close()
-
-# Create second visualization - Performance by Department
-plt.figure(figsize=(12, 6))
-sns.boxplot(x='department', y='performance_score', data=df, palette="husl")
-plt.title('Performance Score Distribution by Department', fontsize=16, fontweight='bold')
-plt.xlabel('Department', fontsize=12)
-plt.ylabel('Performance Score', fontsize=12)
-plt.xticks(rotation=45, ha='right')
-plt.tight_layout()
-
-buffer2 = BytesIO()
-plt.savefig(buffer2, format='png', dpi=150, bbox_inches='tight')
-buffer2.seek(0)
-plot2_base64 = base64.b64encode(buffer2.read()).decode('utf-8')
-plt.close()
+# 'inline' embeds the charts as base64 data URIs, which grows them by a third
+# and makes the browser parse the whole document before it can paint.
+# 'external' writes them to assets/ next to the page under content-hashed
+# names (safe to cache forever, shared between identical charts) and links
+# them with lazy-loaded <img> tags carrying their size.
+
+@dataclass
+class AssetOptions:
+    mode: str = 'inline'              # see ASSET_MODES
+    image_format: str = 'png'         # see IMAGE_FORMATS
+    svg_bar_chart: bool = False       # inline the bar chart as SVG markup
+
+    def chart_formats(self):
+        return ('svg' if self.svg_bar_chart else self.image_format), self.image_format
+
+
+def chart_markup(data, image_format, alt, name, html_dir=None):
+    """HTML for one encoded chart. With `html_dir` the image is written to
+    html_dir/assets/ and linked; otherwise it is embedded."""
+    if image_format == 'svg':
+        svg = data.decode('utf-8')
+        svg = svg[svg.index('<svg'):]
+        return svg.replace('<svg ', '<svg style="max-width: 100%; height: auto" ', 1)
+
+    mime, extension = IMAGE_TYPES[image_format]
+    if html_dir is None:
+        return f'<img src="data:{mime};base64,{base64.b64encode(data).decode("utf-8")}" alt="{alt}">'
+
+    filename = f'{name}-{hashlib.sha256(data).hexdigest()[:12]}{extension}'
+    path = os.path.join(html_dir, ASSETS_DIR, filename)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+    width, height = Image.open(BytesIO(data)).size
+    return (f'<img src="{ASSETS_DIR}/{filename}" alt="{alt}" width="{width}" height="{height}" '
+            f'loading="lazy" decoding="async">')
+
+
+def page_weight(html_path):
+    """(HTML bytes, bytes of the local images it links) for a written page.
+    The HTML alone has to arrive before the first paint; lazy images do not."""
+    with open(html_path, 'rb') as f:
+        html = f.read()
+    html_dir = os.path.dirname(html_path)
+    sources = set(re.findall(rb'<img src="(?!data:)([^"]+)"', html))
+    return len(html), sum(os.path.getsize(os.path.join(html_dir, src.decode())) for src in sources)
+
+
+def write_report(html_path, summary, charts, highlight=DEFAULT_HIGHLIGHT, assets=None):
+    """Write the report page (and, in external mode, its chart files)."""
+    assets = assets or AssetOptions()
+    html_dir = os.path.dirname(html_path) if assets.mode == 'external' else None
+    department_format, performance_format = assets.chart_formats()
+    department_markup = chart_markup(charts[0], department_format, 'Department Distribution Histogram',
+                                     'departments', html_dir)
+    performance_markup = chart_markup(charts[1], performance_format, 'Performance by Department',
+                                      'performance', html_dir)
+    with open(html_path, 'w') as f:
+        stream_report(f, summary, highlight, department_markup, performance_markup)
+    return html_path
+
 
 # =============================================================================
-# Step 4: Generate HTML file
+# HTML Report
 # =============================================================================
-# Email: 24f2000604@ds.study.iitm.ac.in
 
-html_content = f"""<!DOCTYPE html>
+# The page is a str.format-style template. compile_template() splits it once
+# into literal text (the skeleton and the inline CSS) and fields; rendering
+# then only formats the fields and writes every piece straight to the output
+# file or buffer, with the department rows streamed one by one.
+
+REPORT_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -363,32 +727,32 @@ html_content = f"""<!DOCTYPE html>
             <p>Analysis of employee performance data across multiple regions and departments.</p>
             <div class="stats-grid">
                 <div class="stat-card">
-                    <div class="value">{len(df)}</div>
+                    <div class="value">{total}</div>
                     <div class="label">Total Employees</div>
                 </div>
                 <div class="stat-card">
-                    <div class="value">{df['department'].nunique()}</div>
+                    <div class="value">{n_departments}</div>
                     <div class="label">Departments</div>
                 </div>
                 <div class="stat-card">
-                    <div class="value">{df['region'].nunique()}</div>
+                    <div class="value">{n_regions}</div>
                     <div class="label">Regions</div>
                 </div>
                 <div class="stat-card">
-                    <div class="value">{df['performance_score'].mean():.1f}</div>
+                    <div class="value">{avg_performance:.1f}</div>
                     <div class="label">Avg Performance</div>
                 </div>
             </div>
         </div>
 
         <div class="section">
-            <h2>🎯 Marketing Department Frequency</h2>
+            <h2>🎯 {highlight} Department Frequency</h2>
             <div class="highlight">
-                <div class="count">{marketing_count}</div>
-                <div class="label">Employees in Marketing Department</div>
+                <div class="count">{highlight_count}</div>
+                <div class="label">Employees in {highlight} Department</div>
             </div>
             <p style="text-align: center; color: #888;">
-                Marketing represents <strong>{(marketing_count/len(df)*100):.1f}%</strong> of total workforce
+                {highlight} represents <strong>{highlight_share:.1f}%</strong> of total workforce
             </p>
         </div>
 
@@ -404,7 +768,7 @@ html_content = f"""<!DOCTYPE html>
                     </tr>
                 </thead>
                 <tbody>
-                    {''.join(f"<tr><td>{dept}</td><td>{count}</td><td>{count/len(df)*100:.1f}%</td><td>{df[df['department']==dept]['performance_score'].mean():.2f}</td></tr>" for dept, count in department_counts.items())}
+                    {department_rows}
                 </tbody>
             </table>
         </div>
@@ -412,17 +776,17 @@ html_content = f"""<!DOCTYPE html>
         <div class="section">
             <h2>📊 Department Distribution Histogram</h2>
             <div class="chart-container">
-                <img src="data:image/png;base64,{plot_base64}" alt="Department Distribution Histogram">
+                {department_markup}
             </div>
             <p style="text-align: center; color: #888; margin-top: 15px;">
-                <em>Marketing department highlighted with red border</em>
+                <em>{highlight} department highlighted with red border</em>
             </p>
         </div>
 
         <div class="section">
             <h2>📉 Performance Score Distribution by Department</h2>
             <div class="chart-container">
-                <img src="data:image/png;base64,{plot2_base64}" alt="Performance by Department">
+                {performance_markup}
             </div>
         </div>
 
@@ -450,11 +814,13 @@ plt.show()</code></pre>
         <div class="section">
             <h2>📝 Key Findings</h2>
             <ul style="line-height: 2;">
-                <li><strong>Marketing Department:</strong> {marketing_count} employees ({(marketing_count/len(df)*100):.1f}% of workforce)</li>
-                <li><strong>Largest Department:</strong> {department_counts.index[0]} with {department_counts.values[0]} employees</li>
-                <li><strong>Smallest Department:</strong> {department_counts.index[-1]} with {department_counts.values[-1]} employees</li>
-                <li><strong>Highest Avg Performance:</strong> {df.groupby('department')['performance_score'].mean().idxmax()} ({df.groupby('department')['performance_score'].mean().max():.2f})</li>
-                <li><strong>Most Experienced Region:</strong> {df.groupby('region')['years_experience'].mean().idxmax()} (avg {df.groupby('region')['years_experience'].mean().max():.1f} years)</li>
+                <li><strong>{highlight} Department:</strong> {highlight_count} employees \
+({highlight_share:.1f}% of workforce)</li>
+                <li><strong>Largest Department:</strong> {largest_department} with {largest_count} employees</li>
+                <li><strong>Smallest Department:</strong> {smallest_department} with {smallest_count} employees</li>
+                <li><strong>Highest Avg Performance:</strong> {top_department} ({top_performance:.2f})</li>
+                <li><strong>Most Experienced Region:</strong> {most_experienced_region} \
+(avg {max_avg_experience:.1f} years)</li>
             </ul>
         </div>
 
@@ -467,14 +833,362 @@ plt.show()</code></pre>
 </body>
 </html>"""
 
-# Save HTML file
-html_path = 'employee_analysis.html'
-with open(html_path, 'w') as f:
-    f.write(html_content)
-
-print(f"\n{'=' * 60}")
-print("OUTPUT FILES GENERATED")
-print(f"{'=' * 60}")
-print(f"\nHTML file saved: {html_path}")
-print(f"\nAnalysis complete!")
-print(f"\nAuthor: 24f2000604@ds.study.iitm.ac.in")
+DEPARTMENT_ROW = "<tr><td>{}</td><td>{}</td><td>{:.1f}%</td><td>{:.2f}</td></tr>"
+
+
+@lru_cache(maxsize=None)
+def compile_template(template=REPORT_TEMPLATE):
+    """(literal text, field name, format spec) triples of a template."""
+    return tuple((literal, field, spec) for literal, field, spec, _ in Formatter().parse(template))
+
+
+def report_fields(summary, highlight, department_markup, performance_markup):
+    """Values of the REPORT_TEMPLATE fields; department_rows is an iterator."""
+    names, counts, percentages, performances = summary.department_lists
+    return {
+        'total': summary.total,
+        'n_departments': len(names),
+        'n_regions': len(summary.regions),
+        'avg_performance': summary.avg_performance,
+        'highlight': highlight,
+        'highlight_count': summary.department_count(highlight),
+        'highlight_share': summary.department_share(highlight),
+        'department_rows': map(DEPARTMENT_ROW.format, names, counts, percentages, performances),
+        'department_markup': department_markup,
+        'performance_markup': performance_markup,
+        'largest_department': names[0],
+        'largest_count': counts[0],
+        'smallest_department': names[-1],
+        'smallest_count': counts[-1],
+        'top_department': summary.top_department,
+        'top_performance': summary.top_performance,
+        'most_experienced_region': summary.most_experienced_region,
+        'max_avg_experience': summary.max_avg_experience,
+    }
+
+
+def stream_report(out, summary, highlight, department_markup, performance_markup,
+                  template=REPORT_TEMPLATE):
+    """Write the report page for `summary` to the text stream `out`."""
+    fields = report_fields(summary, highlight, department_markup, performance_markup)
+    write = out.write
+    for literal, field, spec in compile_template(template):
+        write(literal)
+        if field is None:
+            continue
+        value = fields[field]
+        if field == 'department_rows':
+            for row in value:
+                write(row)
+        else:
+            write(format(value, spec))
+
+
+def render_report(summary, highlight, department_markup, performance_markup):
+    """The report page for `summary` as a string; the charts are given as HTML markup."""
+    out = StringIO()
+    stream_report(out, summary, highlight, department_markup, performance_markup)
+    return out.getvalue()
+
+
+# =============================================================================
+# Report Cache
+# =============================================================================
+# Most units' data does not change between nightly runs. A report is keyed by
+# the SHA-256 of its input file together with everything that shapes the
+# output (highlight, asset options, box plot sample, template, CACHE_VERSION);
+# a matching entry supplies the summary, the encoded charts and the HTML
+# without reading the data or drawing anything.
+
+def report_key(path, highlight=DEFAULT_HIGHLIGHT, assets=None, sample_size=DEFAULT_SAMPLE_ROWS, seed=0):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    config = (CACHE_VERSION, highlight, astuple(assets or AssetOptions()), sample_size, seed,
+              hashlib.sha256(REPORT_TEMPLATE.encode()).hexdigest())
+    digest.update(repr(config).encode())
+    return digest.hexdigest()
+
+
+class ReportCache:
+    """On-disk cache of rendered reports, one pickle file per key.
+
+    Entries are evicted least recently used first (a hit refreshes the file's
+    mtime) once there are more than `max_entries` of them or they take more
+    than `max_bytes` together.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_CACHE_MB * 2**20, max_entries=DEFAULT_CACHE_ENTRIES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f'{key}.pkl')
+
+    def get(self, key):
+        """The cached (summary, charts, html) for `key`, or None."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return None
+        os.utime(path)
+        self.hits += 1
+        return entry
+
+    def put(self, key, summary, charts, html):
+        path = self._path(key)
+        # Write then rename, so a crash never leaves a truncated entry behind
+        with open(path + '.tmp', 'wb') as f:
+            pickle.dump((summary, charts, html), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + '.tmp', path)
+
+    def evict(self):
+        """Drop least recently used entries until within both limits."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pkl'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        while entries and (len(entries) > self.max_entries or total > self.max_bytes):
+            _, size, path = entries.pop(0)
+            os.remove(path)
+            total -= size
+            evicted += 1
+        return evicted
+
+
+# =============================================================================
+# Batch Reports
+# =============================================================================
+# One report per business unit, where every input file is one unit. Units are
+# summarized one after the other in this process; their charts are rendered
+# in a process pool, one task per figure per unit. With a ReportCache, units
+# whose data and configuration are unchanged are copied from the cache.
+
+def report_names(paths):
+    """The <unit> of every input's <unit>.html report, from its file name.
+
+    Raises ValueError when two different inputs would write the same report,
+    e.g. a/data.csv and b/data.csv.
+    """
+    names = [os.path.splitext(os.path.basename(path))[0] for path in paths]
+    seen = {}
+    for path, name in zip(paths, names):
+        other = seen.setdefault(name, path)
+        if os.path.abspath(other) != os.path.abspath(path):
+            raise ValueError(f"{other} and {path} would both be written to {name}.html; rename one of them")
+    return names
+
+
+def generate_reports(paths, output_dir='reports', highlight=DEFAULT_HIGHLIGHT, jobs=1,
+                     chunksize=DEFAULT_CHUNKSIZE, sample_size=DEFAULT_SAMPLE_ROWS, seed=0, assets=None,
+                     cache=None):
+    """Write <output_dir>/<unit>.html for every file in `paths`; returns the
+    paths written."""
+    units = dict(zip(paths, report_names(paths)))
+    assets = assets or AssetOptions()
+    os.makedirs(output_dir, exist_ok=True)
+    executor = None
+    try:
+        pending = []
+        for path in paths:
+            key = entry = None
+            if cache is not None:
+                key = report_key(path, highlight, assets, sample_size, seed)
+                entry = cache.get(key)
+            if entry is not None:
+                pending.append((path, key, entry))
+                continue
+
+            summary, sample = stream_employee_summary([path], chunksize, sample_size, seed)
+            department_counts = summary.departments['count']
+            if jobs <= 1:
+                charts = render_charts(department_counts, sample, highlight, assets)
+            else:
+                # Started on the first miss only: a fully cached run needs no pool
+                executor = executor or ProcessPoolExecutor(jobs)
+                department_format, performance_format = assets.chart_formats()
+                charts = [executor.submit(department_chart, department_counts, highlight, department_format),
+                          executor.submit(performance_chart, sample, performance_format)]
+            pending.append((path, key, (summary, charts, None)))
+
+        written = []
+        for path, key, (summary, charts, html) in pending:
+            charts = [chart if isinstance(chart, bytes) else chart.result() for chart in charts]
+            html_path = os.path.join(output_dir, f'{units[path]}.html')
+            if html is None:
+                write_report(html_path, summary, charts, highlight, assets)
+                if cache is not None:
+                    with open(html_path) as f:
+                        cache.put(key, summary, charts, f.read())
+            else:
+                with open(html_path, 'w') as f:
+                    f.write(html)
+                if assets.mode == 'external':
+                    # Restore the hashed chart files the cached page links to
+                    formats = assets.chart_formats()
+                    for chart, image_format, name in zip(charts, formats, ('departments', 'performance')):
+                        chart_markup(chart, image_format, '', name, output_dir)
+            written.append(html_path)
+        if cache is not None:
+            cache.evict()
+        return written
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Employee performance analysis HTML report')
+    parser.add_argument('--input', nargs='+', metavar='PATH',
+                        help='CSV/Parquet/Arrow files or glob patterns to stream instead of '
+                             'the built-in 100-employee sample')
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+                        help='rows per chunk when streaming --input (default: %(default)s)')
+    parser.add_argument('--sample', type=int, default=DEFAULT_SAMPLE_ROWS,
+                        help='rows kept for the performance box plot when streaming '
+                             '(default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the box plot sample (default: %(default)s)')
+    parser.add_argument('--highlight', metavar='DEPARTMENT', default=DEFAULT_HIGHLIGHT,
+                        help='department highlighted in the chart and report (default: %(default)s)')
+    parser.add_argument('--breakdown', action='store_true',
+                        help='also print department counts by region and by tenure band')
+    parser.add_argument('--assets', choices=ASSET_MODES, default='inline',
+                        help="'external' writes the charts to assets/ with hashed names and "
+                             "lazy <img> tags (default: %(default)s)")
+    parser.add_argument('--image-format', choices=IMAGE_FORMATS, default='png',
+                        help='chart encoding (default: %(default)s)')
+    parser.add_argument('--svg-bar-chart', action='store_true',
+                        help='inline the department bar chart as SVG')
+    parser.add_argument('--batch', action='store_true',
+                        help='write one report per --input file (business unit) into --output-dir')
+    parser.add_argument('--output-dir', metavar='DIR', default='reports',
+                        help='directory of the --batch reports (default: %(default)s)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='processes rendering --batch charts (default: %(default)s)')
+    parser.add_argument('--cache-dir', metavar='DIR',
+                        help='reuse --batch reports whose input and options are unchanged, '
+                             'cached in DIR')
+    parser.add_argument('--cache-size', type=int, metavar='MB', default=DEFAULT_CACHE_MB,
+                        help='evict least recently used cache entries beyond this size '
+                             '(default: %(default)s)')
+    parser.add_argument('--cache-entries', type=int, default=DEFAULT_CACHE_ENTRIES,
+                        help='maximum number of cache entries (default: %(default)s)')
+    args = parser.parse_args(argv)
+    if args.batch and not args.input:
+        parser.error('--batch needs --input files, one per business unit')
+    if args.input:
+        try:
+            args.input = expand_inputs(args.input)
+        except FileNotFoundError as exc:
+            parser.error(str(exc))
+    if args.batch:
+        try:
+            report_names(args.input)
+        except ValueError as exc:
+            parser.error(str(exc))
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # =============================================================================
+    # Step 1: Load the employee data
+    # =============================================================================
+    print("=" * 60)
+    print("Employee Performance Analysis")
+    print("Author: 24f2000604@ds.study.iitm.ac.in")
+    print("=" * 60)
+
+    assets = AssetOptions(args.assets, args.image_format, args.svg_bar_chart)
+    if args.batch:
+        cache = None
+        if args.cache_dir:
+            cache = ReportCache(args.cache_dir, args.cache_size * 2**20, args.cache_entries)
+        start = time.perf_counter()
+        written = generate_reports(args.input, args.output_dir, args.highlight, args.jobs,
+                                   args.chunksize, args.sample, args.seed, assets, cache)
+        elapsed = time.perf_counter() - start
+        print(f"\n{len(written)} reports saved to {args.output_dir}/ "
+              f"in {elapsed:.1f} s ({args.jobs} job(s))")
+        if cache is not None:
+            print(f"Cache: {cache.hits} reused, {cache.misses} rendered")
+        return
+
+    if args.input:
+        # Streaming mode: only the running sums and a bounded sample are kept
+        summary, df = stream_employee_summary(args.input, args.chunksize, args.sample, args.seed)
+        print(f"\nDataset streamed from {len(args.input)} file(s)")
+        print(f"Total employees: {summary.total:,}")
+        print(f"\nSample rows:")
+    else:
+        df = pd.read_csv(StringIO(csv_data))
+        summary = summarize_employees(df)
+        print(f"\nDataset loaded successfully!")
+        print(f"Total employees: {len(df)}")
+        print(f"\nFirst 5 rows:")
+    print(df.head())
+
+    # =============================================================================
+    # Step 2: Calculate frequency count for the highlighted department
+    # =============================================================================
+    # Contact: 24f2000604@ds.study.iitm.ac.in
+
+    department_counts = summary.departments['count']
+    highlight = args.highlight
+    highlight_count = summary.department_count(highlight)
+    highlight_share = summary.department_share(highlight)
+
+    print(f"\n{'=' * 60}")
+    print("DEPARTMENT FREQUENCY ANALYSIS")
+    print(f"{'=' * 60}")
+    print(f"\nFrequency count for '{highlight}' department: {highlight_count}")
+    print(f"\nAll department counts:")
+    print(department_counts)
+    if args.breakdown:
+        print(f"\nEmployees by department and region:")
+        print(summary.frequencies.table('department', 'region'))
+        print(f"\nEmployees by department and tenure band:")
+        print(summary.frequencies.table('department', 'tenure'))
+
+    # =============================================================================
+    # Step 3: Create histogram showing department distribution
+    # =============================================================================
+    # Author email: 24f2000604@ds.study.iitm.ac.in
+
+    charts = render_charts(department_counts, df, highlight, assets)
+
+    # =============================================================================
+    # Step 4: Generate HTML file
+    # =============================================================================
+    # Email: 24f2000604@ds.study.iitm.ac.in
+
+    # Save HTML file (and the chart files in external asset mode)
+    html_path = write_report('employee_analysis.html', summary, charts, highlight, assets)
+    html_bytes, image_bytes = page_weight(html_path)
+
+    print(f"\n{'=' * 60}")
+    print("OUTPUT FILES GENERATED")
+    print(f"{'=' * 60}")
+    print(f"\nHTML file saved: {html_path}")
+    print(f"Page weight: {(html_bytes + image_bytes) / 1024:.1f} KB "
+          f"(HTML {html_bytes / 1024:.1f} KB, linked images {image_bytes / 1024:.1f} KB)")
+    print(f"\nAnalysis complete!")
+    print(f"\nAuthor: 24f2000604@ds.study.iitm.ac.in")
+
+
+if __name__ == "__main__":
+    main()
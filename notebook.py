@@ -107,55 +107,93 @@ def cell_sliders(mo):
 
 
 # ============================================================================
-# Cell 3: Generate Data Based on Slider Values
+# Cell 3: Memoized Data Generator
 # ============================================================================
-# Data Flow: This cell DEPENDS on sample_size, noise_level, correlation
-# from cell_sliders. When any slider changes, this cell re-executes.
-# Outputs: x, y arrays and stats used by visualization cell
+# Data Flow: No dependencies, so marimo runs this cell once and its cache
+# survives every slider change.
+# Outputs: generate_data, a bounded LRU cache keyed on
+# (sample_size, noise_level, correlation)
 # ============================================================================
 @app.cell
-def cell_generate_data(sample_size, noise_level, correlation):
+def cell_data_cache():
     # Contact: 24f2000604@ds.study.iitm.ac.in
+    import functools
+
     import numpy as np
 
-    # Set seed for reproducibility
-    np.random.seed(42)
+    # Slider positions kept; scrubbing back to any of them is instant
+    DATA_CACHE_SIZE = 256
+
+    @functools.lru_cache(maxsize=DATA_CACHE_SIZE)
+    def generate_data(n, sigma, r):
+        """x, y and their statistics for one slider setting.
+
+        Each call draws from its own Generator seeded with 42, so a cached
+        result is exactly what recomputing it would give. The arrays are
+        read-only because every hit returns the same objects.
+        """
+        rng = np.random.default_rng(42)
+
+        # Generate x values based on sample_size slider
+        x = np.linspace(0, 10, n)
+
+        # Generate y with correlation and noise based on sliders
+        # y = r * x + noise, where r is correlation, noise is scaled by noise_level
+        noise = rng.normal(0, sigma, n)
+        y = r * x + noise
+
+        # Calculate statistics
+        mean_x = np.mean(x)
+        mean_y = np.mean(y)
+        std_x = np.std(x)
+        std_y = np.std(y)
+
+        # Calculate actual correlation coefficient
+        if std_x > 0 and std_y > 0:
+            actual_corr = np.corrcoef(x, y)[0, 1]
+        else:
+            actual_corr = 0.0
+
+        x.flags.writeable = False
+        y.flags.writeable = False
+        return x, y, mean_x, mean_y, std_x, std_y, actual_corr
+
+    return (generate_data,)
 
-    # Generate x values based on sample_size slider
+
+# ============================================================================
+# Cell 4: Generate Data Based on Slider Values
+# ============================================================================
+# Data Flow: This cell DEPENDS on sample_size, noise_level, correlation
+# from cell_sliders. When any slider changes, this cell re-executes and
+# looks the values up in generate_data, computing them only on a miss.
+# Outputs: x, y arrays, stats and the cache hit rate used by downstream cells
+# ============================================================================
+@app.cell
+def cell_generate_data(sample_size, noise_level, correlation, generate_data):
+    # Contact: 24f2000604@ds.study.iitm.ac.in
     n = sample_size.value
-    x = np.linspace(0, 10, n)
-
-    # Generate y with correlation and noise based on sliders
-    # y = r * x + noise, where r is correlation, noise is scaled by noise_level
-    r = correlation.value
-    sigma = noise_level.value
-    noise = np.random.normal(0, sigma, n)
-    y = r * x + noise
-
-    # Calculate statistics
-    mean_x = np.mean(x)
-    mean_y = np.mean(y)
-    std_x = np.std(x)
-    std_y = np.std(y)
-
-    # Calculate actual correlation coefficient
-    if std_x > 0 and std_y > 0:
-        actual_corr = np.corrcoef(x, y)[0, 1]
-    else:
-        actual_corr = 0.0
+    x, y, mean_x, mean_y, std_x, std_y, actual_corr = generate_data(
+        n, noise_level.value, correlation.value
+    )
 
-    return actual_corr, mean_x, mean_y, n, std_x, std_y, x, y
+    # Share of slider changes answered from the cache
+    cache_info = generate_data.cache_info()
+    cache_hit_rate = cache_info.hits / max(cache_info.hits + cache_info.misses, 1)
+
+    return actual_corr, cache_hit_rate, cache_info, mean_x, mean_y, n, std_x, std_y, x, y
 
 
 # ============================================================================
-# Cell 4: Dynamic Markdown Output Based on Widget State
+# Cell 5: Dynamic Markdown Output Based on Widget State
 # ============================================================================
 # Data Flow: DEPENDS on all outputs from cell_generate_data
 # This cell updates automatically when sliders change.
 # Demonstrates dynamic markdown with computed values.
 # ============================================================================
 @app.cell
-def cell_dynamic_output(mo, actual_corr, mean_x, mean_y, n, std_x, std_y, sample_size, noise_level, correlation):
+def cell_dynamic_output(mo, actual_corr, mean_x, mean_y, n, std_x, std_y, sample_size, noise_level, correlation,
+                        cache_hit_rate, cache_info):
     # Author email: 24f2000604@ds.study.iitm.ac.in
 
     # Determine correlation strength description
@@ -185,6 +223,7 @@ def cell_dynamic_output(mo, actual_corr, mean_x, mean_y, n, std_x, std_y, sample
         | Mean(Y) | {mean_y:.2f} |
         | Std(X) | {std_x:.2f} |
         | Std(Y) | {std_y:.2f} |
+        | Cache Hit Rate | {cache_hit_rate:.0%} ({cache_info.hits}/{cache_info.hits + cache_info.misses}) |
 
         ### Correlation Strength: {strength}
 
@@ -201,7 +240,7 @@ def cell_dynamic_output(mo, actual_corr, mean_x, mean_y, n, std_x, std_y, sample
 
 
 # ============================================================================
-# Cell 5: Visual Indicator with Dynamic Bars
+# Cell 6: Visual Indicator with Dynamic Bars
 # ============================================================================
 # Data Flow: DEPENDS on sample_size slider
 # Shows a visual bar that grows/shrinks with sample size
@@ -228,7 +267,7 @@ def cell_visual_indicator(mo, sample_size, noise_level):
 
 
 # ============================================================================
-# Cell 6: Data Table Display
+# Cell 7: Data Table Display
 # ============================================================================
 # Data Flow: DEPENDS on x, y arrays from cell_generate_data
 # Displays first few rows of generated data
@@ -265,7 +304,7 @@ def cell_show_table(df):
 
 
 # ============================================================================
-# Cell 7: Footer with Contact Info
+# Cell 8: Footer with Contact Info
 # ============================================================================
 # Data Flow: Final cell, no outputs consumed by other cells
 # ============================================================================
@@ -288,11 +327,11 @@ def cell_footer(mo):
         cell_introduction
               │
               ▼
-        cell_sliders ──────────────────┐
-              │                        │
-              ▼                        ▼
-        cell_generate_data      cell_visual_indicator
-              │
+        cell_sliders ─────────────────────────────────────┐
+              │                                           │
+              ▼                                           ▼
+        cell_generate_data ◄── cell_data_cache     cell_visual_indicator
+              │                (runs once)
               ▼
         cell_dynamic_output
               │
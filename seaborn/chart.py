@@ -10,141 +10,463 @@
 # 1. Generates realistic synthetic customer purchase data
 # 2. Creates a professional Seaborn boxplot
 # 3. Saves chart as 512x512 PNG
+#
+# Usage:
+#   python chart.py                                  # published 380-row sample
+#   python chart.py --rows 100000000 --output purchases.parquet --chunksize 5000000
+#   python chart.py --input purchases.parquet --sketch-error 0.001   # plot without loading it
+
+import argparse
+import math
+import os
+import sys
+from colorsys import rgb_to_hls
 
 import seaborn as sns
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
+from matplotlib.colors import to_rgb
 
-# Author: 24f2000604@ds.study.iitm.ac.in
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from data_io import TableWriter, iter_table_chunks  # noqa: E402
 
-print("=" * 60)
-print("Customer Analytics: Purchase Amount Distribution")
-print("Author: 24f2000604@ds.study.iitm.ac.in")
-print("=" * 60)
-
-# =============================================================================
-# Step 1: Generate Realistic Synthetic Data
-# =============================================================================
-# Email: 24f2000604@ds.study.iitm.ac.in
-
-np.random.seed(42)
+# Author: 24f2000604@ds.study.iitm.ac.in
 
 # Define customer segments with realistic spending patterns
-segments = {
+SEGMENTS = {
     'Budget': {'mean': 45, 'std': 20, 'n': 80},
     'Regular': {'mean': 120, 'std': 40, 'n': 150},
     'Premium': {'mean': 280, 'std': 80, 'n': 100},
     'VIP': {'mean': 550, 'std': 150, 'n': 50}
 }
+# Order segments logically
+SEGMENT_ORDER = ['Budget', 'Regular', 'Premium', 'VIP']
+DEFAULT_CHUNKSIZE = 1_000_000
+DEFAULT_SKETCH_ERROR = 0.005
+DEFAULT_MAX_FLIERS = 200
+# Define professional color palette
+COLORS = ['#3498db', '#2ecc71', '#f39c12', '#e74c3c']
 
-# Generate data for each segment
-data = []
-for segment, params in segments.items():
-    purchases = np.random.normal(params['mean'], params['std'], params['n'])
-    purchases = np.clip(purchases, 10, 1000)  # Realistic bounds
-    for amount in purchases:
-        data.append({'Customer_Segment': segment, 'Purchase_Amount': round(amount, 2)})
+# =============================================================================
+# Synthetic Purchases
+# =============================================================================
+# Each segment's amounts are drawn as one array and the segment column is
+# built from codes with np.repeat, so no per-row Python objects are created.
 
-df = pd.DataFrame(data)
+def segment_sizes(n_rows=None):
+    """Rows per segment: the published sizes, or n_rows split in the same
+    proportions."""
+    sizes = np.array([SEGMENTS[segment]['n'] for segment in SEGMENT_ORDER])
+    if n_rows is None:
+        return sizes
+    scaled = np.floor(sizes / sizes.sum() * n_rows).astype(np.int64)
+    scaled[np.argsort(-(sizes / sizes.sum() * n_rows - scaled))[:n_rows - scaled.sum()]] += 1
+    return scaled
 
-# Order segments logically
-segment_order = ['Budget', 'Regular', 'Premium', 'VIP']
-df['Customer_Segment'] = pd.Categorical(df['Customer_Segment'], categories=segment_order, ordered=True)
 
-print(f"\nDataset generated: {len(df)} customer transactions")
-print(f"\nSegment distribution:")
-print(df['Customer_Segment'].value_counts().sort_index())
-print(f"\nPurchase Amount Statistics by Segment:")
-print(df.groupby('Customer_Segment')['Purchase_Amount'].describe().round(2))
+def _purchase_frame(normal, sizes):
+    """Purchases for `sizes[i]` customers of SEGMENT_ORDER[i], drawn segment by
+    segment from `normal(loc, scale, size)`."""
+    amounts = [np.clip(normal(SEGMENTS[segment]['mean'], SEGMENTS[segment]['std'], size), 10, 1000)  # Realistic bounds
+               for segment, size in zip(SEGMENT_ORDER, sizes)]
+    codes = np.repeat(np.arange(len(SEGMENT_ORDER), dtype=np.int8), sizes)
+    return pd.DataFrame({
+        'Customer_Segment': pd.Categorical.from_codes(codes, categories=SEGMENT_ORDER, ordered=True),
+        'Purchase_Amount': np.round(np.concatenate(amounts), 2),
+    })
 
-# =============================================================================
-# Step 2: Create Professional Seaborn Boxplot
-# =============================================================================
-# Contact: 24f2000604@ds.study.iitm.ac.in
 
-# Set professional style
-sns.set_style("whitegrid")
-sns.set_context("talk", font_scale=0.9)
+def generate_purchases(sizes=None, seed=42):
+    """The published customer sample (or `sizes` customers per segment).
 
-# Create figure with exact size for 512x512 output
-fig, ax = plt.subplots(figsize=(8, 8))
+    A private legacy RandomState reproduces the original np.random.seed(42)
+    draws exactly without reseeding NumPy's global RNG.
+    """
+    return _purchase_frame(np.random.RandomState(seed).normal, segment_sizes() if sizes is None else sizes)
 
-# Define professional color palette
-colors = ['#3498db', '#2ecc71', '#f39c12', '#e74c3c']
-
-# Create boxplot
-sns.boxplot(
-    data=df,
-    x='Customer_Segment',
-    y='Purchase_Amount',
-    hue='Customer_Segment',
-    palette=colors,
-    order=segment_order,
-    width=0.6,
-    linewidth=2,
-    fliersize=5,
-    legend=False,
-    ax=ax
-)
-
-# Styling
-ax.set_title('Purchase Amount Distribution\nby Customer Segment', 
-             fontsize=16, fontweight='bold', pad=20)
-ax.set_xlabel('Customer Segment', fontsize=14, fontweight='bold')
-ax.set_ylabel('Purchase Amount ($)', fontsize=14, fontweight='bold')
-
-# Add grid for readability
-ax.yaxis.grid(True, linestyle='--', alpha=0.7)
-ax.set_axisbelow(True)
-
-# Format y-axis as currency
-ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-
-# Add median labels on boxes
-medians = df.groupby('Customer_Segment')['Purchase_Amount'].median()
-for i, segment in enumerate(segment_order):
-    median_val = medians[segment]
-    ax.annotate(f'${median_val:.0f}', 
-                xy=(i, median_val), 
-                xytext=(0, 10),
-                textcoords='offset points',
-                ha='center', va='bottom',
-                fontsize=10, fontweight='bold',
-                color='white',
-                bbox=dict(boxstyle='round,pad=0.3', facecolor=colors[i], alpha=0.8))
-
-# Add author email
-plt.figtext(0.5, 0.02, '24f2000604@ds.study.iitm.ac.in', 
-            ha='center', fontsize=9, style='italic', color='gray')
-
-plt.tight_layout()
 
-# =============================================================================
-# Step 3: Save Chart as 512x512 PNG
-# =============================================================================
-# Author email: 24f2000604@ds.study.iitm.ac.in
+def iter_purchase_chunks(sizes, chunksize=DEFAULT_CHUNKSIZE, seed=42):
+    """Yield the purchases of `sizes` customers per segment as DataFrames of
+    at most `chunksize` rows, in segment order.
+
+    Each chunk draws from its own numpy.random.Generator spawned from one
+    SeedSequence, so output is reproducible for a given (seed, chunksize).
+    """
+    bounds = np.concatenate([[0], np.cumsum(sizes)])
+    n_rows = int(bounds[-1])
+    n_chunks = -(-n_rows // chunksize)
+    for index, child in enumerate(np.random.SeedSequence(seed).spawn(n_chunks)):
+        start, stop = index * chunksize, min((index + 1) * chunksize, n_rows)
+        # Rows of every segment that fall inside [start, stop)
+        counts = np.clip(bounds[1:], start, stop) - np.clip(bounds[:-1], start, stop)
+        yield _purchase_frame(np.random.default_rng(child).normal, counts)
 
-# Save with dpi=64 for 512x512 (8*64=512)
-plt.savefig('chart.png', dpi=64, bbox_inches='tight', 
-            facecolor='white', edgecolor='none')
-print(f"\nChart saved: chart.png (512x512 pixels)")
 
-plt.close()
+def write_purchases(path, sizes, chunksize=DEFAULT_CHUNKSIZE, seed=42):
+    """Generate purchases straight to a CSV, Parquet or Arrow file, one chunk
+    in memory at a time. Returns the path written (see data_io)."""
+    with TableWriter(path) as writer:
+        for chunk in iter_purchase_chunks(sizes, chunksize, seed):
+            writer.write(chunk)
+    return writer.path
+
 
 # =============================================================================
-# Step 4: Summary
+# Streaming Box Statistics
 # =============================================================================
-# Email: 24f2000604@ds.study.iitm.ac.in
+# sns.boxplot needs every Purchase_Amount in memory. The sketch path reads the
+# data once, chunk by chunk, keeping per segment: exact count/mean/std/min/max,
+# a KLL quantile sketch for the quartiles and whiskers, and the most extreme
+# values for the outliers. The boxes are then drawn from those statistics with
+# Axes.bxp, the same call seaborn makes internally.
+
+class QuantileSketch:
+    """KLL quantile sketch over float values.
+
+    Keeps O(k) values in levels of compactors (a value at level h stands for
+    2**h inputs). Quantiles are within about `error` in rank of the exact
+    ones, with k chosen by k_for_error().
+    """
+
+    def __init__(self, k=200, seed=0):
+        self.k = k
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @staticmethod
+    def k_for_error(error):
+        # Empirical normalized rank error of KLL: ~2.296 / k**0.9723
+        return max(8, math.ceil((2.296 / error) ** (1 / 0.9723)))
+
+    def _capacity(self, level):
+        return max(2, math.ceil(self.k * (2 / 3) ** (len(self.levels) - 1 - level)))
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        self.count += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        level = 0
+        while level < len(self.levels):
+            if len(self.levels[level]) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                # Compact: sort, keep every other value (random offset) at
+                # twice the weight one level up; an odd one out stays here
+                items = np.sort(self.levels[level])
+                odd = len(items) % 2
+                self.levels[level] = items[:odd]
+                promoted = items[odd + self._rng.integers(2)::2]
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def values(self):
+        """All retained values (each stands for 2**level inputs)."""
+        return np.concatenate(self.levels)
+
+    def quantiles(self, qs):
+        """Quantiles interpolated between neighbouring ranks like np.quantile's
+        default (linear) method; exact while nothing has been compacted."""
+        values = self.values()
+        weights = np.concatenate([np.full(len(items), 2 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        values = values[order]
+        cumulative = np.cumsum(weights[order])
+        # The value of rank r (0-based) is the first one whose cumulative weight exceeds r
+        position = np.asarray(qs, dtype=float) * (cumulative[-1] - 1)
+        below = np.floor(position)
+        low = values[np.searchsorted(cumulative, below, side='right')]
+        high = values[np.minimum(np.searchsorted(cumulative, below + 1, side='right'), len(values) - 1)]
+        return low + (position - below) * (high - low)
+
+
+class SegmentStats:
+    """One-pass statistics of one segment's purchase amounts."""
+
+    def __init__(self, error=DEFAULT_SKETCH_ERROR, max_fliers=DEFAULT_MAX_FLIERS):
+        self.sketch = QuantileSketch(QuantileSketch.k_for_error(error))
+        self.max_fliers = max_fliers
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.lowest = np.empty(0)     # the max_fliers smallest values seen
+        self.highest = np.empty(0)    # the max_fliers largest values seen
+
+    def update(self, values):
+        if not len(values):
+            return
+        n = len(values)
+        mean = values.mean()
+        # Chan et al. merge of (count, mean, M2)
+        delta = mean - self.mean
+        total = self.count + n
+        self.m2 += ((values - mean) ** 2).sum() + delta ** 2 * self.count * n / total
+        self.mean += delta * n / total
+        self.count = total
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self.sketch.update(values)
+
+        keep = self.max_fliers
+        if keep < 1:
+            return
+        lowest = np.concatenate([self.lowest, values])
+        self.lowest = np.partition(lowest, keep - 1)[:keep] if len(lowest) > keep else lowest
+        highest = np.concatenate([self.highest, values])
+        self.highest = np.partition(highest, len(highest) - keep)[-keep:] if len(highest) > keep else highest
+
+    def describe(self):
+        q1, median, q3 = self.sketch.quantiles([0.25, 0.5, 0.75])
+        std = math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+        return {'count': float(self.count), 'mean': self.mean, 'std': std, 'min': self.min,
+                '25%': q1, '50%': median, '75%': q3, 'max': self.max}
+
+    def box_stats(self, label, whis=1.5):
+        """Statistics for Axes.bxp, with whiskers at the most extreme values
+        within whis * IQR of the box (as matplotlib and seaborn draw them)."""
+        q1, median, q3 = self.sketch.quantiles([0.25, 0.5, 0.75])
+        low, high = q1 - whis * (q3 - q1), q3 + whis * (q3 - q1)
+        candidates = np.unique(np.concatenate([self.lowest, self.highest, self.sketch.values()]))
+        inside = candidates[(candidates >= low) & (candidates <= high)]
+        fliers = candidates[(candidates < low) | (candidates > high)]
+        if len(fliers) > self.max_fliers:
+            # Capped, evenly spread over the outliers, extremes included
+            fliers = fliers[np.linspace(0, len(fliers) - 1, self.max_fliers).round().astype(int)]
+        return {
+            'label': label, 'med': median, 'q1': q1, 'q3': q3, 'mean': self.mean,
+            'whislo': inside.min() if len(inside) else q1,
+            'whishi': inside.max() if len(inside) else q3,
+            'fliers': fliers,
+        }
+
+
+def stream_segment_stats(chunks, error=DEFAULT_SKETCH_ERROR, max_fliers=DEFAULT_MAX_FLIERS):
+    """SegmentStats per entry of SEGMENT_ORDER from one pass over `chunks`."""
+    stats = {segment: SegmentStats(error, max_fliers) for segment in SEGMENT_ORDER}
+    for chunk in chunks:
+        segments = pd.Categorical(chunk['Customer_Segment'], categories=SEGMENT_ORDER)
+        codes = segments.codes
+        # One stable sort groups the chunk by segment without a mask per segment
+        order = np.argsort(codes, kind='stable')
+        amounts = chunk['Purchase_Amount'].to_numpy(dtype=float)[order]
+        counts = np.bincount(codes[codes >= 0], minlength=len(SEGMENT_ORDER))
+        start = int(np.sum(codes < 0))
+        for segment, count in zip(SEGMENT_ORDER, counts):
+            stats[segment].update(amounts[start:start + count])
+            start += count
+    return stats
+
+
+def iter_purchase_file(path, chunksize=DEFAULT_CHUNKSIZE):
+    return iter_table_chunks(path, chunksize, ['Customer_Segment', 'Purchase_Amount'])
+
+
+def draw_box_stats(ax, box_stats, colors=COLORS, width=0.6, linewidth=2, fliersize=5):
+    """Draw precomputed box statistics the way sns.boxplot styles them."""
+    # seaborn's automatic line color: a gray at 60% of the darkest fill's lightness
+    gray = min(rgb_to_hls(*to_rgb(color))[1] for color in colors) * .6
+    linecolor = (gray, gray, gray)
+    positions = range(len(box_stats))
+    artists = ax.bxp(
+        box_stats, positions=positions, widths=width, capwidths=width / 2,
+        patch_artist=True, manage_ticks=False,
+        boxprops={'edgecolor': linecolor, 'linewidth': linewidth},
+        medianprops={'color': linecolor, 'linewidth': linewidth, 'solid_capstyle': 'butt'},
+        whiskerprops={'color': linecolor, 'linewidth': linewidth, 'solid_capstyle': 'butt'},
+        capprops={'color': linecolor, 'linewidth': linewidth},
+        flierprops={'markeredgecolor': linecolor, 'markersize': fliersize},
+    )
+    for box, color in zip(artists['boxes'], colors):
+        # sns.boxplot fills with the palette at saturation 0.75
+        box.set_facecolor(sns.desaturate(color, 0.75))
+    ax.set_xticks(list(positions), [stats['label'] for stats in box_stats])
+    ax.set_xlim(-0.5, len(box_stats) - 0.5)
+    ax.xaxis.grid(False)
+    return artists
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Purchase amount distribution by customer segment')
+    parser.add_argument('--rows', type=int,
+                        help='generate ROWS purchases (split like the sample) instead of the 380-row sample')
+    parser.add_argument('--output', metavar='PATH',
+                        help='write the generated purchases to a .csv/.parquet/.arrow file and exit')
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+                        help='rows generated per chunk with --rows (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=42,
+                        help='random seed (default: %(default)s)')
+    parser.add_argument('--input', metavar='PATH',
+                        help='stream purchases from a .csv/.parquet/.arrow file (implies --boxplot sketch)')
+    parser.add_argument('--boxplot', choices=['seaborn', 'sketch'], default='seaborn',
+                        help="'sketch' computes the box statistics in one streaming pass "
+                             "instead of holding the data (default: %(default)s)")
+    parser.add_argument('--sketch-error', type=float, default=DEFAULT_SKETCH_ERROR,
+                        help='rank error of the quantile sketch (default: %(default)s)')
+    parser.add_argument('--max-fliers', type=int, default=DEFAULT_MAX_FLIERS,
+                        help='outliers drawn per segment in sketch mode, 0 for none (default: %(default)s)')
+    args = parser.parse_args(argv)
+    if args.rows is not None and args.rows < 1:
+        parser.error('--rows needs at least 1 row')
+    if args.max_fliers < 0:
+        parser.error('--max-fliers must be 0 or more')
+    if args.input:
+        args.boxplot = 'sketch'
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 60)
+    print("Customer Analytics: Purchase Amount Distribution")
+    print("Author: 24f2000604@ds.study.iitm.ac.in")
+    print("=" * 60)
+
+    if args.output:
+        sizes = segment_sizes(args.rows)
+        path = write_purchases(args.output, sizes, args.chunksize, args.seed)
+        print(f"\nSynthetic data saved: {path} ({sizes.sum():,} customer transactions)")
+        return
+
+    # =============================================================================
+    # Step 1: Generate Realistic Synthetic Data
+    # =============================================================================
+    # Email: 24f2000604@ds.study.iitm.ac.in
+
+    segment_order = SEGMENT_ORDER
+    segment_stats = None
+    if args.boxplot == 'sketch':
+        # Streaming mode: the purchases are never held in memory as a whole
+        if args.input:
+            chunks = iter_purchase_file(args.input, args.chunksize)
+        elif args.rows is None:
+            chunks = [generate_purchases(seed=args.seed)]
+        else:
+            chunks = iter_purchase_chunks(segment_sizes(args.rows), args.chunksize, args.seed)
+        segment_stats = stream_segment_stats(chunks, args.sketch_error, args.max_fliers)
+        segment_order = [segment for segment in SEGMENT_ORDER if segment_stats[segment].count]
+        description = pd.DataFrame([segment_stats[segment].describe() for segment in segment_order],
+                                   index=pd.Index(segment_order, name='Customer_Segment'))
+        total = int(description['count'].sum())
+        print(f"\nDataset streamed: {total:,} customer transactions "
+              f"(quantiles within {args.sketch_error:.1%} rank error)")
+        print(f"\nSegment distribution:")
+        print(description['count'].astype(int).rename('count'))
+        print(f"\nPurchase Amount Statistics by Segment:")
+        print(description.round(2))
+    else:
+        if args.rows is None:
+            df = generate_purchases(seed=args.seed)
+        else:
+            df = pd.concat(iter_purchase_chunks(segment_sizes(args.rows), args.chunksize, args.seed),
+                           ignore_index=True)
+
+        print(f"\nDataset generated: {len(df)} customer transactions")
+        print(f"\nSegment distribution:")
+        print(df['Customer_Segment'].value_counts().sort_index())
+        print(f"\nPurchase Amount Statistics by Segment:")
+        print(df.groupby('Customer_Segment')['Purchase_Amount'].describe().round(2))
+
+    # =============================================================================
+    # Step 2: Create Professional Seaborn Boxplot
+    # =============================================================================
+    # Contact: 24f2000604@ds.study.iitm.ac.in
+
+    # Set professional style
+    sns.set_style("whitegrid")
+    sns.set_context("talk", font_scale=0.9)
+
+    # Create figure with exact size for 512x512 output
+    fig, ax = plt.subplots(figsize=(8, 8))
+
+    colors = [COLORS[SEGMENT_ORDER.index(segment)] for segment in segment_order]
+
+    # Create boxplot
+    if segment_stats is not None:
+        draw_box_stats(ax, [segment_stats[segment].box_stats(segment) for segment in segment_order], colors)
+    else:
+        sns.boxplot(
+            data=df,
+            x='Customer_Segment',
+            y='Purchase_Amount',
+            hue='Customer_Segment',
+            palette=colors,
+            order=segment_order,
+            width=0.6,
+            linewidth=2,
+            fliersize=5,
+            legend=False,
+            ax=ax
+        )
+
+    # Styling
+    ax.set_title('Purchase Amount Distribution\nby Customer Segment', 
+                 fontsize=16, fontweight='bold', pad=20)
+    ax.set_xlabel('Customer Segment', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Purchase Amount ($)', fontsize=14, fontweight='bold')
+
+    # Add grid for readability
+    ax.yaxis.grid(True, linestyle='--', alpha=0.7)
+    ax.set_axisbelow(True)
+
+    # Format y-axis as currency
+    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+
+    # Add median labels on boxes
+    if segment_stats is not None:
+        medians = description['50%']
+    else:
+        medians = df.groupby('Customer_Segment')['Purchase_Amount'].median()
+    for i, segment in enumerate(segment_order):
+        median_val = medians[segment]
+        ax.annotate(f'${median_val:.0f}', 
+                    xy=(i, median_val), 
+                    xytext=(0, 10),
+                    textcoords='offset points',
+                    ha='center', va='bottom',
+                    fontsize=10, fontweight='bold',
+                    color='white',
+                    bbox=dict(boxstyle='round,pad=0.3', facecolor=colors[i], alpha=0.8))
+
+    # Add author email
+    plt.figtext(0.5, 0.02, '24f2000604@ds.study.iitm.ac.in', 
+                ha='center', fontsize=9, style='italic', color='gray')
+
+    plt.tight_layout()
+
+    # =============================================================================
+    # Step 3: Save Chart as 512x512 PNG
+    # =============================================================================
+    # Author email: 24f2000604@ds.study.iitm.ac.in
+
+    # Save with dpi=64 for 512x512 (8*64=512)
+    plt.savefig('chart.png', dpi=64, bbox_inches='tight', 
+                facecolor='white', edgecolor='none')
+    print(f"\nChart saved: chart.png (512x512 pixels)")
+
+    plt.close()
+
+    # =============================================================================
+    # Step 4: Summary
+    # =============================================================================
+    # Email: 24f2000604@ds.study.iitm.ac.in
+
+    print(f"\n{'=' * 60}")
+    print("ANALYSIS COMPLETE")
+    print(f"{'=' * 60}")
+    print(f"\nFiles generated:")
+    print(f"  ✅ chart.png (512x512 Seaborn boxplot)")
+    print(f"\nKey Insights:")
+    for segment in segment_order:
+        median = medians[segment]
+        print(f"  • {segment}: Median purchase ${median:.2f}")
+
+    print(f"\nAuthor: 24f2000604@ds.study.iitm.ac.in")
+
 
-print(f"\n{'=' * 60}")
-print("ANALYSIS COMPLETE")
-print(f"{'=' * 60}")
-print(f"\nFiles generated:")
-print(f"  ✅ chart.png (512x512 Seaborn boxplot)")
-print(f"\nKey Insights:")
-for segment in segment_order:
-    median = medians[segment]
-    print(f"  • {segment}: Median purchase ${median:.2f}")
-
-print(f"\nAuthor: 24f2000604@ds.study.iitm.ac.in")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from employee_analysis import csv_data, stream_employee_summary, summarize_employees
+
+
+@pytest.fixture
+def sample_with_nans():
+    df = pd.read_csv(StringIO(csv_data))
+    rng = np.random.default_rng(0)
+    for column in ('performance_score', 'years_experience'):
+        df.loc[rng.random(len(df)) < 0.2, column] = np.nan
+    return df
+
+
+def assert_matches_groupby(summary, df):
+    performance = df.groupby('department')['performance_score'].mean()
+    experience = df.groupby('region')['years_experience'].mean()
+    np.testing.assert_allclose(summary.departments['avg_performance'][performance.index], performance)
+    np.testing.assert_allclose(summary.regions['avg_experience'][experience.index], experience)
+    assert summary.avg_performance == pytest.approx(df['performance_score'].mean())
+    assert summary.top_department == performance.idxmax()
+    assert summary.most_experienced_region == experience.idxmax()
+    assert summary.departments['count'].sum() == len(df)
+
+
+def test_summary_means_skip_missing_values(sample_with_nans):
+    assert_matches_groupby(summarize_employees(sample_with_nans), sample_with_nans)
+
+
+def test_streamed_summary_means_skip_missing_values(sample_with_nans, tmp_path):
+    path = tmp_path / 'employees.csv'
+    sample_with_nans.to_csv(path, index=False)
+    summary, _ = stream_employee_summary([str(path)], chunksize=17)
+    assert_matches_groupby(summary, sample_with_nans)